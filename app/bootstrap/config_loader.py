@@ -34,6 +34,7 @@ class AppConfig:
     idle_check_interval_seconds: int
     idle_check_interval_active_seconds: int
     idle_check_interval_off_seconds: int
+    idle_check_interval_max_seconds: int
     mc_query_interval_seconds: int
     metrics_collect_interval_seconds: int
     metrics_collect_interval_off_seconds: int
@@ -55,6 +56,7 @@ class AppConfig:
     crash_stop_grace_seconds: int
     backup_watch_interval_active_seconds: int
     backup_watch_interval_off_seconds: int
+    backup_watch_interval_max_seconds: int
     backup_warning_ttl_seconds: float
     low_storage_available_threshold_percent: float
     storage_safety_check_interval_active_seconds: int
@@ -78,6 +80,7 @@ class AppConfig:
     secret_key_value: str
     debug_app_host: str
     debug_app_port: int
+    backup_download_accel_prefix: str = ""
 
 
 def _cfg_bool(web_cfg: WebConfig, name: str, default: str = "false") -> bool:
@@ -100,7 +103,17 @@ def load_web_config(app_dir: Path, *, default_backup_dir: Path, default_minecraf
         idle_check_interval_seconds,
         minimum=1,
     )
+    idle_check_interval_off_seconds = web_cfg.get_int(
+        "IDLE_CHECK_INTERVAL_OFF_SECONDS",
+        max(idle_check_interval_active_seconds, 15),
+        minimum=1,
+    )
     backup_watch_interval_active_seconds = web_cfg.get_int("BACKUP_WATCH_INTERVAL_ACTIVE_SECONDS", 15, minimum=1)
+    backup_watch_interval_off_seconds = web_cfg.get_int(
+        "BACKUP_WATCH_INTERVAL_OFF_SECONDS",
+        max(backup_watch_interval_active_seconds, 45),
+        minimum=1,
+    )
 
     return AppConfig(
         web_conf_path=web_conf_path,
@@ -127,10 +140,11 @@ def load_web_config(app_dir: Path, *, default_backup_dir: Path, default_minecraf
         idle_zero_players_seconds=web_cfg.get_int("IDLE_ZERO_PLAYERS_SECONDS", 180, minimum=10),
         idle_check_interval_seconds=idle_check_interval_seconds,
         idle_check_interval_active_seconds=idle_check_interval_active_seconds,
-        idle_check_interval_off_seconds=web_cfg.get_int(
-            "IDLE_CHECK_INTERVAL_OFF_SECONDS",
-            max(idle_check_interval_active_seconds, 15),
-            minimum=1,
+        idle_check_interval_off_seconds=idle_check_interval_off_seconds,
+        idle_check_interval_max_seconds=web_cfg.get_int(
+            "IDLE_CHECK_INTERVAL_MAX_SECONDS",
+            idle_check_interval_off_seconds * 4,
+            minimum=idle_check_interval_off_seconds,
         ),
         mc_query_interval_seconds=web_cfg.get_int("MC_QUERY_INTERVAL_SECONDS", 3, minimum=1),
         metrics_collect_interval_seconds=metrics_collect_interval_seconds,
@@ -160,10 +174,11 @@ def load_web_config(app_dir: Path, *, default_backup_dir: Path, default_minecraf
         file_page_heartbeat_interval_ms=web_cfg.get_int("FILE_PAGE_HEARTBEAT_INTERVAL_MS", 10000, minimum=1000),
         crash_stop_grace_seconds=web_cfg.get_int("CRASH_STOP_GRACE_SECONDS", 15, minimum=1),
         backup_watch_interval_active_seconds=backup_watch_interval_active_seconds,
-        backup_watch_interval_off_seconds=web_cfg.get_int(
-            "BACKUP_WATCH_INTERVAL_OFF_SECONDS",
-            max(backup_watch_interval_active_seconds, 45),
-            minimum=1,
+        backup_watch_interval_off_seconds=backup_watch_interval_off_seconds,
+        backup_watch_interval_max_seconds=web_cfg.get_int(
+            "BACKUP_WATCH_INTERVAL_MAX_SECONDS",
+            backup_watch_interval_off_seconds * 4,
+            minimum=backup_watch_interval_off_seconds,
         ),
         backup_warning_ttl_seconds=web_cfg.get_float("BACKUP_WARNING_TTL_SECONDS", 120.0, minimum=1.0),
         low_storage_available_threshold_percent=web_cfg.get_float(
@@ -200,4 +215,5 @@ def load_web_config(app_dir: Path, *, default_backup_dir: Path, default_minecraf
         secret_key_value=web_cfg.get_str("MCWEB_SECRET_KEY", ""),
         debug_app_host=web_cfg.get_str("DEBUG_APP_HOST", "127.0.0.1"),
         debug_app_port=web_cfg.get_int("DEBUG_APP_PORT", 8765, minimum=1),
+        backup_download_accel_prefix=web_cfg.get_str("BACKUP_DOWNLOAD_ACCEL_PREFIX", "").strip(),
     )
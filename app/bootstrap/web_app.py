@@ -36,6 +36,7 @@ from app.services import status_cache as status_cache_service
 from app.services import worker_runtime as worker_runtime_service
 from app.services import system_bindings as system_bindings_service
 from app.services import world_bindings as world_bindings_service
+from app.services.worker_scheduler import start_detached
 from app.state import REQUIRED_STATE_KEY_SET
 
 _bootstrap = web_app_config.load_bootstrap_config()
@@ -70,8 +71,13 @@ SESSION_FILE = STATE_VARS["SESSION_FILE"]
 SERVER_PROPERTIES_CANDIDATES = STATE_VARS["SERVER_PROPERTIES_CANDIDATES"]
 backup_state = STATE_VARS["backup_state"]
 
-log_mcweb_action = make_log_action(DISPLAY_TZ, MCWEB_LOG_DIR, MCWEB_ACTION_LOG_FILE)
-log_mcweb_log = make_log_action(DISPLAY_TZ, MCWEB_LOG_DIR, MCWEB_LOG_FILE)
+
+def _start_log_writer(target: Any) -> Any:
+    return start_detached(target=target, daemon=True)
+
+
+log_mcweb_action = make_log_action(DISPLAY_TZ, MCWEB_LOG_DIR, MCWEB_ACTION_LOG_FILE, start_writer=_start_log_writer)
+log_mcweb_log = make_log_action(DISPLAY_TZ, MCWEB_LOG_DIR, MCWEB_LOG_FILE, start_writer=_start_log_writer)
 log_mcweb_exception = make_log_exception(log_mcweb_log)
 
 _runtime_namespace = {
@@ -11,6 +11,8 @@ from app.core.config import apply_default_flask_config, resolve_secret_key
 from app.ports import ports
 from app.services import setup_service
 
+_APP_DIR = Path(__file__).resolve().parent.parent.parent
+
 
 @dataclass(frozen=True)
 class WebAppBootstrapConfig:
@@ -23,7 +25,7 @@ class WebAppBootstrapConfig:
 
 
 def load_bootstrap_config() -> WebAppBootstrapConfig:
-    app_dir = Path(__file__).resolve().parent.parent.parent
+    app_dir = _APP_DIR
     app_config = load_web_config(
         app_dir,
         default_backup_dir=Path(ports.service_control.default_backup_dir()),
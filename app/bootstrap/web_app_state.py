@@ -56,14 +56,16 @@ def build_state(app_config: Any, *, app_dir: Path, display_tz: tzinfo) -> dict[s
     idle_check_interval_seconds = app_config.idle_check_interval_seconds
     idle_check_interval_active_seconds = app_config.idle_check_interval_active_seconds
     idle_check_interval_off_seconds = app_config.idle_check_interval_off_seconds
+    idle_check_interval_max_seconds = app_config.idle_check_interval_max_seconds
 
-    idle_zero_players_since = None
+    idle_deadline_monotonic = None
     idle_lock = threading.Lock()
     backup_state = BackupState(
         lock=threading.Lock(),
         run_lock=threading.Lock(),
         periodic_runs=0,
         last_error="",
+        error_lock=threading.Lock(),
     )
     session_state = SessionState(
         session_file=session_file,
@@ -82,6 +84,8 @@ def build_state(app_config: Any, *, app_dir: Path, display_tz: tzinfo) -> dict[s
     mc_last_query_at = 0.0
     mc_cached_players_online = "unknown"
     mc_cached_tick_rate = "unknown"
+    # (monotonic probed_at, players, tick_rate); swapped as one tuple so cache hits need no lock.
+    mc_probe_cache = (0.0, "unknown", "unknown")
     rcon_startup_ready = False
     rcon_startup_lock = threading.Lock()
     rcon_startup_ready_pattern = re.compile(
@@ -89,10 +93,8 @@ def build_state(app_config: Any, *, app_dir: Path, display_tz: tzinfo) -> dict[s
         re.IGNORECASE,
     )
     rcon_config_lock = threading.Lock()
-    rcon_cached_password = None
-    rcon_cached_port = rcon_port
-    rcon_cached_enabled = False
-    rcon_last_config_read_at = 0.0
+    # (read_at, password, port, enabled); swapped as one tuple so cache hits need no lock.
+    rcon_config_cache: tuple[float, str | None, int | None, bool] = (0.0, None, rcon_port, False)
 
     metrics_collect_interval_seconds = app_config.metrics_collect_interval_seconds
     metrics_collect_interval_off_seconds = app_config.metrics_collect_interval_off_seconds
@@ -111,9 +113,11 @@ def build_state(app_config: Any, *, app_dir: Path, display_tz: tzinfo) -> dict[s
     file_page_cache_refresh_seconds = app_config.file_page_cache_refresh_seconds
     file_page_active_ttl_seconds = app_config.file_page_active_ttl_seconds
     file_page_heartbeat_interval_ms = app_config.file_page_heartbeat_interval_ms
+    backup_download_accel_prefix = app_config.backup_download_accel_prefix
     crash_stop_grace_seconds = app_config.crash_stop_grace_seconds
     backup_watch_interval_active_seconds = app_config.backup_watch_interval_active_seconds
     backup_watch_interval_off_seconds = app_config.backup_watch_interval_off_seconds
+    backup_watch_interval_max_seconds = app_config.backup_watch_interval_max_seconds
     backup_warning_ttl_seconds = app_config.backup_warning_ttl_seconds
     low_storage_available_threshold_percent = app_config.low_storage_available_threshold_percent
     storage_safety_check_interval_active_seconds = app_config.storage_safety_check_interval_active_seconds
@@ -140,16 +144,21 @@ def build_state(app_config: Any, *, app_dir: Path, display_tz: tzinfo) -> dict[s
     debug_app_host = app_config.debug_app_host
     debug_app_port = app_config.debug_app_port
 
-    metrics_collector_started = False
+    metrics_collector_started_event = threading.Event()
+    metrics_collecting_inflight = False
     metrics_collector_start_lock = threading.Lock()
     metrics_cache_cond = threading.Condition()
     metrics_cache_seq = 0
     metrics_cache_payload: dict[str, Any] = {}
+    metrics_cache_payload_json = b""
+    metrics_cache_etag = ""
     metrics_stream_client_count = 0
     home_page_last_seen = 0.0
     service_status_cache_lock = threading.Lock()
     service_status_cache_value_ref = [""]
     service_status_cache_at_ref = [0.0]
+    service_status_changed_cond = threading.Condition()
+    service_status_generation_ref = [0]
     slow_metrics_lock = threading.Lock()
     slow_metrics_cache: dict[str, Any] = {}
     slow_metrics_cache_status = ""
@@ -205,14 +214,16 @@ def build_state(app_config: Any, *, app_dir: Path, display_tz: tzinfo) -> dict[s
         source: {
             "cond": threading.Condition(),
             "seq": 0,
-            "events": deque(maxlen=log_stream_event_buffer_size),
+            # Parallel rings: batch sequence ids and their payloads.
+            "event_seqs": deque(maxlen=log_stream_event_buffer_size),
+            "event_frames": deque(maxlen=log_stream_event_buffer_size),
             "buffered_lines": deque(maxlen=log_stream_event_buffer_size),
             "pending_lines": [],
             "pending_bytes": 0,
             "batch_started_at": 0.0,
             "file_offset": 0,
             "follow_initialized": False,
-            "started": False,
+            "started_event": threading.Event(),
             "lifecycle_lock": threading.Lock(),
             "clients": 0,
             "proc": None,
@@ -262,7 +273,8 @@ def build_state(app_config: Any, *, app_dir: Path, display_tz: tzinfo) -> dict[s
         "IDLE_CHECK_INTERVAL_SECONDS": idle_check_interval_seconds,
         "IDLE_CHECK_INTERVAL_ACTIVE_SECONDS": idle_check_interval_active_seconds,
         "IDLE_CHECK_INTERVAL_OFF_SECONDS": idle_check_interval_off_seconds,
-        "idle_zero_players_since": idle_zero_players_since,
+        "IDLE_CHECK_INTERVAL_MAX_SECONDS": idle_check_interval_max_seconds,
+        "idle_deadline_monotonic": idle_deadline_monotonic,
         "idle_lock": idle_lock,
         "backup_state": backup_state,
         "session_state": session_state,
@@ -276,14 +288,12 @@ def build_state(app_config: Any, *, app_dir: Path, display_tz: tzinfo) -> dict[s
         "mc_last_query_at": mc_last_query_at,
         "mc_cached_players_online": mc_cached_players_online,
         "mc_cached_tick_rate": mc_cached_tick_rate,
+        "mc_probe_cache": mc_probe_cache,
         "rcon_startup_ready": rcon_startup_ready,
         "rcon_startup_lock": rcon_startup_lock,
         "RCON_STARTUP_READY_PATTERN": rcon_startup_ready_pattern,
         "rcon_config_lock": rcon_config_lock,
-        "rcon_cached_password": rcon_cached_password,
-        "rcon_cached_port": rcon_cached_port,
-        "rcon_cached_enabled": rcon_cached_enabled,
-        "rcon_last_config_read_at": rcon_last_config_read_at,
+        "rcon_config_cache": rcon_config_cache,
         "METRICS_COLLECT_INTERVAL_SECONDS": metrics_collect_interval_seconds,
         "METRICS_COLLECT_INTERVAL_OFF_SECONDS": metrics_collect_interval_off_seconds,
         "METRICS_IDLE_STORAGE_REFRESH_SECONDS": metrics_idle_storage_refresh_seconds,
@@ -301,9 +311,11 @@ def build_state(app_config: Any, *, app_dir: Path, display_tz: tzinfo) -> dict[s
         "FILE_PAGE_CACHE_REFRESH_SECONDS": file_page_cache_refresh_seconds,
         "FILE_PAGE_ACTIVE_TTL_SECONDS": file_page_active_ttl_seconds,
         "FILE_PAGE_HEARTBEAT_INTERVAL_MS": file_page_heartbeat_interval_ms,
+        "BACKUP_DOWNLOAD_ACCEL_PREFIX": backup_download_accel_prefix,
         "CRASH_STOP_GRACE_SECONDS": crash_stop_grace_seconds,
         "BACKUP_WATCH_INTERVAL_ACTIVE_SECONDS": backup_watch_interval_active_seconds,
         "BACKUP_WATCH_INTERVAL_OFF_SECONDS": backup_watch_interval_off_seconds,
+        "BACKUP_WATCH_INTERVAL_MAX_SECONDS": backup_watch_interval_max_seconds,
         "BACKUP_WARNING_TTL_SECONDS": backup_warning_ttl_seconds,
         "LOW_STORAGE_AVAILABLE_THRESHOLD_PERCENT": low_storage_available_threshold_percent,
         "STORAGE_SAFETY_CHECK_INTERVAL_ACTIVE_SECONDS": storage_safety_check_interval_active_seconds,
@@ -326,16 +338,21 @@ def build_state(app_config: Any, *, app_dir: Path, display_tz: tzinfo) -> dict[s
         "PROCESS_ROLE": process_role,
         "DEBUG_APP_HOST": debug_app_host,
         "DEBUG_APP_PORT": debug_app_port,
-        "metrics_collector_started": metrics_collector_started,
+        "metrics_collector_started_event": metrics_collector_started_event,
+        "metrics_collecting_inflight": metrics_collecting_inflight,
         "metrics_collector_start_lock": metrics_collector_start_lock,
         "metrics_cache_cond": metrics_cache_cond,
         "metrics_cache_seq": metrics_cache_seq,
         "metrics_cache_payload": metrics_cache_payload,
+        "metrics_cache_payload_json": metrics_cache_payload_json,
+        "metrics_cache_etag": metrics_cache_etag,
         "metrics_stream_client_count": metrics_stream_client_count,
         "home_page_last_seen": home_page_last_seen,
         "service_status_cache_lock": service_status_cache_lock,
         "service_status_cache_value_ref": service_status_cache_value_ref,
         "service_status_cache_at_ref": service_status_cache_at_ref,
+        "service_status_changed_cond": service_status_changed_cond,
+        "service_status_generation_ref": service_status_generation_ref,
         "slow_metrics_lock": slow_metrics_lock,
         "slow_metrics_cache": slow_metrics_cache,
         "slow_metrics_cache_status": slow_metrics_cache_status,
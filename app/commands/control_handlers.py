@@ -411,7 +411,7 @@ def backup_operation(ctx: Any, *, idempotency_key: str, client_key: str) -> Any:
         if not ok:
             detail = ""
             backup_state = state["backup_state"]
-            with backup_state.lock:
+            with backup_state.error_lock:
                 detail = backup_state.last_error
             message = "Backup failed."
             if detail:
@@ -776,10 +776,11 @@ def rcon_command(ctx: Any, *, client_key: str, command: str, sudo_password: str)
         return _response_result(state["_rcon_rejected_response"]("RCON command failed to execute.", 500))
 
     if result.returncode != 0:
-        detail = ((result.stderr or "") + "\n" + (result.stdout or "")).strip()
+        # Truncate each stream before joining so noisy RCON output is never copied whole.
+        detail = ((result.stderr or "")[:400] + "\n" + (result.stdout or "")[:400]).strip()[:400]
         message = "RCON command failed."
         if detail:
-            message = f"RCON command failed: {detail[:400]}"
+            message = f"RCON command failed: {detail}"
         state["log_mcweb_action"]("submit", command=command, rejection_message=message)
         return _response_result(state["_rcon_rejected_response"](message, 500))
 
@@ -1,18 +1,31 @@
 """Action/error logging helpers with request-aware client identification."""
+import atexit
 from datetime import datetime
 import os
 from pathlib import Path
+import queue
+import threading
+import time
 import traceback
 from typing import Any, Callable
 from flask import request, has_request_context
 
 LOG_ROTATE_MAX_BYTES = 5 * 1024 * 1024
 LOG_ROTATE_BACKUP_COUNT = 5
+LOG_EXCEPTION_REPEAT_WINDOW_SECONDS = 30.0
+# Lines waiting for the background writer. Once full, callers wait up to
+# LOG_WRITER_QUEUE_FULL_WAIT_SECONDS and then drop the line; the writer logs
+# how many were dropped.
+LOG_WRITER_QUEUE_MAX_LINES = 10000
+LOG_WRITER_QUEUE_FULL_WAIT_SECONDS = 1.0
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
 
 
 def sanitize_log_fragment(text: object) -> str:
     """Normalize user/system text into a single safe log line fragment."""
-    return " ".join(str(text or "").replace("\r", " ").replace("\n", " ").split()).strip()
+    # str.split() already breaks on \r, \n, \t and other whitespace, so one
+    # split/join both flattens and collapses the text.
+    return " ".join(str(text or "").split())
 
 
 def get_client_ip() -> str:
@@ -56,11 +69,128 @@ def _rotate_log_file(
         pass
 
 
-def make_log_action(display_tz: Any, log_dir: Path, action_log_file: Path) -> Callable[..., None]:
-    """Build and return the structured action logger closure."""
+def _append_log_text(log_dir: Path, path: Path, text: str) -> None:
+    """Append pre-joined log lines; failures are intentionally swallowed."""
+    try:
+        _rotate_log_file(path)
+        try:
+            # backslashreplace keeps lone surrogates (e.g. from surrogate-escaped
+            # filenames) from raising UnicodeEncodeError mid-write.
+            handle = path.open("a", encoding="utf-8", errors="backslashreplace")
+        except FileNotFoundError:
+            # The log dir is created once at build time; recreate it only if
+            # something removed it since.
+            log_dir.mkdir(parents=True, exist_ok=True)
+            handle = path.open("a", encoding="utf-8", errors="backslashreplace")
+        with handle:
+            handle.write(text)
+    except OSError:
+        # Logging must not break control endpoints.
+        pass
+
+
+def make_log_action(
+    display_tz: Any,
+    log_dir: Path,
+    action_log_file: Path,
+    start_writer: Callable[[Callable[[], None]], Any] | None = None,
+) -> Callable[..., None]:
+    """Build and return the structured action logger closure.
+
+    With ``start_writer`` the file append moves off the caller's thread:
+    lines are queued and a single writer started through ``start_writer``
+    drains them, joining whatever is queued into one write.
+    """
+    try:
+        log_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        pass
+    # Lines logged within the same second share one formatted timestamp.
+    last_stamp: list[tuple[int, str]] = [(-1, "")]
+
+    def _timestamp() -> str:
+        second = int(time.time())
+        cached_second, cached_text = last_stamp[0]
+        if cached_second == second:
+            return cached_text
+        now = datetime.fromtimestamp(second, tz=display_tz)
+        text = f"{_MONTHS[now.month - 1]} {now.day:02d} {now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+        last_stamp[0] = (second, text)
+        return text
+
+    pending: queue.Queue[str] = queue.Queue(maxsize=LOG_WRITER_QUEUE_MAX_LINES)
+    writer_lock = threading.Lock()
+    writer_pid = [0]
+    exit_drain_registered = [False]
+    dropped_lines = [0]
+    # Serializes every append (and so every rotation) to this file, so batches
+    # from the writer and the exit drain never interleave.
+    append_lock = threading.Lock()
+
+    def _append(text: str) -> None:
+        with append_lock:
+            _append_log_text(log_dir, action_log_file, text)
+
+    def _take_dropped_note() -> str:
+        with writer_lock:
+            dropped, dropped_lines[0] = dropped_lines[0], 0
+        if not dropped:
+            return ""
+        return f"{_timestamp()} <mcweb> [mcweb/log] rejected: dropped {dropped} log lines while the writer was behind\n"
+
+    def _take_queued(first: str) -> str:
+        batch = [first]
+        try:
+            while True:
+                batch.append(pending.get_nowait())
+        except queue.Empty:
+            pass
+        return "".join(batch)
+
+    def _drain_forever() -> None:
+        try:
+            while True:
+                text = _take_queued(pending.get())
+                try:
+                    _append(text + _take_dropped_note())
+                except Exception:
+                    # One bad batch must not stop logging for the whole process.
+                    pass
+        finally:
+            # Let the next log call start a fresh writer if this one ever exits.
+            writer_pid[0] = 0
+
+    def _drain_at_exit() -> None:
+        try:
+            text = _take_queued(pending.get_nowait())
+        except queue.Empty:
+            text = ""
+        text += _take_dropped_note()
+        if text:
+            _append(text)
+
+    def _ensure_writer() -> bool:
+        # Keyed by pid so a forked worker process starts its own writer.
+        if start_writer is None:
+            return False
+        pid = os.getpid()
+        if writer_pid[0] == pid:
+            return True
+        with writer_lock:
+            if writer_pid[0] != pid:
+                try:
+                    start_writer(_drain_forever)
+                except Exception:
+                    return False
+                if not exit_drain_registered[0]:
+                    atexit.register(_drain_at_exit)
+                    exit_drain_registered[0] = True
+                writer_pid[0] = pid
+        return True
+
     def log_action(action: object, command: object = None, rejection_message: object = None) -> None:
         """Append one action event line; failures are intentionally swallowed."""
-        timestamp = datetime.now(tz=display_tz).strftime("%b %d %H:%M:%S")
+        timestamp = _timestamp()
         client_ip = sanitize_log_fragment(get_client_ip()) or "unknown"
         safe_action = sanitize_log_fragment(action) or "unknown"
         parts = [f"{timestamp} <{client_ip}> [mcweb/{safe_action}]"]
@@ -75,24 +205,88 @@ def make_log_action(display_tz: Any, log_dir: Path, action_log_file: Path) -> Ca
         line = " ".join(parts).strip()
         if not line:
             return
-        try:
-            log_dir.mkdir(parents=True, exist_ok=True)
-            _rotate_log_file(action_log_file)
-            with action_log_file.open("a", encoding="utf-8") as f:
-                f.write(line + "\n")
-        except OSError:
-            # Logging must not break control endpoints.
-            pass
+        if _ensure_writer():
+            try:
+                pending.put(line + "\n", timeout=LOG_WRITER_QUEUE_FULL_WAIT_SECONDS)
+            except queue.Full:
+                # Writing through here would reorder lines against the writer's batch.
+                with writer_lock:
+                    dropped_lines[0] += 1
+            return
+        _append(line + "\n")
 
     return log_action
 
 
-def make_log_exception(log_action: Callable[..., None]) -> Callable[[object, BaseException | None], None]:
-    """Build and return an exception logger that emits through log_action."""
+def make_log_exception(
+    log_action: Callable[..., None],
+    repeat_window_seconds: float = LOG_EXCEPTION_REPEAT_WINDOW_SECONDS,
+) -> Callable[[object, BaseException | None], None]:
+    """Build and return an exception logger that emits through log_action.
+
+    Repeats of the same failure within ``repeat_window_seconds`` are counted
+    rather than written, and each window that suppressed anything ends with
+    one "suppressed N repeats" line.
+    """
+    # key -> [window started at, repeats suppressed in that window]
+    windows: dict[tuple[str, str, str], list[Any]] = {}
+    windows_lock = threading.Lock()
+    last_sweep_at = [0.0]
+
+    def _log_suppressed(key: tuple[str, str, str], count: int) -> None:
+        context, exc_name, raw_text = key
+        plural = "repeat" if count == 1 else "repeats"
+        message = f"{context}: {exc_name}"
+        exc_text = sanitize_log_fragment(raw_text)
+        if exc_text:
+            message += f": {exc_text[:200]}"
+        log_action("error", rejection_message=f"{message} (suppressed {count} {plural})")
+
+    def _expire_windows(now: float) -> list[tuple[tuple[str, str, str], int]]:
+        # Caller holds windows_lock. Closes finished windows, and the oldest
+        # ones too if the table grows past its bound.
+        expired = {key for key, (started_at, _count) in windows.items() if now - started_at >= repeat_window_seconds}
+        if len(windows) - len(expired) > 256:
+            live = sorted((key for key in windows if key not in expired), key=lambda key: windows[key][0])
+            expired.update(live[: len(live) - 256])
+        closed = []
+        for key in expired:
+            _started_at, count = windows.pop(key)
+            if count:
+                closed.append((key, count))
+        return closed
+
+    def _should_log(key: tuple[str, str, str]) -> bool:
+        # Background loops can fail on every tick; bail out before any
+        # traceback formatting when the same failure was just written.
+        if repeat_window_seconds <= 0:
+            return True
+        now = time.monotonic()
+        closed: list[tuple[tuple[str, str, str], int]] = []
+        with windows_lock:
+            if now - last_sweep_at[0] >= repeat_window_seconds or len(windows) > 256:
+                last_sweep_at[0] = now
+                closed = _expire_windows(now)
+            window = windows.get(key)
+            if window is not None and now - window[0] < repeat_window_seconds:
+                window[1] += 1
+                should_log = False
+            else:
+                if window is not None and window[1]:
+                    closed.append((key, window[1]))
+                windows[key] = [now, 0]
+                should_log = True
+        for closed_key, count in closed:
+            _log_suppressed(closed_key, count)
+        return should_log
+
     def log_exception(context: object, exc: BaseException | None) -> None:
         """Log a compact exception summary with a truncated traceback."""
         exc_name = type(exc).__name__ if exc is not None else "Exception"
-        exc_text = sanitize_log_fragment(str(exc) if exc is not None else "")
+        raw_text = str(exc) if exc is not None else ""
+        if not _should_log((str(context), exc_name, raw_text)):
+            return
+        exc_text = sanitize_log_fragment(raw_text)
         tb = ""
         if exc is not None:
             tb = sanitize_log_fragment(" | ".join(traceback.format_exception(type(exc), exc, exc.__traceback__)))
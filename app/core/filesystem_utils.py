@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 from datetime import datetime, tzinfo
+import os
 from pathlib import Path
+import threading
 from typing import Any
 
+from app.core.ring_buffer import Ring
+
 
 def format_file_size(num_bytes: int | float | None) -> str:
     """Format bytes into a human-readable string (B/KB/MB/GB/TB)."""
@@ -46,16 +50,60 @@ def list_download_files(base_dir: Path, pattern: str, display_tz: tzinfo | None)
     return items
 
 
+# Per (path, limit) tail position so repeat reads of an append-only log only
+# read the bytes written since the previous call.
+_TAIL_SIGNATURE_BYTES = 64
+_file_tail_lock = threading.Lock()
+_file_tail_state: dict[tuple[str, int], dict[str, Any]] = {}
+
+
+def _decode_log_line(raw: bytes) -> str:
+    return raw.rstrip(b"\r").decode("utf-8", "ignore")
+
+
+def _new_tail_state(inode: int, limit: int) -> dict[str, Any]:
+    return {"inode": inode, "pos": 0, "signature": b"", "partial": b"", "ring": Ring(limit)}
+
+
 def read_recent_file_lines(path: Path, limit: int) -> list[str]:
     """Read and return the last ``limit`` lines from a text file."""
+    if limit <= 0:
+        return []
+    key = (str(path), int(limit))
     try:
-        text = path.read_text(encoding="utf-8", errors="ignore")
+        with path.open("rb") as handle, _file_tail_lock:
+            stat = os.fstat(handle.fileno())
+            state = _file_tail_state.get(key)
+            if state is None or state["inode"] != stat.st_ino or stat.st_size < state["pos"]:
+                state = _new_tail_state(stat.st_ino, limit)
+            data = b""
+            if stat.st_size > state["pos"] or state["pos"] == 0:
+                signature = state["signature"]
+                handle.seek(state["pos"] - len(signature))
+                data = handle.read()
+                if not data.startswith(signature):
+                    # Rewritten in place (same inode, not shorter): start over.
+                    state = _new_tail_state(stat.st_ino, limit)
+                    handle.seek(0)
+                    data = handle.read()
+                else:
+                    data = data[len(signature):]
+            if data:
+                state["pos"] += len(data)
+                chunks = (state["partial"] + data).split(b"\n")
+                state["partial"] = chunks.pop()
+                state["ring"].extend(_decode_log_line(chunk) for chunk in chunks)
+                handle.seek(max(0, state["pos"] - _TAIL_SIGNATURE_BYTES))
+                state["signature"] = handle.read(state["pos"] - handle.tell())
+            _file_tail_state[key] = state
+            lines = state["ring"].tail()
+            partial = state["partial"]
     except OSError:
         return []
-    lines = text.splitlines()
-    if len(lines) > limit:
-        lines = lines[-limit:]
-    return lines
+    if partial:
+        lines.append(_decode_log_line(partial))
+        del lines[:-limit]
+    return lines
 
 
 def safe_file_mtime_ns(path: Path) -> int | None:
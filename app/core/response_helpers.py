@@ -1,7 +1,31 @@
 """Shared Flask response helpers for ajax/non-ajax flows."""
+import json
 from typing import Any
 
-from flask import jsonify, redirect
+from flask import Response, jsonify, redirect
+
+
+def _encode_body(payload: dict[str, Any]) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+# Fixed rejection bodies are encoded once at import instead of per response.
+_OK_BODY = _encode_body({"ok": True})
+_PASSWORD_REJECTED_BODY = _encode_body({
+    "ok": False,
+    "error": "password_incorrect",
+    "message": "Password incorrect. Whatever you were trying to do is cancelled.",
+})
+_CSRF_REJECTED_BODY = _encode_body({
+    "ok": False,
+    "error": "csrf_invalid",
+    "message": "Security check failed. Please refresh and try again.",
+})
+_INTERNAL_ERROR_BODY = _encode_body({"ok": False, "error": "internal_error", "message": "Internal server error."})
+
+
+def _json_body_response(body: bytes) -> Response:
+    return Response(body, mimetype="application/json")
 
 
 def is_ajax_request(request: Any) -> bool:
@@ -15,18 +39,14 @@ def is_ajax_request(request: Any) -> bool:
 def ok_response(request: Any) -> Any:
     """Return default success payload/redirect based on request type."""
     if is_ajax_request(request):
-        return jsonify({"ok": True})
+        return _json_body_response(_OK_BODY)
     return redirect("/")
 
 
 def password_rejected_response(request: Any) -> Any:
     """Return standardized password rejection response."""
     if is_ajax_request(request):
-        return jsonify({
-            "ok": False,
-            "error": "password_incorrect",
-            "message": "Password incorrect. Whatever you were trying to do is cancelled.",
-        }), 403
+        return _json_body_response(_PASSWORD_REJECTED_BODY), 403
     return redirect("/?msg=password_incorrect")
 
 
@@ -54,11 +74,7 @@ def low_storage_blocked_response(request: Any, message: object) -> Any:
 def csrf_rejected_response(request: Any) -> Any:
     """Return CSRF validation failure response."""
     if is_ajax_request(request):
-        return jsonify({
-            "ok": False,
-            "error": "csrf_invalid",
-            "message": "Security check failed. Please refresh and try again.",
-        }), 403
+        return _json_body_response(_CSRF_REJECTED_BODY), 403
     return redirect("/?msg=csrf_invalid")
 
 
@@ -80,7 +96,7 @@ def session_write_failed_response(request: Any, debug_note: object) -> Any:
 def internal_error_response(request: Any) -> Any:
     """Return generic internal-error response payload/redirect."""
     if is_ajax_request(request):
-        return jsonify({"ok": False, "error": "internal_error", "message": "Internal server error."}), 500
+        return _json_body_response(_INTERNAL_ERROR_BODY), 500
     path = str(getattr(request, "path", "") or "").strip()
     msg = str(getattr(request, "args", {}).get("msg", "") or "").strip().lower()
     # Avoid redirect loops for setup/root failures and repeated internal_error redirects.
@@ -0,0 +1,51 @@
+"""Fixed-capacity circular buffer for bounded log tails."""
+
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+
+class Ring:
+    """Preallocated circular buffer that keeps the newest ``size`` items."""
+
+    __slots__ = ("buf", "head", "size")
+
+    def __init__(self, size: int) -> None:
+        self.size = max(1, int(size))
+        self.buf: list[Any] = [None] * self.size
+        self.head = 0
+
+    def __len__(self) -> int:
+        return self.head if self.head < self.size else self.size
+
+    def push(self, item: Any) -> None:
+        """Store one item, overwriting the oldest slot once full."""
+        self.buf[self.head % self.size] = item
+        self.head += 1
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """Push every item from ``items`` in order."""
+        buf = self.buf
+        size = self.size
+        head = self.head
+        for item in items:
+            buf[head % size] = item
+            head += 1
+        self.head = head
+
+    def clear(self) -> None:
+        """Drop all items without reallocating the backing list."""
+        self.head = 0
+
+    def tail(self, n: int | None = None) -> list[Any]:
+        """Return up to ``n`` newest items, oldest first."""
+        count = len(self)
+        if n is not None:
+            count = max(0, min(count, int(n)))
+        if count == 0:
+            return []
+        start = (self.head - count) % self.size
+        end = start + count
+        if end <= self.size:
+            return self.buf[start:end]
+        return self.buf[start:] + self.buf[: end - self.size]
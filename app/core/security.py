@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Mapping, MutableMapping
+import hmac
 from typing import Any
 
 
@@ -15,9 +16,10 @@ def ensure_csrf_token(session: MutableMapping[str, str], token_factory: Callable
     return token
 
 
-def is_csrf_valid(request: Any, session: Mapping[str, str]) -> bool:
+def is_csrf_valid(request: Any, session: Mapping[str, str], expected: str | None = None) -> bool:
     """Validate CSRF token from header or form against session token."""
-    expected = session.get("csrf_token")
+    if expected is None:
+        expected = session.get("csrf_token")
     if not expected:
         return False
     supplied = (
@@ -25,5 +27,6 @@ def is_csrf_valid(request: Any, session: Mapping[str, str]) -> bool:
         or request.form.get("csrf_token")
         or ""
     )
-    return supplied == expected
+    # Compare as bytes: compare_digest rejects non-ASCII str, and the header is client-controlled.
+    return hmac.compare_digest(str(supplied).encode("utf-8"), str(expected).encode("utf-8"))
 
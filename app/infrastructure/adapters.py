@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any
 
 from app.core import state_store as state_store_service
+from app.infrastructure.rcon_client import RconClient, RconUnavailableError
 from app.platform import get_calls, get_metrics, get_paths
 
 
@@ -17,6 +18,7 @@ class PlatformServiceControlAdapter:
     def __init__(self) -> None:
         self._calls = get_calls()
         self._paths = get_paths()
+        self._rcon = RconClient()
 
     def default_web_port(self) -> int:
         return int(self._calls.default_web_port())
@@ -55,10 +57,15 @@ class PlatformServiceControlAdapter:
         return self._calls.run_elevated(cmd, timeout=timeout)
 
     def run_mcrcon(self, host: str, port: int, password: str, command: str, *, timeout: float = 4) -> Any:
-        return self._calls.run_mcrcon(host, port, password, command, timeout=timeout)
+        try:
+            output = self._rcon.command(host, port, password, command, timeout=timeout)
+        except RconUnavailableError:
+            # Nothing was sent; let the mcrcon binary report the failure as before.
+            return self._calls.run_mcrcon(host, port, password, command, timeout=timeout)
+        return subprocess.CompletedProcess(["rcon", command], 0, stdout=output, stderr="")
 
     def is_timeout_error(self, exc: BaseException) -> bool:
-        return isinstance(exc, subprocess.TimeoutExpired)
+        return isinstance(exc, (subprocess.TimeoutExpired, TimeoutError))
 
 
 class PlatformLogAdapter:
@@ -95,13 +102,18 @@ class PlatformLogAdapter:
         cmd = self.minecraft_follow_logs_command(service_name, logs_dir)
         if not cmd:
             return None
-        return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+        # Binary pipe with a block buffer: lines are split by the buffered
+        # reader and decoded here, not by the text-mode codec per read.
+        return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=65536)
 
     def iter_process_lines(self, process_handle: Any) -> Any:
         stdout = getattr(process_handle, "stdout", None)
         if stdout is None:
             return []
-        return stdout
+        return (
+            raw.decode("utf-8", "replace").rstrip("\r\n") if isinstance(raw, bytes) else raw
+            for raw in stdout
+        )
 
     def is_process_running(self, process_handle: Any) -> bool:
         try:
@@ -0,0 +1,173 @@
+"""Persistent Source RCON client used in place of forking mcrcon per command."""
+
+from __future__ import annotations
+
+import select
+import socket
+import struct
+import threading
+import time
+
+_PACKET_AUTH = 3
+_PACKET_COMMAND = 2
+# Unknown packet type: the server echoes its id back, marking the end of a
+# (possibly fragmented) command response.
+_PACKET_SENTINEL = 200
+_HEADER = struct.Struct("<iii")
+_MAX_PACKET_BYTES = 4096 + _HEADER.size + 2
+
+
+class RconUnavailableError(OSError):
+    """Raised when the client could not connect or log in; no command was sent."""
+
+
+class _CommandNotSentError(ConnectionError):
+    """The command packet did not fully leave the socket, so retrying cannot run it twice."""
+
+
+class RconClient:
+    """Single authenticated RCON socket shared by every caller in the process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sock: socket.socket | None = None
+        self._target: tuple[str, int, str] | None = None
+        self._next_id = 0
+
+    def command(self, host: str, port: int, password: str, command: str, *, timeout: float = 4) -> str:
+        """Run one command, reconnecting first when the target changed or the socket dropped.
+
+        ``timeout`` bounds the whole call, including waiting for another caller's command.
+        """
+        target = (str(host), int(port), str(password))
+        deadline = time.monotonic() + timeout
+        if not self._lock.acquire(timeout=timeout):
+            raise RconUnavailableError("RCON client busy")
+        try:
+            reused = self._sock is not None and self._target == target and not self._peer_closed(self._sock)
+            if not reused:
+                self._connect(target, self._remaining(deadline))
+            try:
+                return self._exchange(command, deadline)
+            except _CommandNotSentError:
+                self._close_locked()
+                if not reused:
+                    raise
+            except Exception:
+                self._close_locked()
+                raise
+            # The cached socket died between the liveness check and the send, and
+            # nothing reached the server, so one retry on a fresh login is safe.
+            self._connect(target, self._remaining(deadline))
+            try:
+                return self._exchange(command, deadline)
+            except Exception:
+                self._close_locked()
+                raise
+        finally:
+            self._lock.release()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_locked()
+
+    def _connect(self, target: tuple[str, int, str], timeout: float) -> None:
+        self._close_locked()
+        host, port, password = target
+        try:
+            sock = socket.create_connection((host, port), timeout=timeout)
+        except OSError as exc:
+            raise RconUnavailableError(f"RCON connect failed: {exc}") from exc
+        try:
+            request_id = self._request_id()
+            self._send(sock, request_id, _PACKET_AUTH, password)
+            response_id, _type, _payload = self._recv(sock)
+        except OSError as exc:
+            sock.close()
+            raise RconUnavailableError(f"RCON login failed: {exc}") from exc
+        if response_id != request_id:
+            sock.close()
+            raise RconUnavailableError("RCON login rejected")
+        self._sock = sock
+        self._target = target
+
+    def _exchange(self, command: str, deadline: float) -> str:
+        sock = self._sock
+        if sock is None:
+            raise _CommandNotSentError("RCON connection closed")
+        request_id = self._request_id()
+        sentinel_id = self._request_id()
+        try:
+            sock.settimeout(self._remaining(deadline))
+            self._send(sock, request_id, _PACKET_COMMAND, command)
+        except OSError as exc:
+            raise _CommandNotSentError(f"RCON send failed: {exc}") from exc
+        chunks = []
+        sentinel_sent = False
+        while True:
+            sock.settimeout(self._remaining(deadline))
+            response_id, _type, payload = self._recv(sock)
+            if response_id == request_id:
+                chunks.append(payload)
+            elif response_id == sentinel_id:
+                return "".join(chunks)
+            if not sentinel_sent:
+                # Vanilla servers handle one packet per read, so the end-of-response
+                # marker goes out only once the command's first packet is back.
+                sentinel_sent = True
+                self._send(sock, sentinel_id, _PACKET_SENTINEL, "")
+
+    @staticmethod
+    def _remaining(deadline: float) -> float:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("RCON command timed out")
+        return remaining
+
+    @staticmethod
+    def _peer_closed(sock: socket.socket) -> bool:
+        """Return True when an idle socket was closed by the server or has stray data."""
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        # An idle RCON socket only turns readable on EOF, a reset or stray data;
+        # none of those leave it usable for the next command.
+        return bool(readable)
+
+    def _request_id(self) -> int:
+        self._next_id = (self._next_id % 0x7FFFFFFE) + 1
+        return self._next_id
+
+    @staticmethod
+    def _send(sock: socket.socket, request_id: int, packet_type: int, payload: str) -> None:
+        body = payload.encode("utf-8") + b"\x00\x00"
+        sock.sendall(_HEADER.pack(_HEADER.size - 4 + len(body), request_id, packet_type) + body)
+
+    @staticmethod
+    def _recv_exact(sock: socket.socket, size: int) -> bytes:
+        buf = bytearray()
+        while len(buf) < size:
+            chunk = sock.recv(size - len(buf))
+            if not chunk:
+                raise ConnectionError("RCON connection closed")
+            buf += chunk
+        return bytes(buf)
+
+    @classmethod
+    def _recv(cls, sock: socket.socket) -> tuple[int, int, str]:
+        (length,) = struct.unpack("<i", cls._recv_exact(sock, 4))
+        if length < _HEADER.size - 4 + 2 or length > _MAX_PACKET_BYTES:
+            raise ConnectionError(f"RCON packet length out of range: {length}")
+        data = cls._recv_exact(sock, length)
+        request_id, packet_type = struct.unpack_from("<ii", data)
+        return request_id, packet_type, data[8:-2].decode("utf-8", "replace")
+
+    def _close_locked(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._target = None
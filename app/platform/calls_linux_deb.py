@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import functools
 import os
 import subprocess
 import shutil
+import threading
 import time
 from pathlib import Path
 
+try:
+    # Optional: libsystemd D-Bus bindings let status polls skip fork/exec.
+    from pystemd.systemd1 import Unit as _SystemdUnit
+except ImportError:
+    _SystemdUnit = None
+
+try:
+    # Optional: python-systemd reads the journal in-process instead of via journalctl.
+    from systemd import journal as _journal
+except ImportError:
+    _journal = None
+
 
 def run_elevated(cmd, *, timeout=None):
     return subprocess.run(
@@ -43,6 +57,9 @@ def minecraft_load_recent_logs(service_name, logs_dir, *, tail_lines=1000, timeo
 
 def minecraft_startup_probe_output(service_name, logs_dir, *, timeout=4):
     _ = logs_dir
+    messages = _journal_tail_messages(service_name, 500)
+    if messages is not None:
+        return "\n".join(messages).strip()
     result = subprocess.run(
         ["journalctl", "-u", service_name, "-n", "500", "--no-pager"],
         capture_output=True,
@@ -52,10 +69,16 @@ def minecraft_startup_probe_output(service_name, logs_dir, *, timeout=4):
     return ((result.stdout or "") + (result.stderr or "")).strip()
 
 
+@functools.lru_cache(maxsize=1)
+def _stdbuf_path():
+    # PATH does not change under the running service; walk it once.
+    return shutil.which("stdbuf")
+
+
 def minecraft_follow_logs_command(service_name, logs_dir):
     _ = logs_dir
     base_cmd = ["journalctl", "-u", service_name, "-f", "-n", "0", "--no-pager"]
-    stdbuf_path = shutil.which("stdbuf")
+    stdbuf_path = _stdbuf_path()
     if stdbuf_path:
         return [stdbuf_path, "-oL"] + base_cmd
     return base_cmd
@@ -71,8 +94,93 @@ def service_show_load_state(service_name, *, timeout=5, minecraft_root=None):
     )
 
 
+def _unit_file_name(service_name):
+    name = str(service_name or "").strip()
+    return name if "." in name else f"{name}.service"
+
+
+def _journal_tail_messages(service_name, limit):
+    if _journal is None:
+        return None
+    messages = []
+    try:
+        reader = _journal.Reader()
+        try:
+            reader.add_match(_SYSTEMD_UNIT=_unit_file_name(service_name))
+            reader.seek_tail()
+            while len(messages) < limit:
+                entry = reader.get_previous()
+                if not entry:
+                    break
+                message = entry.get("MESSAGE", "")
+                if isinstance(message, bytes):
+                    message = message.decode("utf-8", "replace")
+                messages.append(str(message))
+        finally:
+            reader.close()
+    except Exception:
+        return None
+    messages.reverse()
+    return messages
+
+
+# Loaded pystemd units keyed by unit file name. Each holds its own bus
+# connection, so reusing them keeps status polls to one D-Bus round-trip.
+# sd-bus connections are not thread-safe, so every call goes through the lock.
+_dbus_units = {}
+_dbus_lock = threading.Lock()
+# pystemd calls take no per-call timeout, so callers wait at most this long for the
+# lock and fall back to systemctl (with its own timeout) behind a stuck call.
+DBUS_LOCK_WAIT_SECONDS = 3.0
+# Set once systemd refuses a D-Bus start (no polkit rule); later starts go straight to sudo.
+_dbus_start_denied = False
+_DBUS_DENIAL_ERRORS = ("AccessDenied", "InteractiveAuthorizationRequired")
+
+
+def _dbus_error_is_denial(exc):
+    text = f"{type(exc).__name__} {exc}"
+    return any(name in text for name in _DBUS_DENIAL_ERRORS)
+
+
+def _dbus_unit_locked(key):
+    unit = _dbus_units.get(key)
+    if unit is None:
+        unit = _SystemdUnit(key)
+        unit.load()
+        _dbus_units[key] = unit
+    return unit
+
+
+def _dbus_active_state(service_name):
+    if _SystemdUnit is None:
+        return None
+    key = _unit_file_name(service_name).encode("utf-8")
+    if not _dbus_lock.acquire(timeout=DBUS_LOCK_WAIT_SECONDS):
+        return None
+    try:
+        state = _dbus_unit_locked(key).Unit.ActiveState
+    except Exception:
+        # Possibly a stale bus connection; reconnect on the next poll.
+        _dbus_units.pop(key, None)
+        return None
+    finally:
+        _dbus_lock.release()
+    if isinstance(state, bytes):
+        state = state.decode("utf-8", "replace")
+    return str(state or "").strip() or None
+
+
 def service_is_active(service_name, *, timeout=3, minecraft_root=None):
     _ = minecraft_root
+    active_state = _dbus_active_state(service_name)
+    if active_state is not None:
+        # Same shape as `systemctl is-active`, whose exit code is 0 only for active.
+        return subprocess.CompletedProcess(
+            ["systemctl", "is-active", service_name],
+            0 if active_state == "active" else 3,
+            stdout=f"{active_state}\n",
+            stderr="",
+        )
     return subprocess.run(
         ["systemctl", "is-active", service_name],
         capture_output=True,
@@ -81,8 +189,33 @@ def service_is_active(service_name, *, timeout=3, minecraft_root=None):
     )
 
 
+def _dbus_start_no_block(service_name):
+    global _dbus_start_denied
+    if _SystemdUnit is None or _dbus_start_denied:
+        return None
+    key = _unit_file_name(service_name).encode("utf-8")
+    if not _dbus_lock.acquire(timeout=DBUS_LOCK_WAIT_SECONDS):
+        return None
+    try:
+        # Unit.Start only queues the job, matching `systemctl start --no-block`.
+        _dbus_unit_locked(key).Unit.Start(b"replace")
+    except Exception as exc:
+        if _dbus_error_is_denial(exc):
+            _dbus_start_denied = True
+        else:
+            # Possibly a stale bus connection; only this start falls back to sudo.
+            _dbus_units.pop(key, None)
+        return None
+    finally:
+        _dbus_lock.release()
+    return subprocess.CompletedProcess(["systemctl", "start", "--no-block", service_name], 0, stdout="", stderr="")
+
+
 def service_start_no_block(service_name, *, timeout=12, minecraft_root=None):
     _ = minecraft_root
+    result = _dbus_start_no_block(service_name)
+    if result is not None:
+        return result
     return run_elevated(["systemctl", "start", "--no-block", service_name], timeout=timeout)
 
 
@@ -1,13 +1,32 @@
 from __future__ import annotations
 
 import os
-import time
-from pathlib import Path
+import re
+import shutil
+import threading
+
+# Per-core (total, idle) jiffies from the previous call. Usage is the delta
+# against this sample, so callers never sleep between two reads.
+_prev_cpu_sample = []
+_prev_cpu_sample_lock = threading.Lock()
+
+_CPUINFO_MHZ_RE = re.compile(rb"^cpu MHz\s*:\s*([\d.]+)", re.MULTILINE)
+_SYS_CPU_DIR = "/sys/devices/system/cpu"
 
 
 def _read_proc_stat():
-    with open("/proc/stat", "r", encoding="utf-8") as f:
-        return [line.strip() for line in f if line.startswith("cpu")]
+    with open("/proc/stat", "rb") as f:
+        data = f.read()
+    return [line for line in data.split(b"\n") if line.startswith(b"cpu")]
+
+
+def _meminfo_kb(data, key):
+    start = data.find(key)
+    if start < 0:
+        return 0
+    end = data.find(b"\n", start)
+    fields = data[start + len(key):end if end >= 0 else len(data)].split()
+    return int(fields[0]) if fields else 0
 
 
 def _parse_cpu_times(line):
@@ -31,38 +50,38 @@ def _format_bytes(value):
 
 
 def get_cpu_usage_per_core():
+    global _prev_cpu_sample
     try:
-        first = _read_proc_stat()
-        time.sleep(0.15)
-        second = _read_proc_stat()
+        lines = _read_proc_stat()
     except OSError:
         return ["unknown"]
+    sample = [_parse_cpu_times(line) for line in lines[1:]]
+    with _prev_cpu_sample_lock:
+        previous = _prev_cpu_sample
+        _prev_cpu_sample = sample
+    if len(previous) != len(sample):
+        # First call (or CPU hotplug): measure against boot so the initial
+        # reading is the since-boot average rather than a blank.
+        previous = [(0, 0)] * len(sample)
     usages = []
-    for i in range(1, min(len(first), len(second))):
-        total1, idle1 = _parse_cpu_times(first[i])
-        total2, idle2 = _parse_cpu_times(second[i])
+    for (total1, idle1), (total2, idle2) in zip(previous, sample):
         total_delta = total2 - total1
         idle_delta = idle2 - idle1
         if total_delta <= 0:
-            usages.append("0.0")
+            usages.append(0.0)
             continue
-        usage = 100.0 * (1.0 - (idle_delta / total_delta))
-        usages.append(f"{usage:.1f}")
+        usages.append(100.0 * (1.0 - (idle_delta / total_delta)))
     return usages
 
 
 def get_ram_usage():
-    mem_total_kb = 0
-    mem_available_kb = 0
     try:
-        with open("/proc/meminfo", "r", encoding="utf-8") as f:
-            for line in f:
-                if line.startswith("MemTotal:"):
-                    mem_total_kb = int(line.split()[1])
-                elif line.startswith("MemAvailable:"):
-                    mem_available_kb = int(line.split()[1])
+        with open("/proc/meminfo", "rb") as f:
+            data = f.read()
     except OSError:
         return "unknown"
+    mem_total_kb = _meminfo_kb(data, b"MemTotal:")
+    mem_available_kb = _meminfo_kb(data, b"MemAvailable:")
 
     if mem_total_kb <= 0:
         return "unknown"
@@ -74,29 +93,60 @@ def get_ram_usage():
     return f"{used_gb:.2f} / {total_gb:.2f} GB ({percent:.1f}%)"
 
 
-def get_cpu_frequency():
-    freq_paths = sorted(Path("/sys/devices/system/cpu").glob("cpu[0-9]*/cpufreq/scaling_cur_freq"))
-    freqs_khz = []
-    for path in freq_paths:
+def _cpuinfo_frequencies_mhz():
+    try:
+        with open("/proc/cpuinfo", "rb") as f:
+            data = f.read()
+    except OSError:
+        return []
+    freqs_mhz = []
+    for value in _CPUINFO_MHZ_RE.findall(data):
         try:
-            value = path.read_text(encoding="utf-8").strip()
-            freqs_khz.append(int(value))
+            freqs_mhz.append(float(value))
+        except ValueError:
+            continue
+    return freqs_mhz
+
+
+def _sysfs_frequencies_mhz():
+    try:
+        names = os.listdir(_SYS_CPU_DIR)
+    except OSError:
+        return []
+    freqs_mhz = []
+    for name in names:
+        if not (name.startswith("cpu") and name[3:].isdigit()):
+            continue
+        try:
+            fd = os.open(f"{_SYS_CPU_DIR}/{name}/cpufreq/scaling_cur_freq", os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            freqs_mhz.append(int(os.read(fd, 32)) / 1000)
         except (ValueError, OSError):
             continue
-    if freqs_khz:
-        avg_ghz = (sum(freqs_khz) / len(freqs_khz)) / 1_000_000
+        finally:
+            os.close(fd)
+    return freqs_mhz
+
+
+def get_cpu_frequency():
+    # /proc/cpuinfo lists every core's MHz in one read; sysfs needs a file per core.
+    freqs_mhz = _cpuinfo_frequencies_mhz() or _sysfs_frequencies_mhz()
+    if freqs_mhz:
+        avg_ghz = (sum(freqs_mhz) / len(freqs_mhz)) / 1000
         return f"{avg_ghz:.2f} GHz"
     return "unknown"
 
 
 def get_storage_usage():
     try:
-        stat = os.statvfs("/")
+        usage = shutil.disk_usage("/")
     except OSError:
         return "unknown"
-    total = stat.f_blocks * stat.f_frsize
-    available = stat.f_bavail * stat.f_frsize
-    used = total - available
+    total = usage.total
+    # ``free`` is f_bavail, matching df's view of space left for non-root users.
+    used = total - usage.free
     if total <= 0:
         return "unknown"
     percent = (used / total) * 100.0
@@ -28,9 +28,9 @@ def get_cpu_usage_per_core():
     try:
         import psutil  # type: ignore
 
-        values = psutil.cpu_percent(interval=0.15, percpu=True)
+        values = psutil.cpu_percent(interval=None, percpu=True)
         if values:
-            return [f"{float(v):.1f}" for v in values]
+            return [float(v) for v in values]
     except Exception:
         pass
     return ["unknown"]
@@ -34,9 +34,9 @@ def get_cpu_usage_per_core():
     try:
         import psutil  # type: ignore
 
-        values = psutil.cpu_percent(interval=0.15, percpu=True)
+        values = psutil.cpu_percent(interval=None, percpu=True)
         if values:
-            return [f"{float(v):.1f}" for v in values]
+            return [float(v) for v in values]
     except Exception:
         pass
     try:
@@ -47,7 +47,7 @@ def get_cpu_usage_per_core():
             timeout=4,
         )
         if lines:
-            return [str(float(line)) for line in lines]
+            return [float(line) for line in lines]
     except Exception:
         pass
     return ["unknown"]
@@ -3,6 +3,7 @@
 import json
 import time
 from typing import Any, Iterator, Mapping, cast
+from urllib.parse import quote
 
 from flask import Response, abort, after_this_request, jsonify, redirect, render_template, request, send_file, send_from_directory, stream_with_context, url_for
 from app.core import state_store as state_store_service
@@ -22,7 +23,19 @@ def _event_id(value: object, default: int = 0) -> int:
         return default
 
 
-def _sse_response(generator: Iterator[str]) -> Response:
+def _stream_events_since(stream_state: Mapping[str, Any], last_seq: int) -> list[tuple[int, bytes]]:
+    """Return buffered (seq, SSE frame) batches newer than last_seq, scanning from the tail."""
+    seqs = stream_state["event_seqs"]
+    frames = stream_state["event_frames"]
+    with stream_state["cond"]:
+        total = len(seqs)
+        start = total
+        while start > 0 and seqs[start - 1] > last_seq:
+            start -= 1
+        return [(seqs[index], frames[index]) for index in range(start, total)]
+
+
+def _sse_response(generator: Iterator[str | bytes]) -> Response:
     return Response(
         stream_with_context(generator),
         mimetype="text/event-stream",
@@ -204,7 +217,20 @@ def register_file_routes(app: Any, state: Mapping[str, Any]) -> None:
             state["log_mcweb_action"]("download-backup", command=filename, rejection_message="File not found or invalid path.")
             return abort(404)
         state["log_mcweb_action"]("download-backup", command=safe_name)
-        return send_from_directory(str(state["BACKUP_DIR"]), safe_name, as_attachment=True)
+        accel_prefix = str(state.get("BACKUP_DOWNLOAD_ACCEL_PREFIX", "") or "").strip()
+        if accel_prefix:
+            # Let the fronting nginx serve the bytes from an internal location.
+            response = Response(status=200, mimetype="application/zip")
+            response.headers["X-Accel-Redirect"] = f"{accel_prefix.rstrip('/')}/{quote(safe_name)}"
+            response.headers["Content-Disposition"] = f"attachment; filename*=UTF-8''{quote(safe_name)}"
+            return response
+        return send_from_directory(
+            str(state["BACKUP_DIR"]),
+            safe_name,
+            as_attachment=True,
+            conditional=True,
+            etag=True,
+        )
 
     # Route: /download/backups-snapshot/<path:snapshot_name>
     @app.route("/download/backups-snapshot/<path:snapshot_name>", methods=["POST"])
@@ -403,7 +429,7 @@ def register_file_routes(app: Any, state: Mapping[str, Any]) -> None:
         client_id = str(request.args.get("client_id", "") or request.headers.get("X-MCWEB-Client-Id", "") or "").strip()
         channel = f"log_stream:{source_key}"
 
-        def generate() -> Iterator[str]:
+        def generate() -> Iterator[str | bytes]:
             """Runtime helper generate."""
             def _coerce_batch_payload(payload_obj: object) -> dict[str, object] | None:
                 if not isinstance(payload_obj, dict):
@@ -460,19 +486,14 @@ def register_file_routes(app: Any, state: Mapping[str, Any]) -> None:
                             pass
                     delivered = False
                     if stream_state is not None:
-                        with stream_state["cond"]:
-                            events = list(stream_state["events"])
+                        events = _stream_events_since(stream_state, last_seq)
                         if events:
-                            for seq, payload_obj in events:
-                                if seq <= last_seq:
-                                    continue
+                            # Frames are encoded once by the producer and shared by every client.
+                            for seq, frame in events:
                                 last_seq = seq
                                 last_event_id = max(last_event_id, seq)
-                                payload = _coerce_batch_payload(payload_obj)
-                                if payload is not None:
-                                    delivered = True
-                                    yield "event: batch\n"
-                                    yield f"data: {json.dumps(payload, ensure_ascii=True, separators=(',', ':'))}\n\n"
+                                delivered = True
+                                yield frame
                     db_path = state.get("APP_STATE_DB_PATH")
                     if db_path is not None:
                         try:
@@ -24,6 +24,7 @@ _METRICS_ROUTE_CACHE: dict[str, Any] = {
     "payload": None,
     "scope_key": None,
 }
+_NAV_ATTENTION_KEY = b'"nav_attention"'
 _state_store = cast(Any, state_store_service)
 _client_registry = cast(Any, client_registry_service)
 
@@ -67,20 +68,57 @@ def register_metrics_routes(app: Any, state: dict[str, Any], get_nav_alert_state
         except Exception:
             pass
 
-    def _attach_nav_attention(payload: object) -> object:
-        if not isinstance(payload, dict):
-            return payload
+    def _attach_nav_attention(body: bytes) -> bytes:
+        """Append this client's nav_attention to an encoded snapshot object."""
         get_nav_alert_state = get_nav_alert_state_from_request
-        if not callable(get_nav_alert_state):
-            return payload
-        merged = dict(payload)
+        if not callable(get_nav_alert_state) or not body.endswith(b"}") or _NAV_ATTENTION_KEY in body:
+            return body
         try:
             nav_attention = get_nav_alert_state()
         except Exception:
             nav_attention = {}
-        if isinstance(nav_attention, dict) and nav_attention:
-            merged["nav_attention"] = dict(nav_attention)
-        return merged
+        if not isinstance(nav_attention, dict) or not nav_attention:
+            return body
+        # Splice into the shared encoded snapshot so only the per-client part is encoded.
+        encoded = json.dumps(nav_attention, separators=(",", ":")).encode("utf-8")
+        separator = b"," if len(body) > 2 else b""
+        return body[:-1] + separator + _NAV_ATTENTION_KEY + b":" + encoded + b"}"
+
+    def _sse_frame(body: bytes) -> bytes:
+        return b"data: " + _attach_nav_attention(body) + b"\n\n"
+
+    def _encode_snapshot(snapshot: dict[str, Any]) -> bytes:
+        return json.dumps(snapshot, separators=(",", ":")).encode("utf-8")
+
+    def _read_snapshot_locked() -> tuple[Any, Any, int]:
+        """Take the published snapshot references; the caller holds the cache lock.
+
+        Published snapshots are replaced, never mutated, so no copy is needed here.
+        """
+        body = _runtime_get("metrics_cache_payload_json", b"")
+        cache_payload = _runtime_get("metrics_cache_payload", {})
+        cache_seq = _coerce_event_id(_runtime_get("metrics_cache_seq", 0))
+        return body, cache_payload, cache_seq
+
+    def _snapshot_body(body: Any, cache_payload: Any) -> bytes | None:
+        if isinstance(body, bytes) and body:
+            return body
+        if isinstance(cache_payload, dict):
+            return _encode_snapshot(cache_payload)
+        return None
+
+    def _cached_snapshot_body() -> tuple[bytes | None, int]:
+        """Return the published snapshot's JSON bytes and sequence, read under the cache lock."""
+        with _runtime_get("metrics_cache_cond"):
+            body, cache_payload, cache_seq = _read_snapshot_locked()
+        return _snapshot_body(body, cache_payload), cache_seq
+
+    def _cached_body_etag(body: bytes) -> str:
+        """Return the ETag precomputed at publish time when ``body`` is the published snapshot."""
+        with _runtime_get("metrics_cache_cond"):
+            if _runtime_get("metrics_cache_payload_json", b"") is body:
+                return str(_runtime_get("metrics_cache_etag", "") or "")
+        return ""
 
     def _latest_metrics_from_db() -> tuple[dict[str, Any] | None, int]:
         db_path = state.get("APP_STATE_DB_PATH")
@@ -105,7 +143,12 @@ def register_metrics_routes(app: Any, state: dict[str, Any], get_nav_alert_state
         _ensure_metrics_runtime_started_best_effort()
         if process_role == "worker":
             return
-        publish_fn = state.get("_collect_and_publish_metrics") or state.get("collect_and_publish_metrics")
+        # Concurrent page loads share one collection instead of each running their own.
+        publish_fn = (
+            state.get("_refresh_metrics_snapshot")
+            or state.get("_collect_and_publish_metrics")
+            or state.get("collect_and_publish_metrics")
+        )
         if not callable(publish_fn):
             return
         try:
@@ -120,6 +163,19 @@ def register_metrics_routes(app: Any, state: dict[str, Any], get_nav_alert_state
         cache_scope_key = id(runtime_state)
         _refresh_metrics_snapshot_best_effort()
         latest_snapshot, latest_event_id = _latest_metrics_from_db()
+        get_json = state.get("get_cached_dashboard_metrics_json")
+        if callable(get_json):
+            # The in-process snapshot is already encoded; serve it when it is the latest one.
+            body, body_seq = get_json()
+            if body and (latest_snapshot is None or body_seq == int(latest_event_id)):
+                response = Response(body, mimetype="application/json")
+                etag = _cached_body_etag(body)
+                if etag:
+                    response.set_etag(etag)
+                else:
+                    response.add_etag()
+                # Repeat pollers holding the same snapshot get a bodiless 304.
+                return response.make_conditional(request)
         with _METRICS_ROUTE_CACHE_LOCK:
             cached_payload = _METRICS_ROUTE_CACHE.get("payload")
             if (
@@ -143,11 +199,8 @@ def register_metrics_routes(app: Any, state: dict[str, Any], get_nav_alert_state
         """Runtime helper metrics_stream."""
         _ensure_metrics_runtime_started_best_effort()
         client_id = str(request.args.get("client_id", "") or request.headers.get("X-MCWEB-Client-Id", "") or "").strip()
-        def generate() -> Iterator[str]:
+        def generate() -> Iterator[str | bytes]:
             """Runtime helper generate."""
-            def _serialize_snapshot(snapshot: dict[str, Any]) -> str:
-                return json.dumps(_attach_nav_attention(snapshot), separators=(",", ":"))
-
             if client_id:
                 _client_registry.register_client(state, client_id, channel="metrics_stream")
             with _runtime_get("metrics_cache_cond"):
@@ -156,7 +209,7 @@ def register_metrics_routes(app: Any, state: dict[str, Any], get_nav_alert_state
             _refresh_metrics_snapshot_best_effort()
             last_event_id = 0
             last_cache_seq = 0
-            last_payload = ""
+            last_payload = b""
             db_path = state.get("APP_STATE_DB_PATH")
             latest_db_snapshot: dict[str, Any] | None = None
             if db_path is not None:
@@ -170,23 +223,21 @@ def register_metrics_routes(app: Any, state: dict[str, Any], get_nav_alert_state
                     last_event_id = _coerce_event_id(latest_event.get("id", 0))
                     if isinstance(latest_snapshot, dict):
                         latest_db_snapshot = latest_snapshot
-            with _runtime_get("metrics_cache_cond"):
-                cache_payload = dict(_runtime_get("metrics_cache_payload", {})) if isinstance(_runtime_get("metrics_cache_payload", {}), dict) else None
-                last_cache_seq = _coerce_event_id(_runtime_get("metrics_cache_seq", 0))
-            initial_snapshot = cache_payload if isinstance(cache_payload, dict) else latest_db_snapshot
-            if isinstance(initial_snapshot, dict):
-                last_payload = _serialize_snapshot(initial_snapshot)
-                yield f"data: {last_payload}\n\n"
+            cache_body, last_cache_seq = _cached_snapshot_body()
+            cache_seq = last_cache_seq
+            if cache_body is None and isinstance(latest_db_snapshot, dict):
+                cache_body = _encode_snapshot(latest_db_snapshot)
+            if cache_body is not None:
+                last_payload = _sse_frame(cache_body)
+                yield last_payload
             try:
                 while True:
                     delivered = False
-                    with _runtime_get("metrics_cache_cond"):
-                        cache_payload = dict(_runtime_get("metrics_cache_payload", {})) if isinstance(_runtime_get("metrics_cache_payload", {}), dict) else None
-                        cache_seq = _coerce_event_id(_runtime_get("metrics_cache_seq", 0), last_cache_seq)
-                    if isinstance(cache_payload, dict) and cache_seq > last_cache_seq:
-                        payload = _serialize_snapshot(cache_payload)
+                    # Several publishes between wakeups collapse into the latest snapshot.
+                    if cache_body is not None and cache_seq > last_cache_seq:
+                        payload = _sse_frame(cache_body)
                         if payload != last_payload:
-                            yield f"data: {payload}\n\n"
+                            yield payload
                             delivered = True
                             last_payload = payload
                         last_cache_seq = cache_seq
@@ -202,31 +253,38 @@ def register_metrics_routes(app: Any, state: dict[str, Any], get_nav_alert_state
                         except Exception:
                             rows = []
                         if rows:
+                            # Only the newest row matters to the client; skip the intermediates.
+                            latest_row_snapshot = None
                             for row in rows:
                                 payload_obj = row.get("payload", {}) if isinstance(row, dict) else {}
                                 snapshot = payload_obj.get("snapshot") if isinstance(payload_obj, dict) else None
                                 if isinstance(snapshot, dict):
-                                    payload = _serialize_snapshot(snapshot)
-                                    if payload != last_payload:
-                                        yield f"data: {payload}\n\n"
-                                        delivered = True
-                                        last_payload = payload
+                                    latest_row_snapshot = snapshot
                                 row_id = _coerce_event_id(
                                     row.get("id", last_event_id) if isinstance(row, dict) else last_event_id,
                                     last_event_id,
                                 )
                                 last_event_id = max(last_event_id, row_id)
+                            if latest_row_snapshot is not None:
+                                payload = _sse_frame(_encode_snapshot(latest_row_snapshot))
+                                if payload != last_payload:
+                                    yield payload
+                                    delivered = True
+                                    last_payload = payload
                     if not delivered:
                         yield ": keepalive\n\n"
                     if client_id:
                         _client_registry.touch_client(state, client_id, channel="metrics_stream")
                     configured_heartbeat = float(state["METRICS_STREAM_HEARTBEAT_SECONDS"])
                     heartbeat = max(0.5, min(configured_heartbeat, 1.0))
+                    # Wait and read the next snapshot in one lock scope, then yield unlocked.
                     with _runtime_get("metrics_cache_cond"):
                         _runtime_get("metrics_cache_cond").wait_for(
                             lambda: _coerce_event_id(_runtime_get("metrics_cache_seq", 0), last_cache_seq) > last_cache_seq,
                             timeout=heartbeat,
                         )
+                        body, cache_payload, cache_seq = _read_snapshot_locked()
+                    cache_body = _snapshot_body(body, cache_payload)
             finally:
                 if client_id:
                     _client_registry.unregister_client(state, client_id, channel="metrics_stream")
@@ -1,6 +1,7 @@
 """Route registration for the shell-first MC web dashboard."""
 # mypy: disable-error-code=untyped-decorator
 import threading
+from types import MappingProxyType
 from typing import Any
 
 from flask import jsonify, redirect, render_template, request, send_from_directory
@@ -17,6 +18,13 @@ from app.commands.maintenance_commands import run_cleanup_event_if_enabled
 from app.routes.shell_page import render_shell_page as render_shell_page_helper
 from app.services import maintenance_state_store as maintenance_state_store_service
 
+_HOME_LOG_SOURCES = ("minecraft", "backup", "mcweb", "mcweb_log")
+# Fixed render arguments for the home page; merged with per-request values.
+_HOME_BASE_CONTEXT = MappingProxyType({
+    "current_page": "home",
+    "page_title": "Minecraft Control",
+})
+
 
 def register_routes(app: Any, state: dict[str, Any]) -> None:
     """Register top-level dashboard routes and wire the supporting route modules."""
@@ -119,15 +127,14 @@ def register_routes(app: Any, state: dict[str, Any]) -> None:
         initial_logs: dict[str, str] = {}
         get_log_source_text = state.get("get_log_source_text")
         if callable(get_log_source_text):
-            for source in ("minecraft", "backup", "mcweb", "mcweb_log"):
+            for source in _HOME_LOG_SOURCES:
                 try:
                     initial_logs[source] = str(get_log_source_text(source) or "")
                 except Exception:
                     initial_logs[source] = ""
         return render_shell_page_helper(app, state, render_template, 
             "fragments/home_fragment.html",
-            current_page="home",
-            page_title="Minecraft Control",
+            **_HOME_BASE_CONTEXT,
             csrf_token=state["_ensure_csrf_token"](),
             alert_message=home["alert_message"],
             alert_message_code=home["message_code"],
@@ -21,6 +21,7 @@ from app.queries import setup_queries as setup_queries_service
 from app.services.worker_scheduler import start_detached
 
 _TRUE_VALUES = {"1", "true", "yes", "on"}
+_APP_DIR = Path(__file__).resolve().parents[2]
 
 
 def _state_value(state: Mapping[str, Any], key: str, default: Any = None) -> Any:
@@ -67,7 +68,7 @@ def _panel_app_dir(state: Mapping[str, Any]) -> Path:
     docs_dir = _state_value(state, "DOCS_DIR")
     if docs_dir:
         return Path(docs_dir).parent
-    return Path(__file__).resolve().parents[2]
+    return _APP_DIR
 
 
 def _panel_web_conf_path(state: Mapping[str, Any]) -> Path:
@@ -29,12 +29,16 @@ def render_shell_page(
         response.headers["X-MCWEB-Page-Key"] = current_page
         return response
 
-    snapshot_getter = None
-    try:
-        snapshot_getter = state["get_cached_dashboard_metrics"]
-    except Exception:
-        snapshot_getter = getattr(state, "get_cached_dashboard_metrics", None)
-    initial_metrics_snapshot = snapshot_getter() if callable(snapshot_getter) else {}
+    # Pages that already fetched the snapshot/token for their fragment pass them
+    # through the context so the shell does not compute them a second time.
+    initial_metrics_snapshot = context.get("metrics_snapshot")
+    if initial_metrics_snapshot is None:
+        snapshot_getter = None
+        try:
+            snapshot_getter = state["get_cached_dashboard_metrics"]
+        except Exception:
+            snapshot_getter = getattr(state, "get_cached_dashboard_metrics", None)
+        initial_metrics_snapshot = snapshot_getter() if callable(snapshot_getter) else {}
     cleaned_fragment = fragment_html.strip()
     password_required = True
     csrf_token = ""
@@ -42,10 +46,13 @@ def render_shell_page(
         password_required = bool(state.get("REQUIRE_SUDO_PASSWORD", True))
     except Exception:
         password_required = True
-    try:
-        csrf_token = str(state["_ensure_csrf_token"]() or "")
-    except Exception:
-        csrf_token = ""
+    if context.get("csrf_token"):
+        csrf_token = str(context["csrf_token"])
+    else:
+        try:
+            csrf_token = str(state["_ensure_csrf_token"]() or "")
+        except Exception:
+            csrf_token = ""
     return render_template_fn(
         "app_shell.html",
         current_page=current_page,
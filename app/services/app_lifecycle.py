@@ -3,7 +3,7 @@
 import threading
 from typing import Any, Callable, Iterable
 
-from flask import has_request_context, request
+from flask import request
 from werkzeug.exceptions import HTTPException
 
 from app.core.response_helpers import internal_error_response
@@ -40,7 +40,8 @@ def install_flask_hooks(
     def _unhandled_exception_handler(exc: Exception) -> Any:
         if isinstance(exc, HTTPException):
             return exc
-        path = request.path if has_request_context() else "unknown-path"
+        # Flask only dispatches error handlers inside a request context.
+        path = request.path
         log_mcweb_exception(f"unhandled_exception path={path}", exc)
         return internal_error_response(request)
 
@@ -1,6 +1,7 @@
 """Backup control-plane use cases and scheduling helpers."""
 
 from datetime import datetime
+import os
 from pathlib import Path
 import time
 from types import SimpleNamespace
@@ -24,23 +25,32 @@ def _backup_snapshot_root(ctx: Any) -> Path:
     return Path(ctx.BACKUP_DIR) / "snapshots"
 
 
-def _iter_backup_artifacts(ctx: Any) -> Iterator[Path]:
-    backup_dir = Path(ctx.BACKUP_DIR)
-    if backup_dir.exists() and backup_dir.is_dir():
-        yield from backup_dir.glob("*.zip")
-
-    snapshot_root = _backup_snapshot_root(ctx)
-    if snapshot_root.exists() and snapshot_root.is_dir():
-        for path in snapshot_root.iterdir():
-            if path.is_dir():
-                yield path
+def _scan_dir_entries(path: Path) -> list[os.DirEntry[str]]:
+    try:
+        with os.scandir(path) as entries:
+            return list(entries)
+    except OSError:
+        return []
+
+
+def _iter_backup_artifacts(ctx: Any) -> Iterator[os.DirEntry[str]]:
+    for entry in _scan_dir_entries(Path(ctx.BACKUP_DIR)):
+        if entry.name.endswith(".zip"):
+            yield entry
+
+    for entry in _scan_dir_entries(_backup_snapshot_root(ctx)):
+        try:
+            if entry.is_dir():
+                yield entry
+        except OSError:
+            continue
 
 
 def _scan_backup_artifacts(ctx: Any, *, stat_attr: str) -> dict[str, float]:
     snapshot: dict[str, float] = {}
-    for path in _iter_backup_artifacts(ctx):
+    for entry in _iter_backup_artifacts(ctx):
         try:
-            snapshot[str(path)] = float(getattr(path.stat(), stat_attr))
+            snapshot[entry.path] = float(getattr(entry.stat(), stat_attr))
         except OSError:
             continue
     return snapshot
@@ -61,20 +71,17 @@ def run_backup_script(
     if not backup_state.run_lock.acquire(blocking=False):
         return bool(count_skip_as_success)
     try:
-        if is_backup_running(ctx, include_run_lock=False):
-            with backup_state.lock:
-                backup_state.last_error = ""
-            return bool(count_skip_as_success)
-
-        with backup_state.lock:
+        with backup_state.error_lock:
             backup_state.last_error = ""
+        if is_backup_running(ctx, include_run_lock=False, use_memo=False):
+            return bool(count_skip_as_success)
 
         before_snapshot = read_snapshot(ctx)
         try:
             direct_result = _calls.run_backup_script(ctx.BACKUP_SCRIPT, trigger, timeout=600)
         except OSError as exc:
             message = f"Backup script execution failed: {exc}"
-            with backup_state.lock:
+            with backup_state.error_lock:
                 backup_state.last_error = message[:700]
             try:
                 ctx.log_mcweb_exception("run_backup_script", exc)
@@ -85,7 +92,7 @@ def run_backup_script(
             if not ports.backup.is_timeout_error(exc):
                 raise
             message = "Backup timed out after 600s."
-            with backup_state.lock:
+            with backup_state.error_lock:
                 backup_state.last_error = message
             ctx.log_mcweb_log(
                 "backup-timeout",
@@ -99,10 +106,10 @@ def run_backup_script(
         if direct_result.returncode == 0:
             return True
         if direct_created_zip:
-            detail = ((direct_result.stderr or "") + "\n" + (direct_result.stdout or "")).strip()
+            detail = ((direct_result.stderr or "")[:400] + "\n" + (direct_result.stdout or "")[:400]).strip()[:400]
             message = f"Backup completed with warnings (trigger={trigger})."
             if detail:
-                message = f"{message} {detail[:400]}"
+                message = f"{message} {detail}"
             ctx.set_backup_warning(message)
             ctx.log_mcweb_action("backup-warning", command=f"trigger={trigger}", rejection_message=message[:700])
             return True
@@ -115,7 +122,7 @@ def run_backup_script(
                     err = " | ".join(tail_lines[-3:]).strip()
             except Exception:
                 err = ""
-        with backup_state.lock:
+        with backup_state.error_lock:
             backup_state.last_error = err[:700] if err else "Backup command returned non-zero exit status."
         return False
     finally:
@@ -3,7 +3,9 @@ from pathlib import Path
 from threading import Lock
 from typing import Any
 
+from app.core.ring_buffer import Ring
 from app.ports import ports
+from app.services.log_stream_service import is_rcon_noise_line
 
 
 def _load_file_log_cache_from_disk(
@@ -76,16 +78,6 @@ def _get_cached_file_log_text(
         return "\n".join(getattr(ctx, lines_attr)).strip() or "(no logs)"
 
 
-def _is_rcon_noise_line(line: object) -> bool:
-    """Return whether a minecraft log line is known RCON shutdown/startup noise."""
-    lower = str(line or "").lower()
-    if "thread rcon client" in lower:
-        return True
-    if "minecraft/rconclient" in lower and "shutting down" in lower:
-        return True
-    return False
-
-
 def load_backup_log_cache_from_disk(ctx: Any) -> None:
     """Reload backup log cache from disk into bounded in-memory storage."""
     _load_file_log_cache_from_disk(
@@ -149,10 +141,9 @@ def load_minecraft_log_cache_from_journal(ctx: Any) -> None:
                 rejection_message=f"Timed out after {ctx.JOURNAL_LOAD_TIMEOUT_SECONDS:.1f}s.",
             )
             output = ""
-    lines = output.splitlines()
-    lines = [line for line in lines if not _is_rcon_noise_line(line)]
-    if len(lines) > ctx.MINECRAFT_LOG_TEXT_LIMIT:
-        lines = lines[-ctx.MINECRAFT_LOG_TEXT_LIMIT:]
+    ring = Ring(ctx.MINECRAFT_LOG_TEXT_LIMIT)
+    ring.extend(line for line in output.splitlines() if not is_rcon_noise_line(line))
+    lines = ring.tail()
     with ctx.minecraft_log_cache_lock:
         ctx.minecraft_log_cache_lines.clear()
         ctx.minecraft_log_cache_lines.extend(lines)
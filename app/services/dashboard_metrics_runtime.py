@@ -1,6 +1,10 @@
 """Dashboard metrics collection and publication helpers."""
+from bisect import bisect_right
 from datetime import datetime
+import hashlib
+import json
 from pathlib import Path
+import re
 import time
 from typing import Any
 
@@ -11,7 +15,16 @@ from app.services import maintenance_state_store as maintenance_state_store_serv
 from app.services import maintenance_scheduler as maintenance_scheduler_service
 from app.services import session_watchers as session_watchers_service
 from app.services.dashboard_state_runtime import get_backups_status, get_observed_state
-from app.services.worker_scheduler import WorkerSpec, get_worker_health_snapshot, start_worker
+from app.services.worker_scheduler import WorkerSpec, is_worker_running, start_worker, submit_probe
+
+# Severity thresholds for percent-based metrics: <60 green, <75 yellow, <90 orange, else red.
+_PERCENT_CLASS_BOUNDS = (60.0, 75.0, 90.0)
+_PERCENT_CLASSES = ("stat-green", "stat-yellow", "stat-orange", "stat-red")
+_PERCENT_RE = re.compile(r"\(([\d.]+)%\)")
+# Upper bound for a request waiting on another caller's metrics collection.
+_METRICS_INFLIGHT_WAIT_SECONDS = 10.0
+# Upper bound for the RCON probe running alongside the local metric reads.
+_RUNTIME_PROBE_TIMEOUT_SECONDS = 10.0
 
 
 def mark_home_page_client_active(ctx: Any, client_id: str | None = None) -> None:
@@ -86,53 +99,55 @@ def _maybe_refresh_idle_storage_cache(ctx: Any) -> bool:
         "cleanup_next_run": cleanup_next_run,
     }
     # Update cached payload so reconnecting clients see fresh storage/cleanup data.
+    # Published snapshots are never mutated in place: build a new one outside the
+    # lock and swap it in unless a concurrent publish replaced it meanwhile.
+    with ctx.metrics_cache_cond:
+        current = ctx.metrics_cache_payload
+    payload = dict(current) if isinstance(current, dict) else {}
+    payload["storage_usage"] = usage
+    payload["storage_usage_class"] = get_storage_usage_class(ctx, usage)
+    payload["backup_files_count"] = backup_count
+    payload["backup_folder"] = backup_folder
+    payload["stale_worlds_count"] = stale_worlds_count
+    payload["cleanup_last_run"] = cleanup_meta.get("last_run_at", "")
+    payload["cleanup_rule_version"] = cleanup_meta.get("rule_version")
+    payload["cleanup_schedule_version"] = cleanup_meta.get("schedule_version")
+    payload["cleanup_last_changed_by"] = cleanup_meta.get("last_changed_by", "")
+    payload["cleanup_missed_runs"] = cleanup_missed_runs
+    payload["cleanup_next_run"] = cleanup_next_run
+    system_group = dict(payload.get("system", {})) if isinstance(payload.get("system"), dict) else {}
+    system_group["storage"] = usage
+    payload["system"] = system_group
+    backup_group = dict(payload.get("backup", {})) if isinstance(payload.get("backup"), dict) else {}
+    backup_group["count"] = backup_count
+    backup_group["folder"] = backup_folder
+    payload["backup"] = backup_group
+    cleanup_group = dict(payload.get("cleanup", {})) if isinstance(payload.get("cleanup"), dict) else {}
+    cleanup_group["last_run"] = cleanup_meta.get("last_run_at", "")
+    cleanup_group["rule_version"] = cleanup_meta.get("rule_version")
+    cleanup_group["schedule_version"] = cleanup_meta.get("schedule_version")
+    cleanup_group["last_changed_by"] = cleanup_meta.get("last_changed_by", "")
+    cleanup_group["missed_runs"] = cleanup_missed_runs
+    cleanup_group["next_run"] = cleanup_next_run
+    cleanup_group["stale_worlds_count"] = stale_worlds_count
+    payload["cleanup"] = cleanup_group
+    payload_json, etag = _encode_published_snapshot(payload)
     with ctx.metrics_cache_cond:
-        payload = dict(ctx.metrics_cache_payload) if isinstance(ctx.metrics_cache_payload, dict) else {}
-        payload["storage_usage"] = usage
-        payload["storage_usage_class"] = get_storage_usage_class(ctx, usage)
-        payload["backup_files_count"] = backup_count
-        payload["backup_folder"] = backup_folder
-        payload["stale_worlds_count"] = stale_worlds_count
-        payload["cleanup_last_run"] = cleanup_meta.get("last_run_at", "")
-        payload["cleanup_rule_version"] = cleanup_meta.get("rule_version")
-        payload["cleanup_schedule_version"] = cleanup_meta.get("schedule_version")
-        payload["cleanup_last_changed_by"] = cleanup_meta.get("last_changed_by", "")
-        payload["cleanup_missed_runs"] = cleanup_missed_runs
-        payload["cleanup_next_run"] = cleanup_next_run
-        system_group = dict(payload.get("system", {})) if isinstance(payload.get("system"), dict) else {}
-        system_group["storage"] = usage
-        payload["system"] = system_group
-        backup_group = dict(payload.get("backup", {})) if isinstance(payload.get("backup"), dict) else {}
-        backup_group["count"] = backup_count
-        backup_group["folder"] = backup_folder
-        payload["backup"] = backup_group
-        cleanup_group = dict(payload.get("cleanup", {})) if isinstance(payload.get("cleanup"), dict) else {}
-        cleanup_group["last_run"] = cleanup_meta.get("last_run_at", "")
-        cleanup_group["rule_version"] = cleanup_meta.get("rule_version")
-        cleanup_group["schedule_version"] = cleanup_meta.get("schedule_version")
-        cleanup_group["last_changed_by"] = cleanup_meta.get("last_changed_by", "")
-        cleanup_group["missed_runs"] = cleanup_missed_runs
-        cleanup_group["next_run"] = cleanup_next_run
-        cleanup_group["stale_worlds_count"] = stale_worlds_count
-        payload["cleanup"] = cleanup_group
-        ctx.metrics_cache_payload = payload
+        if ctx.metrics_cache_payload is current:
+            ctx.metrics_cache_payload = payload
+            ctx.metrics_cache_payload_json = payload_json
+            ctx.metrics_cache_etag = etag
     return True
 
 
 def class_from_percent(value: float) -> str:
     """Map a numeric percent to dashboard severity class."""
-    if value < 60:
-        return "stat-green"
-    if value < 75:
-        return "stat-yellow"
-    if value < 90:
-        return "stat-orange"
-    return "stat-red"
+    return _PERCENT_CLASSES[bisect_right(_PERCENT_CLASS_BOUNDS, value)]
 
 
 def extract_percent(ctx: Any, usage_text: object) -> float | None:
     """Extract numeric percentage from human-readable usage text."""
-    match = ctx.re.search(r"\(([\d.]+)%\)", usage_text or "")
+    match = _PERCENT_RE.search(usage_text or "")
     if not match:
         return None
     try:
@@ -141,6 +156,10 @@ def extract_percent(ctx: Any, usage_text: object) -> float | None:
         return None
 
 
+def _class_from_optional_percent(percent: float | None) -> str:
+    return "stat-red" if percent is None else class_from_percent(percent)
+
+
 def usage_class_from_text(ctx: Any, usage_text: object) -> str:
     """Map usage text with percentage into dashboard severity class."""
     percent = extract_percent(ctx, usage_text)
@@ -166,7 +185,8 @@ def get_cpu_per_core_items(ctx: Any, cpu_per_core: list[object]) -> list[dict[st
     """Build per-core UI payload with normalized values/classes."""
     items: list[dict[str, object]] = []
     for i, raw in enumerate(cpu_per_core):
-        val = _coerce_float(raw)
+        # Platform backends report floats; anything else is a fallback marker like "unknown".
+        val = raw if type(raw) is float else _coerce_float(raw)
         if val is None:
             items.append({"index": i, "value": raw, "class": "stat-red"})
             continue
@@ -308,6 +328,9 @@ def get_slow_metrics(ctx: Any, service_status: object, *, active_clients: bool =
         "storage_usage": ctx.get_storage_usage(),
         "backups_status": get_backups_status(ctx),
     }
+    # Parse the percentages once per refresh; every tick in the TTL reuses the numbers.
+    snapshot["ram_percent"] = extract_percent(ctx, snapshot["ram_usage"])
+    snapshot["storage_percent"] = extract_percent(ctx, snapshot["storage_usage"])
     with ctx.slow_metrics_lock:
         ctx.slow_metrics_cache = dict(snapshot)
         ctx.slow_metrics_cache_status = service_status
@@ -325,18 +348,27 @@ def collect_dashboard_metrics(ctx: Any) -> dict[str, Any]:
             session_watchers_service.ensure_session_watchers_started(ctx)
         except Exception as exc:
             ctx.log_mcweb_exception("ensure_session_watchers_started", exc)
+    # The RCON round-trip is network-bound and independent of the local reads,
+    # so start it first and collect it once the slow metrics are in.
+    probe_fn = getattr(ctx, "_probe_minecraft_runtime_metrics", None)
+    probe_future = (
+        submit_probe(probe_fn, force=active_clients, service_status=service_status)
+        if callable(probe_fn)
+        else None
+    )
     slow = get_slow_metrics(ctx, service_status, active_clients=active_clients)
     cpu_per_core = slow["cpu_per_core"]
     ram_usage = slow["ram_usage"]
     cpu_frequency = slow["cpu_frequency"]
     storage_usage = slow["storage_usage"]
+    ram_percent = slow["ram_percent"] if "ram_percent" in slow else extract_percent(ctx, ram_usage)
+    storage_percent = slow["storage_percent"] if "storage_percent" in slow else extract_percent(ctx, storage_usage)
     low_storage_blocked = ctx.is_storage_low(storage_usage)
     players_online_raw = None
     tick_rate_raw = None
-    probe_fn = getattr(ctx, "_probe_minecraft_runtime_metrics", None)
-    if callable(probe_fn):
+    if probe_future is not None:
         try:
-            players_online_raw, tick_rate_raw = probe_fn(force=active_clients)
+            players_online_raw, tick_rate_raw = probe_future.result(timeout=_RUNTIME_PROBE_TIMEOUT_SECONDS)
         except Exception:
             players_online_raw = None
             tick_rate_raw = None
@@ -409,12 +441,12 @@ def collect_dashboard_metrics(ctx: Any) -> dict[str, Any]:
         "service_running_status": service_status,
         "backups_status": slow["backups_status"],
         "ram_usage": ram_usage,
-        "ram_usage_class": get_ram_usage_class(ctx, ram_usage),
+        "ram_usage_class": _class_from_optional_percent(ram_percent),
         "cpu_per_core_items": cpu_per_core_items,
         "cpu_frequency": cpu_frequency,
         "cpu_frequency_class": get_cpu_frequency_class(ctx, cpu_frequency),
         "storage_usage": storage_usage,
-        "storage_usage_class": get_storage_usage_class(ctx, storage_usage),
+        "storage_usage_class": _class_from_optional_percent(storage_percent),
         "low_storage_blocked": low_storage_blocked,
         "low_storage_message": ctx.low_storage_error_message(storage_usage) if low_storage_blocked else "",
         "players_online": players_online,
@@ -461,12 +493,31 @@ def publish_metrics_snapshot(ctx: Any, snapshot: dict[str, Any] | None) -> None:
             )
         except Exception:
             event_id = 0
+    # Publish a private copy so readers can share the reference without copying it.
+    published = dict(snapshot) if isinstance(snapshot, dict) else snapshot
+    payload_json, etag = _encode_published_snapshot(published)
     with ctx.metrics_cache_cond:
-        ctx.metrics_cache_payload = snapshot
+        ctx.metrics_cache_payload = published
+        ctx.metrics_cache_payload_json = payload_json
+        ctx.metrics_cache_etag = etag
         ctx.metrics_cache_seq = int(event_id or (ctx.metrics_cache_seq + 1))
         ctx.metrics_cache_cond.notify_all()
 
 
+def _encode_published_snapshot(snapshot: Any) -> tuple[bytes, str]:
+    """Return the snapshot's JSON bytes and their ETag, both empty when it cannot be encoded."""
+    payload_json = _encode_metrics_json(snapshot) if isinstance(snapshot, dict) else b""
+    etag = hashlib.blake2b(payload_json, digest_size=8).hexdigest() if payload_json else ""
+    return payload_json, etag
+
+
+def _encode_metrics_json(snapshot: dict[str, Any]) -> bytes:
+    try:
+        return json.dumps(snapshot, separators=(",", ":")).encode("utf-8")
+    except (TypeError, ValueError):
+        return b""
+
+
 def _metrics_interval_seconds(ctx: Any, snapshot: dict[str, Any] | None) -> float:
     if has_active_flask_app_clients(ctx):
         return float(getattr(ctx, "METRICS_COLLECT_INTERVAL_SECONDS", 1.0) or 1.0)
@@ -501,6 +552,23 @@ def collect_and_publish_metrics(ctx: Any) -> dict[str, Any] | None:
     return snapshot
 
 
+def refresh_metrics_snapshot(ctx: Any) -> dict[str, Any] | None:
+    """Collect and publish once for concurrent callers; late arrivals reuse the in-flight result."""
+    cond = ctx.metrics_cache_cond
+    with cond:
+        if getattr(ctx, "metrics_collecting_inflight", False):
+            cond.wait_for(lambda: not ctx.metrics_collecting_inflight, timeout=_METRICS_INFLIGHT_WAIT_SECONDS)
+            payload = ctx.metrics_cache_payload
+            return payload if isinstance(payload, dict) and payload else None
+        ctx.metrics_collecting_inflight = True
+    try:
+        return collect_and_publish_metrics(ctx)
+    finally:
+        with cond:
+            ctx.metrics_collecting_inflight = False
+            cond.notify_all()
+
+
 def metrics_collector_loop(ctx: Any) -> None:
     """Background metrics loop that idles when there are no consumers."""
     process_role = str(getattr(ctx, "PROCESS_ROLE", "all") or "all").strip().lower()
@@ -519,7 +587,7 @@ def metrics_collector_loop(ctx: Any) -> None:
                 _maybe_refresh_idle_storage_cache(ctx)
                 next_collect_at = time.monotonic()
                 continue
-        snapshot = collect_and_publish_metrics(ctx)
+        snapshot = refresh_metrics_snapshot(ctx)
         interval = _metrics_interval_seconds(ctx, snapshot)
         now_monotonic = time.monotonic()
         next_collect_at = max(next_collect_at + interval, now_monotonic)
@@ -531,18 +599,11 @@ def metrics_collector_loop(ctx: Any) -> None:
 
 def ensure_metrics_collector_started(ctx: Any) -> None:
     """Start metrics collector daemon once."""
-    if ctx.metrics_collector_started:
-        health = get_worker_health_snapshot().get("metrics_collector", {})
-        if isinstance(health, dict) and bool(health.get("running")):
-            return
-        ctx.metrics_collector_started = False
+    started = ctx.metrics_collector_started_event
+    if started.is_set() and is_worker_running("metrics_collector"):
+        return
     with ctx.metrics_collector_start_lock:
-        if ctx.metrics_collector_started:
-            health = get_worker_health_snapshot().get("metrics_collector", {})
-            if isinstance(health, dict) and bool(health.get("running")):
-                return
-            ctx.metrics_collector_started = False
-        if ctx.metrics_collector_started:
+        if started.is_set() and is_worker_running("metrics_collector"):
             return
         start_worker(
             ctx,
@@ -555,14 +616,24 @@ def ensure_metrics_collector_started(ctx: Any) -> None:
                 health_marker="metrics_collector",
             ),
         )
-        ctx.metrics_collector_started = True
+        started.set()
+
+
+def get_cached_dashboard_metrics_json(ctx: Any) -> tuple[bytes, int]:
+    """Return the last snapshot pre-encoded as JSON bytes with its cache sequence."""
+    with ctx.metrics_cache_cond:
+        payload_json = getattr(ctx, "metrics_cache_payload_json", b"")
+        if payload_json:
+            return payload_json, int(ctx.metrics_cache_seq)
+    return _encode_metrics_json(get_cached_dashboard_metrics(ctx)), 0
 
 
 def get_cached_dashboard_metrics(ctx: Any) -> dict[str, Any]:
     """Return last metrics snapshot, or a safe default payload."""
     with ctx.metrics_cache_cond:
-        if ctx.metrics_cache_payload:
-            return dict(ctx.metrics_cache_payload)
+        payload = ctx.metrics_cache_payload
+    if payload:
+        return dict(payload)
     now_display = datetime.now(tz=ctx.DISPLAY_TZ)
     server_time_text = now_display.strftime("%b %d, %Y %I:%M:%S %p %Z")
     server_time_epoch_ms = int(now_display.timestamp() * 1000)
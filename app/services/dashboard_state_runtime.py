@@ -1,5 +1,6 @@
 """Dashboard observed-state caching helpers."""
 import copy
+import os
 from pathlib import Path
 import threading
 import time
@@ -76,9 +77,16 @@ def invalidate_observed_state_cache(ctx: object = None) -> None:
 
 def get_backups_status(ctx: Any) -> str:
     """Return backup directory health and current zip count summary."""
-    if not ctx.BACKUP_DIR.exists() or not ctx.BACKUP_DIR.is_dir():
+    try:
+        with os.scandir(ctx.BACKUP_DIR) as entries:
+            zip_count = sum(
+                1 for entry in entries
+                if entry.name.endswith(".zip") and entry.is_file(follow_symlinks=False)
+            )
+    except (FileNotFoundError, NotADirectoryError):
         return "missing"
-    zip_count = sum(1 for _ in ctx.BACKUP_DIR.glob("*.zip"))
+    except OSError:
+        zip_count = 0
     return f"ready ({zip_count} zip files)"
 
 
@@ -1,16 +1,22 @@
 """Minecraft log-stream use cases."""
 
 from collections import deque
+import json
+import re
 import time
 from pathlib import Path
 from typing import Any
 
 from app.ports import ports
 from app.core import state_store as state_store_service
-from app.services.worker_scheduler import WorkerSpec, get_worker_health_snapshot, start_worker
+from app.services.worker_scheduler import WorkerSpec, is_worker_running, start_worker
 
 
 LogSourceSettings = dict[str, object]
+_RCON_NOISE_RE = re.compile(
+    r"thread rcon client|minecraft/rconclient.*shutting down|shutting down.*minecraft/rconclient",
+    re.IGNORECASE,
+)
 
 
 def _settings_path(value: object) -> Path:
@@ -49,12 +55,7 @@ def _minecraft_live_log_path(ctx: Any) -> Path:
 
 
 def is_rcon_noise_line(line: object) -> bool:
-    lower = str(line or "").lower()
-    if "thread rcon client" in lower:
-        return True
-    if "minecraft/rconclient" in lower and "shutting down" in lower:
-        return True
-    return False
+    return _RCON_NOISE_RE.search(line if isinstance(line, str) else str(line or "")) is not None
 
 
 def normalize_log_source(ctx: Any, source: object) -> str | None:
@@ -183,6 +184,12 @@ def _batch_payload(source: str, lines: list[str]) -> dict[str, object]:
     }
 
 
+def _batch_sse_frame(payload: dict[str, object]) -> bytes:
+    """Encode one batch as a complete SSE frame, shared by every subscriber."""
+    data = json.dumps(payload, ensure_ascii=True, separators=(",", ":"))
+    return b"event: batch\ndata: " + data.encode("ascii") + b"\n\n"
+
+
 def flush_log_stream_batch(ctx: Any, source: object, *, force: bool = False) -> bool:
     normalized = normalize_log_source(ctx, source)
     if normalized is None:
@@ -229,9 +236,11 @@ def flush_log_stream_batch(ctx: Any, source: object, *, force: bool = False) ->
             )
         except Exception:
             db_event_id = 0
+        frame = _batch_sse_frame(payload)
         with stream_state["cond"]:
             stream_state["seq"] = int(db_event_id or (stream_state["seq"] + 1))
-            stream_state["events"].append((stream_state["seq"], payload))
+            stream_state["event_seqs"].append(stream_state["seq"])
+            stream_state["event_frames"].append(frame)
             stream_state["cond"].notify_all()
     return True
 
@@ -572,18 +581,11 @@ def ensure_log_stream_fetcher_started(ctx: Any, source: object) -> None:
     if state is None:
         return
     marker = f"log_stream_fetcher_{normalized}"
-    if state["started"]:
-        health = get_worker_health_snapshot().get(marker, {})
-        if isinstance(health, dict) and bool(health.get("running")):
-            return
-        state["started"] = False
+    started = state["started_event"]
+    if started.is_set() and is_worker_running(marker):
+        return
     with state["lifecycle_lock"]:
-        if state["started"]:
-            health = get_worker_health_snapshot().get(marker, {})
-            if isinstance(health, dict) and bool(health.get("running")):
-                return
-            state["started"] = False
-        if state["started"]:
+        if started.is_set() and is_worker_running(marker):
             return
         start_worker(
             ctx,
@@ -593,10 +595,10 @@ def ensure_log_stream_fetcher_started(ctx: Any, source: object) -> None:
                 args=(ctx, normalized),
                 interval_source=getattr(ctx, "LOG_FETCHER_IDLE_SLEEP_SECONDS", None),
                 stop_signal_name=f"log_stream_fetcher_stop_event_{normalized}",
-                health_marker=f"log_stream_fetcher_{normalized}",
+                health_marker=marker,
             ),
         )
-        state["started"] = True
+        started.set()
 
 
 def increment_log_stream_clients(ctx: Any, source: object) -> None:
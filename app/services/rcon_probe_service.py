@@ -6,6 +6,23 @@ from typing import Any
 
 from app.ports import ports
 
+_STALE_PROBE_CACHE = (0.0, "unknown", "unknown")
+
+# ANSI escapes and Minecraft section-sign colour codes, stripped in one pass.
+_RCON_FORMATTING_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]|\u00a7.")
+_PLAYERS_THERE_ARE_RE = re.compile(r"There are\s+(\d+)\s+of a max of", re.IGNORECASE)
+_PLAYERS_NONE_RE = re.compile(r"\bno players online\b", re.IGNORECASE)
+_PLAYERS_COUNT_RE = re.compile(r"(\d+)\s+players?\s+online", re.IGNORECASE)
+_PLAYERS_LABEL_RE = re.compile(r"Players?\s+online:\s*(\d+)", re.IGNORECASE)
+# One pass over the tick output: a tick time in ms, a TPS value (which may
+# itself be followed by "ms"), or any bare number as a last-resort TPS.
+_TICK_RE = re.compile(
+    r"(?P<ms>[0-9]+(?:[.,][0-9]+)?)\s*ms"
+    r"|TPS[^0-9]*(?P<tps>[0-9]+(?:[.,][0-9]+)?)(?P<tps_ms>\s*ms)?"
+    r"|\b(?P<num>[0-9]+(?:[.,][0-9]+)?)\b",
+    re.IGNORECASE,
+)
+
 
 def is_rcon_startup_ready(ctx: Any, service_status: str | None = None) -> bool:
     if service_status is None:
@@ -31,34 +48,53 @@ def _mark_rcon_startup_ready(ctx: Any) -> None:
 
 
 def clean_rcon_output(text: object) -> str:
-    cleaned = str(text or "")
-    cleaned = re.sub(r"\x1b\[[0-9;]*[A-Za-z]", "", cleaned)
-    cleaned = re.sub(r"\u00a7.", "", cleaned)
-    return cleaned
+    return _RCON_FORMATTING_RE.sub("", str(text or ""))
+
+
+_RCON_PROPERTY_KEYS = frozenset({"enable-rcon", "rcon.password", "rcon.port"})
+
+
+def _read_rcon_properties(path: Any) -> dict[str, str] | None:
+    try:
+        text = path.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return None
+    if "rcon.password" not in text:
+        return None
+    kv = {}
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        key = key.strip()
+        if key not in _RCON_PROPERTY_KEYS:
+            continue
+        kv[key] = value.strip()
+        if len(kv) == len(_RCON_PROPERTY_KEYS):
+            break
+    return kv
 
 
 def refresh_rcon_config(ctx: Any) -> tuple[str | None, int | None, bool]:
     now = time.time()
+    # Fresh-cache hits skip the lock; the cache is replaced as one tuple, so a
+    # reader never sees a fresh timestamp paired with stale fields.
+    read_at, password, port, enabled = ctx.rcon_config_cache
+    if now - read_at < 60:
+        return password, port, enabled
     with ctx.rcon_config_lock:
-        if now - ctx.rcon_last_config_read_at < 60:
-            return ctx.rcon_cached_password, ctx.rcon_cached_port, ctx.rcon_cached_enabled
-        ctx.rcon_last_config_read_at = now
+        read_at, password, port, enabled = ctx.rcon_config_cache
+        if now - read_at < 60:
+            return password, port, enabled
         parsed_password = None
         parsed_port = None
         for path in ctx.SERVER_PROPERTIES_CANDIDATES:
             if not path.exists():
                 continue
-            try:
-                lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-            except OSError:
+            kv = _read_rcon_properties(path)
+            if kv is None:
                 continue
-            kv = {}
-            for raw in lines:
-                line = raw.strip()
-                if not line or line.startswith("#") or "=" not in line:
-                    continue
-                key, value = line.split("=", 1)
-                kv[key.strip()] = value.strip()
             if kv.get("enable-rcon", "").lower() == "false":
                 continue
             candidate_password = kv.get("rcon.password", "").strip()
@@ -70,14 +106,13 @@ def refresh_rcon_config(ctx: Any) -> tuple[str | None, int | None, bool]:
                 parsed_port = int(port_text)
             break
         if parsed_password:
-            ctx.rcon_cached_password = parsed_password
-            ctx.rcon_cached_enabled = True
+            password, enabled = parsed_password, True
             if parsed_port:
-                ctx.rcon_cached_port = parsed_port
+                port = parsed_port
         else:
-            ctx.rcon_cached_password = None
-            ctx.rcon_cached_enabled = False
-        return ctx.rcon_cached_password, ctx.rcon_cached_port, ctx.rcon_cached_enabled
+            password, enabled = None, False
+        ctx.rcon_config_cache = (now, password, port, enabled)
+        return password, port, enabled
 
 
 def is_rcon_enabled(ctx: Any) -> bool:
@@ -101,15 +136,15 @@ def parse_players_online(output: object) -> str | None:
     text = clean_rcon_output(output).strip()
     if not text:
         return None
-    match = re.search(r"There are\s+(\d+)\s+of a max of", text, re.IGNORECASE)
+    match = _PLAYERS_THERE_ARE_RE.search(text)
     if match:
         return match.group(1)
-    if re.search(r"\bno players online\b", text, re.IGNORECASE):
+    if _PLAYERS_NONE_RE.search(text):
         return "0"
-    match = re.search(r"(\d+)\s+players?\s+online", text, re.IGNORECASE)
+    match = _PLAYERS_COUNT_RE.search(text)
     if match:
         return match.group(1)
-    match = re.search(r"Players?\s+online:\s*(\d+)", text, re.IGNORECASE)
+    match = _PLAYERS_LABEL_RE.search(text)
     if match:
         return match.group(1)
     return None
@@ -126,30 +161,30 @@ def probe_tick_rate(ctx: Any) -> str | None:
     output = clean_rcon_output((result.stdout or "") + (result.stderr or "")).strip()
     if not output:
         return None
-    ms_match = re.search(r"([0-9]+(?:[.,][0-9]+)?)\s*ms", output, re.IGNORECASE)
-    if ms_match:
-        try:
-            ms_val = float(ms_match.group(1).replace(",", "."))
-            if ms_val > 0:
-                return f"{ms_val:.1f} ms"
-        except ValueError:
-            pass
-    match = re.search(r"TPS[^0-9]*([0-9]+(?:[.,][0-9]+)?)", output, re.IGNORECASE)
-    if match:
-        try:
-            tps = float(match.group(1).replace(",", "."))
-            if tps > 0:
-                return f"{(1000.0 / tps):.1f} ms"
-        except ValueError:
-            pass
-    match = re.search(r"\b([0-9]+(?:[.,][0-9]+)?)\b", output)
-    if match:
-        try:
-            tps = float(match.group(1).replace(",", "."))
-            if 0 < tps <= 30:
-                return f"{(1000.0 / tps):.1f} ms"
-        except ValueError:
-            pass
+    tick_ms = _tick_ms_from_output(output)
+    if tick_ms is None:
+        return None
+    return f"{tick_ms:.1f} ms"
+
+
+def _tick_ms_from_output(output: str) -> float | None:
+    tps = None
+    first_number = None
+    for match in _TICK_RE.finditer(output):
+        kind = match.lastgroup
+        value = float(match.group("tps" if kind == "tps_ms" else kind).replace(",", "."))
+        if kind in {"ms", "tps_ms"}:
+            if value > 0:
+                return value
+        elif kind == "tps":
+            if tps is None and value > 0:
+                tps = value
+        elif first_number is None:
+            first_number = value
+    if tps is not None:
+        return 1000.0 / tps
+    if first_number is not None and 0 < first_number <= 30:
+        return 1000.0 / first_number
     return None
 
 
@@ -168,16 +203,27 @@ def _probe_startup_readiness(ctx: Any) -> str | None:
     return "0"
 
 
-def probe_minecraft_runtime_metrics(ctx: Any, force: bool = False) -> tuple[str, str]:
-    service_status = ctx.get_status()
+def probe_minecraft_runtime_metrics(
+    ctx: Any,
+    force: bool = False,
+    service_status: str | None = None,
+) -> tuple[str, str]:
+    if service_status is None:
+        service_status = ctx.get_status()
     if service_status != "active":
         with ctx.mc_query_lock:
             ctx.mc_cached_players_online = "0" if service_status in ctx.OFF_STATES else "unknown"
             ctx.mc_cached_tick_rate = "--"
             ctx.mc_last_query_at = time.time()
+            ctx.mc_probe_cache = _STALE_PROBE_CACHE
         with ctx.rcon_startup_lock:
             ctx.rcon_startup_ready = False
         return ctx.mc_cached_players_online, ctx.mc_cached_tick_rate
+    if not force:
+        # Lock-free hit path: the tuple is replaced atomically after each probe.
+        probed_at, cached_players, cached_tick_rate = ctx.mc_probe_cache
+        if (time.monotonic() - probed_at) < ctx.MC_QUERY_INTERVAL_SECONDS:
+            return cached_players, cached_tick_rate
     now = time.time()
     startup_ready = is_rcon_startup_ready(ctx, service_status=service_status)
     startup_players_online = None
@@ -193,6 +239,7 @@ def probe_minecraft_runtime_metrics(ctx: Any, force: bool = False) -> tuple[str,
                 cached_players = str(ctx.mc_cached_players_online or "")
                 ctx.mc_cached_players_online = cached_players if cached_players.isdigit() else "0"
             ctx.mc_cached_tick_rate = "--"
+            ctx.mc_probe_cache = _STALE_PROBE_CACHE
         return ctx.mc_cached_players_online, ctx.mc_cached_tick_rate
     with ctx.mc_query_lock:
         probe_interval = ctx.MC_QUERY_INTERVAL_SECONDS
@@ -225,6 +272,7 @@ def probe_minecraft_runtime_metrics(ctx: Any, force: bool = False) -> tuple[str,
         ctx.mc_cached_players_online = players_online
         ctx.mc_cached_tick_rate = tick_rate
         ctx.mc_last_query_at = now
+        ctx.mc_probe_cache = (time.monotonic(), players_online, tick_rate)
         return ctx.mc_cached_players_online, ctx.mc_cached_tick_rate
 
 
@@ -4,7 +4,7 @@ import secrets
 from pathlib import Path
 from typing import Any, Callable
 
-from flask import request, session
+from flask import g, request, session
 
 from app.core.response_helpers import (
     backup_failed_response,
@@ -55,10 +55,16 @@ def build_request_bindings(
         return bound
 
     def _ensure_csrf_token() -> Any:
-        return ensure_csrf_token(session, lambda: secrets.token_urlsafe(32))
+        # The before-request hook resolves the token once; page renders and the
+        # CSRF check reuse it from g instead of reading the session again.
+        token = g.get("csrf_token")
+        if not token:
+            token = ensure_csrf_token(session, lambda: secrets.token_urlsafe(32))
+            g.csrf_token = token
+        return token
 
     def _is_csrf_valid() -> bool:
-        return is_csrf_valid(request, session)
+        return is_csrf_valid(request, session, expected=g.get("csrf_token"))
 
     def ensure_session_tracking_initialized() -> None:
         if session_state.initialized:
@@ -73,7 +79,12 @@ def build_request_bindings(
         return session_write_failed_response(request, status_state_note())
 
     def _is_ajax_request() -> bool:
-        return is_ajax_request(request)
+        # Error paths ask this several times per request; classify the headers once.
+        is_ajax = g.get("is_ajax")
+        if is_ajax is None:
+            is_ajax = is_ajax_request(request)
+            g.is_ajax = is_ajax
+        return bool(is_ajax)
 
     def _low_storage_blocked_response(message: object = None) -> Any:
         return low_storage_blocked_response(request, message or low_storage_error_message())
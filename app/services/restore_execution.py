@@ -406,7 +406,7 @@ def restore_world_backup(
             return fail(error_message)
         assert safe_name is not None
         assert source_entry is not None
-        if is_backup_running(ctx):
+        if is_backup_running(ctx, use_memo=False):
             return fail("Cannot restore while backup is running.")
 
         world_dir, props_path, props_text, old_level_name, error_message = _load_restore_context(ctx)
@@ -16,6 +16,11 @@ from app.ports import ports
 
 JsonDict = dict[str, object]
 
+# (state file path, monotonic time, running) for the last backup state read.
+# Replaced as one tuple so readers never need a lock.
+_BACKUP_STATE_MEMO: tuple[str, float, bool] = ("", 0.0, False)
+_BACKUP_STATE_MEMO_SECONDS = 0.25
+
 
 def run_elevated_command(ctx: Any, cmd: list[str] | tuple[str, ...]) -> Any:
     """Run a privileged command through the platform service adapter."""
@@ -64,6 +69,26 @@ def ensure_session_file(ctx: Any) -> bool:
         return False
 
 
+def read_session_file_text(ctx: Any) -> str | None:
+    """Return the stripped session file text, creating the file in the same open when missing."""
+    session_file = ctx.session_state.session_file
+    try:
+        fd = os.open(session_file, os.O_RDONLY | os.O_CREAT, 0o666)
+    except FileNotFoundError:
+        # Only the parent directory can be missing here.
+        return "" if ensure_session_file(ctx) else None
+    except OSError:
+        return None
+    try:
+        # The file holds one epoch timestamp; a short raw read covers it.
+        raw = os.read(fd, 256)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+    return raw.decode("utf-8", errors="replace").strip()
+
+
 def write_session_start_time(ctx: Any, timestamp: object = None) -> float | None:
     """Write session start epoch seconds and return the stored value."""
     if not ensure_session_file(ctx):
@@ -103,8 +128,12 @@ def reset_backup_schedule_state(ctx: Any) -> None:
         ctx.backup_state.periodic_runs = 0
 
 
-def is_backup_running(ctx: Any, include_run_lock: bool = True) -> bool:
-    """Return whether backup script reports active run via state file."""
+def is_backup_running(ctx: Any, include_run_lock: bool = True, use_memo: bool = True) -> bool:
+    """Return whether backup script reports active run via state file.
+
+    Display and metrics callers may take the briefly memoized answer; mutual-exclusion
+    guards pass ``use_memo=False`` so they always see the file's current state.
+    """
     if include_run_lock:
         backup_state = getattr(ctx, "backup_state", None)
         run_lock = getattr(backup_state, "run_lock", None)
@@ -117,13 +146,30 @@ def is_backup_running(ctx: Any, include_run_lock: bool = True) -> bool:
     state_file = getattr(ctx, "BACKUP_STATE_FILE", None)
     if not state_file:
         return False
+    global _BACKUP_STATE_MEMO
+    key = str(state_file)
+    memo_path, memo_at, memo_running = _BACKUP_STATE_MEMO
+    now = time.monotonic()
+    if use_memo and memo_path == key and (now - memo_at) < _BACKUP_STATE_MEMO_SECONDS:
+        return memo_running
+    running = _read_backup_state_flag(ctx, Path(state_file))
+    _BACKUP_STATE_MEMO = (key, now, running)
+    return running
+
+
+def _read_backup_state_flag(ctx: Any, state_path: Path) -> bool:
+    """Return whether the state file says "true", clearing it when stale."""
     try:
-        state_path = Path(state_file)
-        ports.filesystem.ensure_dir(state_path.parent)
-        raw = ports.filesystem.read_text(state_path, encoding="utf-8").strip().lower()
+        raw = ports.filesystem.read_text(state_path, encoding="utf-8")
+    except FileNotFoundError:
+        try:
+            ports.filesystem.ensure_dir(state_path.parent)
+        except OSError:
+            pass
+        return False
     except OSError:
         return False
-    if raw != "true":
+    if raw.strip().lower() != "true":
         return False
     stale_seconds = float(getattr(ctx, "BACKUP_STATE_STALE_SECONDS", 1200.0) or 1200.0)
     if stale_seconds > 0:
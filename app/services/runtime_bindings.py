@@ -5,6 +5,8 @@ from __future__ import annotations
 import re
 import time
 from typing import Any, Callable
+
+_PERCENT_RE = re.compile(r"\(([\d.]+)%\)")
 
 _DASHBOARD_FILE_METHODS = (
     "_mark_file_page_client_active",
@@ -79,9 +81,11 @@ _DASHBOARD_METRIC_METHODS = (
     "collect_dashboard_metrics",
     "_mark_home_page_client_active",
     "_collect_and_publish_metrics",
+    "_refresh_metrics_snapshot",
     "metrics_collector_loop",
     "ensure_metrics_collector_started",
     "get_cached_dashboard_metrics",
+    "get_cached_dashboard_metrics_json",
 )
 _DASHBOARD_OPERATION_METHODS = (
     "get_consistency_report",
@@ -160,7 +164,7 @@ def build_runtime_bindings(
 
     def get_storage_used_percent(storage_usage_text: str | None = None) -> float | None:
         usage_text = storage_usage_text if storage_usage_text is not None else ns["get_storage_usage"]()
-        match = re.search(r"\(([\d.]+)%\)", usage_text or "")
+        match = _PERCENT_RE.search(usage_text or "")
         if not match:
             return None
         try:
@@ -4,9 +4,45 @@ from typing import Any
 
 from app.services import backup_scheduler_state as backup_scheduler_state_service
 from app.services import notification_service as notification_service
+from app.services import status_cache as status_cache_service
+from app.services.restore_workflow_helpers import read_session_file_text
 from app.services.worker_scheduler import WorkerSpec, get_worker_health_snapshot, start_worker
 
 
+# While the service stays off nothing but a status transition matters to the
+# watchers. In-process transitions, and any change another caller's status
+# refresh observes (crash, external start/stop), wake them directly, so each
+# unchanged poll stretches the next fallback wait by this factor up to the
+# configured *_MAX_SECONDS.
+_IDLE_BACKOFF_FACTOR = 1.5
+# Upper bound on one backup watcher wait while active, as a multiple of
+# BACKUP_WATCH_INTERVAL_ACTIVE_SECONDS; it normally wakes at the next due run.
+_BACKUP_ACTIVE_WAIT_MULTIPLIER = 4
+
+
+def _status_generation(ctx: Any) -> int:
+    generation_ref = getattr(ctx, "service_status_generation_ref", None)
+    return int(generation_ref[0]) if generation_ref else 0
+
+
+def _wait_for_status_change(ctx: Any, seen_generation: int, timeout: float) -> None:
+    """Sleep up to ``timeout`` seconds, returning early on a service status transition."""
+    status_cache_service.wait_for_status_change(
+        getattr(ctx, "service_status_changed_cond", None),
+        getattr(ctx, "service_status_generation_ref", None),
+        seen_generation,
+        timeout,
+    )
+
+
+def _backoff_interval(base: float, idle_ticks: int, ceiling: float) -> float:
+    """Return ``base`` grown by ``_IDLE_BACKOFF_FACTOR`` per idle tick, capped at ``ceiling``."""
+    base = float(base)
+    if idle_ticks <= 0:
+        return base
+    return min(base * (_IDLE_BACKOFF_FACTOR ** min(idle_ticks, 32)), max(base, float(ceiling)))
+
+
 def format_countdown(seconds: float) -> str:
     """Format remaining seconds as ``MM:SS`` with floor at zero."""
     if seconds <= 0:
@@ -29,48 +65,68 @@ def get_idle_countdown(
     if service_status != "active" or players_online != "0":
         return "--:--"
     with ctx.idle_lock:
-        if ctx.idle_zero_players_since is None:
-            return format_countdown(ctx.IDLE_ZERO_PLAYERS_SECONDS)
-        elapsed = time.time() - ctx.idle_zero_players_since
-    remaining = ctx.IDLE_ZERO_PLAYERS_SECONDS - elapsed
-    return format_countdown(remaining)
+        deadline = ctx.idle_deadline_monotonic
+    if deadline is None:
+        return format_countdown(ctx.IDLE_ZERO_PLAYERS_SECONDS)
+    return format_countdown(deadline - time.monotonic())
 
 
 def idle_player_watcher(ctx: Any) -> None:
     """Background loop that triggers auto-stop after sustained zero players."""
+    last_status = None
+    idle_ticks = 0
     while True:
         should_auto_stop = False
+        seen_generation = _status_generation(ctx)
         try:
             service_status = ctx.get_status()
-            players_online = ctx.get_players_online()
-            now = time.time()
-
-            # Decide shutdown while holding the countdown lock, but run the stop flow
-            # outside the lock because publishing metrics reads the same countdown state.
-            with ctx.idle_lock:
-                if service_status == "active" and players_online == "0":
-                    if ctx.idle_zero_players_since is None:
-                        ctx.idle_zero_players_since = now
-                    elif now - ctx.idle_zero_players_since >= ctx.IDLE_ZERO_PLAYERS_SECONDS:
-                        intent_getter = getattr(ctx, "get_service_status_intent", None)
-                        intent = ""
-                        if callable(intent_getter):
-                            try:
-                                intent = str(intent_getter() or "").strip().lower()
-                            except Exception:
-                                intent = ""
-                        should_auto_stop = intent != "shutting"
-                        # Keep the countdown pinned at zero until service state leaves active.
-                        ctx.idle_zero_players_since = now - ctx.IDLE_ZERO_PLAYERS_SECONDS
-                else:
-                    ctx.idle_zero_players_since = None
-            if should_auto_stop:
-                ctx.stop_server_automatically()
+            # Player count only matters while active; skip the RCON probe otherwise.
+            players_online = ctx.get_players_online() if service_status == "active" else ""
         except Exception as exc:
+            # Leave the countdown untouched when the probes fail and retry soon.
             ctx.log_mcweb_exception("idle_player_watcher", exc)
-
-        interval = ctx.IDLE_CHECK_INTERVAL_ACTIVE_SECONDS if ctx.get_status() == "active" else ctx.IDLE_CHECK_INTERVAL_OFF_SECONDS
-        time.sleep(interval)
+            _wait_for_status_change(ctx, seen_generation, ctx.IDLE_CHECK_INTERVAL_ACTIVE_SECONDS)
+            continue
+        now = time.monotonic()
+
+        # Decide shutdown while holding the countdown lock, but run the stop flow
+        # outside the lock because publishing metrics reads the same countdown state.
+        with ctx.idle_lock:
+            if service_status == "active" and players_online == "0":
+                if ctx.idle_deadline_monotonic is None:
+                    ctx.idle_deadline_monotonic = now + ctx.IDLE_ZERO_PLAYERS_SECONDS
+                elif now >= ctx.idle_deadline_monotonic:
+                    intent_getter = getattr(ctx, "get_service_status_intent", None)
+                    intent = ""
+                    if callable(intent_getter):
+                        try:
+                            intent = str(intent_getter() or "").strip().lower()
+                        except Exception:
+                            intent = ""
+                    should_auto_stop = intent != "shutting"
+                    # Keep the countdown pinned at zero until service state leaves active.
+                    ctx.idle_deadline_monotonic = now
+            else:
+                ctx.idle_deadline_monotonic = None
+        if should_auto_stop:
+            try:
+                ctx.stop_server_automatically()
+            except Exception as exc:
+                ctx.log_mcweb_exception("idle_player_watcher/auto_stop", exc)
+
+        # Active servers keep the fixed cadence so the zero-player countdown stays accurate.
+        if service_status == "active":
+            idle_ticks = 0
+            interval = ctx.IDLE_CHECK_INTERVAL_ACTIVE_SECONDS
+        else:
+            idle_ticks = idle_ticks + 1 if service_status == last_status else 0
+            interval = _backoff_interval(
+                ctx.IDLE_CHECK_INTERVAL_OFF_SECONDS,
+                idle_ticks,
+                getattr(ctx, "IDLE_CHECK_INTERVAL_MAX_SECONDS", ctx.IDLE_CHECK_INTERVAL_OFF_SECONDS),
+            )
+        last_status = service_status
+        _wait_for_status_change(ctx, seen_generation, interval)
 
 
 def start_idle_player_watcher(ctx: Any) -> None:
@@ -92,75 +148,109 @@ def start_idle_player_watcher(ctx: Any) -> None:
     )
 
 
+def _backup_watch_wait_seconds(
+    ctx: Any,
+    service_status: str,
+    session_started_at: float | None,
+    idle_ticks: int = 0,
+) -> float:
+    """Return how long the backup watcher may sleep before the next check is useful."""
+    active_interval = float(ctx.BACKUP_WATCH_INTERVAL_ACTIVE_SECONDS)
+    if service_status != "active":
+        return _backoff_interval(
+            ctx.BACKUP_WATCH_INTERVAL_OFF_SECONDS,
+            idle_ticks,
+            getattr(ctx, "BACKUP_WATCH_INTERVAL_MAX_SECONDS", ctx.BACKUP_WATCH_INTERVAL_OFF_SECONDS),
+        )
+    interval_seconds = float(getattr(ctx, "BACKUP_INTERVAL_SECONDS", 0) or 0)
+    if session_started_at is None or interval_seconds <= 0:
+        return active_interval
+    with ctx.backup_state.lock:
+        periodic_runs = ctx.backup_state.periodic_runs
+    until_due = session_started_at + (periodic_runs + 1) * interval_seconds - time.time()
+    if until_due < 1.0:
+        # Overdue means the last attempt failed; retry at the normal cadence.
+        return active_interval
+    return min(until_due, active_interval * _BACKUP_ACTIVE_WAIT_MULTIPLIER)
+
+
 def backup_session_watcher(ctx: Any) -> None:
     """Background loop that triggers periodic and session-end backups."""
+    last_status = None
+    idle_ticks = 0
     while True:
+        seen_generation = _status_generation(ctx)
+        backup_state = ctx.backup_state
+        now = time.time()
         try:
-            backup_state = ctx.backup_state
-            now = time.time()
             service_status = ctx.get_status()
-            is_running = service_status == "active"
-            is_off = service_status in ("inactive", "failed")
-
-            should_run_periodic_backup = False
-            should_run_shutdown_backup = False
-            periodic_due_runs = 0
-            due_runs = 0
-            missed_runs = 0
-            should_notify_missed = False
-            interval_seconds = int(getattr(ctx, "BACKUP_INTERVAL_SECONDS", 0) or 0)
-
             session_started_at = ctx.read_session_start_time()
-
-            # Evaluate and mutate backup scheduling state atomically.
-            with backup_state.lock:
-                if is_running:
-                    if session_started_at is not None:
-                        due_runs = int(max(0, now - session_started_at) // ctx.BACKUP_INTERVAL_SECONDS)
-                        if due_runs > backup_state.periodic_runs:
-                            should_run_periodic_backup = True
-                            periodic_due_runs = due_runs
-                            missed_runs = max(0, due_runs - backup_state.periodic_runs - 1)
-                            last_missed_due_runs = int(getattr(backup_state, "last_missed_due_runs", 0) or 0)
-                            if missed_runs > 0 and due_runs > last_missed_due_runs:
-                                backup_state.last_missed_due_runs = due_runs
-                                should_notify_missed = True
-                elif is_off and session_started_at is not None:
-                    should_run_shutdown_backup = True
-
-            if should_notify_missed and missed_runs > 0:
-                try:
-                    backup_scheduler_state_service.record_missed_backup(
-                        ctx,
-                        count=missed_runs,
-                        reason="interval_gap",
-                        due_runs=due_runs,
-                        interval_seconds=interval_seconds,
-                    )
-                except Exception as exc:
-                    ctx.log_mcweb_exception("backup_missed_record", exc)
-                try:
-                    plural = "run" if missed_runs == 1 else "runs"
-                    notification_service.publish_ui_notification(
-                        ctx,
-                        {
-                            "code": "backup_missed",
-                            "kind": "warning",
-                            "title": "Backup Missed",
-                            "message": f"Backup schedule missed {missed_runs} {plural}. Run a backup now or review backups.",
-                            "missed_runs": missed_runs,
-                            "prompt": {
-                                "actions": [
-                                    {"label": "Run Backup", "action": "run_backup", "style": "primary"},
-                                    {"label": "Open Backups", "action": "open_backups", "style": "secondary"},
-                                    {"label": "Dismiss", "action": "dismiss"},
-                                ]
-                            },
+        except Exception as exc:
+            # Skip this pass without touching schedule state when the probes fail.
+            ctx.log_mcweb_exception("backup_session_watcher", exc)
+            _wait_for_status_change(ctx, seen_generation, ctx.BACKUP_WATCH_INTERVAL_ACTIVE_SECONDS)
+            continue
+        is_running = service_status == "active"
+        is_off = service_status in ("inactive", "failed")
+
+        should_run_periodic_backup = False
+        should_run_shutdown_backup = False
+        periodic_due_runs = 0
+        due_runs = 0
+        missed_runs = 0
+        should_notify_missed = False
+        interval_seconds = int(getattr(ctx, "BACKUP_INTERVAL_SECONDS", 0) or 0)
+
+        # Evaluate and mutate backup scheduling state atomically.
+        with backup_state.lock:
+            if is_running:
+                if session_started_at is not None:
+                    due_runs = int(max(0, now - session_started_at) // ctx.BACKUP_INTERVAL_SECONDS)
+                    if due_runs > backup_state.periodic_runs:
+                        should_run_periodic_backup = True
+                        periodic_due_runs = due_runs
+                        missed_runs = max(0, due_runs - backup_state.periodic_runs - 1)
+                        last_missed_due_runs = int(getattr(backup_state, "last_missed_due_runs", 0) or 0)
+                        if missed_runs > 0 and due_runs > last_missed_due_runs:
+                            backup_state.last_missed_due_runs = due_runs
+                            should_notify_missed = True
+            elif is_off and session_started_at is not None:
+                should_run_shutdown_backup = True
+
+        if should_notify_missed and missed_runs > 0:
+            try:
+                backup_scheduler_state_service.record_missed_backup(
+                    ctx,
+                    count=missed_runs,
+                    reason="interval_gap",
+                    due_runs=due_runs,
+                    interval_seconds=interval_seconds,
+                )
+            except Exception as exc:
+                ctx.log_mcweb_exception("backup_missed_record", exc)
+            try:
+                plural = "run" if missed_runs == 1 else "runs"
+                notification_service.publish_ui_notification(
+                    ctx,
+                    {
+                        "code": "backup_missed",
+                        "kind": "warning",
+                        "title": "Backup Missed",
+                        "message": f"Backup schedule missed {missed_runs} {plural}. Run a backup now or review backups.",
+                        "missed_runs": missed_runs,
+                        "prompt": {
+                            "actions": [
+                                {"label": "Run Backup", "action": "run_backup", "style": "primary"},
+                                {"label": "Open Backups", "action": "open_backups", "style": "secondary"},
+                                {"label": "Dismiss", "action": "dismiss"},
+                            ]
                         },
-                    )
-                except Exception as exc:
-                    ctx.log_mcweb_exception("backup_missed_notify", exc)
+                    },
+                )
+            except Exception as exc:
+                ctx.log_mcweb_exception("backup_missed_notify", exc)
 
+        try:
             if should_run_periodic_backup:
                 if ctx.run_backup_script(count_skip_as_success=False, trigger="auto"):
                     with backup_state.lock:
@@ -173,10 +263,20 @@ def backup_session_watcher(ctx: Any) -> None:
                         backup_state.periodic_runs = 0
                         backup_state.last_missed_due_runs = 0
         except Exception as exc:
-            ctx.log_mcweb_exception("backup_session_watcher", exc)
-
-        interval = ctx.BACKUP_WATCH_INTERVAL_ACTIVE_SECONDS if ctx.get_status() == "active" else ctx.BACKUP_WATCH_INTERVAL_OFF_SECONDS
-        time.sleep(interval)
+            ctx.log_mcweb_exception("backup_session_watcher/run", exc)
+
+        # Back off only while off with no session-end backup still pending.
+        if service_status != "active" and service_status == last_status and session_started_at is None:
+            idle_ticks += 1
+        else:
+            idle_ticks = 0
+        last_status = service_status
+        try:
+            interval = _backup_watch_wait_seconds(ctx, service_status, session_started_at, idle_ticks)
+        except Exception as exc:
+            ctx.log_mcweb_exception("backup_session_watcher/wait", exc)
+            interval = ctx.BACKUP_WATCH_INTERVAL_ACTIVE_SECONDS
+        _wait_for_status_change(ctx, seen_generation, interval)
 
 
 def start_backup_session_watcher(ctx: Any) -> None:
@@ -228,6 +328,7 @@ def _run_low_storage_emergency_shutdown(ctx: Any) -> None:
 def storage_safety_watcher(ctx: Any) -> None:
     """Trigger emergency shutdown workflow when storage stays below safe threshold."""
     while True:
+        service_status = ""
         try:
             service_status = ctx.get_status()
             guard = getattr(ctx, "storage_guard", None)
@@ -274,7 +375,7 @@ def storage_safety_watcher(ctx: Any) -> None:
 
         interval = (
             ctx.STORAGE_SAFETY_CHECK_INTERVAL_ACTIVE_SECONDS
-            if ctx.get_status() == "active"
+            if service_status == "active"
             else ctx.STORAGE_SAFETY_CHECK_INTERVAL_OFF_SECONDS
         )
         time.sleep(interval)
@@ -308,7 +409,7 @@ def ensure_session_watchers_started(ctx: Any) -> None:
 
 def initialize_session_tracking(ctx: Any) -> None:
     """Initialize session file and periodic backup counters on process startup."""
-    ctx.ensure_session_file()
+    # read_session_start_time creates a missing session file itself.
     backup_state = ctx.backup_state
     service_status = ctx.get_status()
     session_start = ctx.read_session_start_time()
@@ -331,9 +432,9 @@ def status_state_note(ctx: Any) -> str:
     """Return compact status note for session-state related error responses."""
     try:
         service_status = ctx.get_status()
-        session_raw = ""
-        if ctx.ensure_session_file():
-            session_raw = ctx.session_state.session_file.read_text(encoding="utf-8").strip()
+        session_raw = read_session_file_text(ctx)
+        if session_raw is None:
+            return f"service={service_status}, session_file=unreadable"
         return f"service={service_status}, session_file={'<empty>' if not session_raw else session_raw}"
     except Exception as exc:
         ctx.log_mcweb_exception("_status_state_note", exc)
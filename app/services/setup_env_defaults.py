@@ -14,10 +14,12 @@ ENV_DEFAULTS = {
     "BACKUP_INTERVAL_HOURS": "3",
     "BACKUP_WATCH_INTERVAL_ACTIVE_SECONDS": "15",
     "BACKUP_WATCH_INTERVAL_OFF_SECONDS": "45",
+    "BACKUP_WATCH_INTERVAL_MAX_SECONDS": "180",
     "IDLE_ZERO_PLAYERS_SECONDS": "180",
     "IDLE_CHECK_INTERVAL_SECONDS": "5",
     "IDLE_CHECK_INTERVAL_ACTIVE_SECONDS": "5",
     "IDLE_CHECK_INTERVAL_OFF_SECONDS": "15",
+    "IDLE_CHECK_INTERVAL_MAX_SECONDS": "60",
     "CRASH_STOP_GRACE_SECONDS": "15",
     "MC_QUERY_INTERVAL_SECONDS": "3",
     "METRICS_COLLECT_INTERVAL_SECONDS": "1",
@@ -1,5 +1,6 @@
 ﻿"""Start/session control-plane use cases."""
 
+import os
 import time
 from types import SimpleNamespace
 from typing import Any, cast
@@ -20,6 +21,10 @@ _password_throttle_service = cast(Any, password_throttle_service)
 _ensure_session_file = cast(Any, ensure_session_file)
 _ensure_startup_rcon_settings = cast(Any, ensure_startup_rcon_settings)
 
+# (session file path, st_mtime_ns, st_size, parsed start time) for the last read.
+# Replaced as one tuple so readers never need a lock.
+_SESSION_START_MEMO: tuple[str, int, int, float | None] = ("", -1, -1, None)
+
 
 def set_service_status_intent(ctx: Any, intent: object) -> None:
     normalized_intent = str(intent or "").strip().lower()
@@ -126,12 +131,29 @@ def validate_superadmin_password(ctx: Any, sudo_password: object) -> bool:
 
 
 def read_session_start_time(ctx: Any) -> float | None:
-    if not _ensure_session_file(ctx):
+    global _SESSION_START_MEMO
+    session_file = ctx.session_state.session_file
+    try:
+        st = os.stat(session_file)
+    except FileNotFoundError:
+        _ensure_session_file(ctx)
+        return None
+    except OSError:
         return None
+    key = str(session_file)
+    memo_path, memo_mtime_ns, memo_size, memo_value = _SESSION_START_MEMO
+    if memo_path == key and memo_mtime_ns == st.st_mtime_ns and memo_size == st.st_size:
+        return memo_value
     try:
-        raw = ctx.session_state.session_file.read_text(encoding="utf-8").strip()
+        raw = session_file.read_text(encoding="utf-8").strip()
     except OSError:
         return None
+    value = _parse_session_start_time(raw)
+    _SESSION_START_MEMO = (key, st.st_mtime_ns, st.st_size, value)
+    return value
+
+
+def _parse_session_start_time(raw: str) -> float | None:
     if not raw:
         return None
     try:
@@ -182,10 +204,10 @@ def start_service_non_blocking(ctx: Any, timeout: int = 12) -> dict[str, object]
             raise
         return {"ok": False, "message": "Failed to start service: timed out issuing non-blocking start."}
     if result.returncode != 0:
-        detail = ((result.stderr or "") + "\n" + (result.stdout or "")).strip()
+        detail = ((result.stderr or "")[:400] + "\n" + (result.stdout or "")[:400]).strip()[:400]
         message = "Failed to start service."
         if detail:
-            message = f"Failed to start service: {detail[:400]}"
+            message = f"Failed to start service: {detail}"
         return {"ok": False, "message": message}
     ctx.invalidate_status_cache()
     return {"ok": True, "message": ""}
@@ -1,10 +1,32 @@
 """Service status cache helpers."""
 import time
 from collections.abc import Callable
-from threading import Lock
+from threading import Condition, Lock
 from typing import Any
 from app.ports import ports
 
+# Serializes cache refreshes so callers arriving together on an expired
+# entry share one service query instead of each spawning their own.
+_REFRESH_LOCK = Lock()
+
+
+def _cached_status(
+    cache_value_ref: list[str],
+    cache_at_ref: list[float],
+    active_ttl_seconds: float,
+    off_ttl_seconds: float,
+    now: float,
+) -> str:
+    # Lock-free read: each slot read is atomic. A read racing a refresh can at
+    # worst return the value being replaced, as if it had run a moment earlier.
+    cached = cache_value_ref[0]
+    cached_at = cache_at_ref[0]
+    if cached:
+        ttl = active_ttl_seconds if cached == "active" else off_ttl_seconds
+        if ttl > 0 and (now - cached_at) <= ttl:
+            return cached
+    return ""
+
 
 def get_status(
     *,
@@ -18,37 +40,44 @@ def get_status(
     minecraft_root: Any,
     log_action: Callable[..., Any],
     log_exception: Callable[..., Any],
+    changed_cond: Condition | None = None,
+    generation_ref: list[int] | None = None,
 ) -> str:
         # Return cached or freshly queried runtime service status.
-    now = time.time()
-    with cache_lock:
-        cached = cache_value_ref[0]
-        cached_at = cache_at_ref[0]
+    cached = _cached_status(cache_value_ref, cache_at_ref, active_ttl_seconds, off_ttl_seconds, time.monotonic())
     if cached:
-        ttl = active_ttl_seconds if cached == "active" else off_ttl_seconds
-        if ttl > 0 and (now - cached_at) <= ttl:
-            return cached
+        return cached
 
-    try:
-        result = ports.service_control.service_is_active(
-            service,
-            timeout=timeout_seconds,
-            minecraft_root=minecraft_root,
-        )
-        status = result.stdout.strip() or "unknown"
-    except Exception as exc:
-        if ports.service_control.is_timeout_error(exc):
-            log_action(
-                "status-timeout",
-                command=f"service_is_active {service}",
-                rejection_message=f"Timed out after {timeout_seconds:.1f}s.",
+    with _REFRESH_LOCK:
+        now = time.monotonic()
+        cached = _cached_status(cache_value_ref, cache_at_ref, active_ttl_seconds, off_ttl_seconds, now)
+        if cached:
+            return cached
+        try:
+            result = ports.service_control.service_is_active(
+                service,
+                timeout=timeout_seconds,
+                minecraft_root=minecraft_root,
             )
-        else:
-            log_exception("get_status", exc)
-        status = "unknown"
-    with cache_lock:
-        cache_value_ref[0] = status
-        cache_at_ref[0] = now
+            status = result.stdout.strip() or "unknown"
+        except Exception as exc:
+            if ports.service_control.is_timeout_error(exc):
+                log_action(
+                    "status-timeout",
+                    command=f"service_is_active {service}",
+                    rejection_message=f"Timed out after {timeout_seconds:.1f}s.",
+                )
+            else:
+                log_exception("get_status", exc)
+            status = "unknown"
+        with cache_lock:
+            previous = cache_value_ref[0]
+            cache_value_ref[0] = status
+            cache_at_ref[0] = now
+        # Crashes and external start/stop only show up here. An empty previous
+        # value means the cache was invalidated, which already notified.
+        if previous and status != previous and changed_cond is not None and generation_ref is not None:
+            notify_status_changed(changed_cond, generation_ref)
     return status
 
 
@@ -58,3 +87,24 @@ def invalidate_status_cache(cache_lock: Lock, cache_value_ref: list[str], cache_
         cache_value_ref[0] = ""
         cache_at_ref[0] = 0.0
 
+
+def notify_status_changed(changed_cond: Condition, generation_ref: list[int]) -> None:
+    """Bump the status generation and wake watchers blocked in ``wait_for_status_change``."""
+    with changed_cond:
+        generation_ref[0] += 1
+        changed_cond.notify_all()
+
+
+def wait_for_status_change(
+    changed_cond: Condition | None,
+    generation_ref: list[int] | None,
+    seen_generation: int,
+    timeout: float,
+) -> None:
+    """Block until the status generation moves past ``seen_generation`` or ``timeout`` elapses."""
+    if changed_cond is None or generation_ref is None:
+        time.sleep(timeout)
+        return
+    with changed_cond:
+        changed_cond.wait_for(lambda: generation_ref[0] != seen_generation, timeout=timeout)
+
@@ -4,6 +4,13 @@ from __future__ import annotations
 
 from typing import Any
 
+_SERVICE_STATUS_CLASSES = {
+    "Running": "stat-green",
+    "Starting": "stat-yellow",
+    "Shutting Down": "stat-orange",
+    "Crashed": "stat-red",
+}
+
 
 def _players_known(players_online: Any) -> bool:
     return isinstance(players_online, str) and players_online.isdigit()
@@ -45,12 +52,4 @@ def get_service_status_display(ctx: Any, service_status: Any, players_online: An
 
 
 def get_service_status_class(service_status_display: str) -> str:
-    if service_status_display == "Running":
-        return "stat-green"
-    if service_status_display == "Starting":
-        return "stat-yellow"
-    if service_status_display == "Shutting Down":
-        return "stat-orange"
-    if service_status_display == "Crashed":
-        return "stat-red"
-    return "stat-red"
+    return _SERVICE_STATUS_CLASSES.get(service_status_display, "stat-red")
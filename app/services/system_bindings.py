@@ -38,6 +38,8 @@ def build_system_bindings(
             minecraft_root=_value("MINECRAFT_ROOT_DIR"),
             log_action=_value("log_mcweb_log"),
             log_exception=_value("log_mcweb_exception"),
+            changed_cond=_value("service_status_changed_cond"),
+            generation_ref=_value("service_status_generation_ref"),
         )
 
     def invalidate_status_cache() -> None:
@@ -46,6 +48,12 @@ def build_system_bindings(
             ns["service_status_cache_value_ref"],
             ns["service_status_cache_at_ref"],
         )
+        # In-process start/stop/readiness transitions invalidate the cache and wake
+        # watchers here; get_status wakes them for transitions it observes itself.
+        status_cache_service.notify_status_changed(
+            ns["service_status_changed_cond"],
+            ns["service_status_generation_ref"],
+        )
 
     def _load_backup_log_cache_from_disk() -> Any:
         return dashboard_log_runtime_service.load_backup_log_cache_from_disk(ns["STATE"])
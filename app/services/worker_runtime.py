@@ -197,7 +197,7 @@ def _execute_backup(ctx: Any, op_id: str) -> None:
     ok = ctx.run_backup_script(trigger="manual")
     if not ok:
         detail = ""
-        with ctx.backup_state.lock:
+        with ctx.backup_state.error_lock:
             detail = str(ctx.backup_state.last_error or "")
         message = f"Backup failed: {detail}" if detail else "Backup failed."
         _fail_operation(
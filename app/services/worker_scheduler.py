@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 import threading
 import time
@@ -27,6 +28,8 @@ class WorkerSpec:
 
 _REGISTRY_LOCK = threading.Lock()
 _WORKERS: dict[str, dict[str, Any]] = {}
+_PROBE_POOL_MAX_WORKERS = 4
+_PROBE_POOL: ThreadPoolExecutor | None = None
 
 
 def _health_name(spec: WorkerSpec) -> str:
@@ -62,6 +65,13 @@ def get_worker_health_snapshot() -> dict[str, dict[str, Any]]:
         return {name: dict(payload) for name, payload in _WORKERS.items() if isinstance(payload, dict)}
 
 
+def is_worker_running(marker: str) -> bool:
+    """Return one worker's running flag without copying the whole registry."""
+    # Single dict lookups are atomic; the registry lock only guards whole-record updates.
+    record = _WORKERS.get(marker)
+    return isinstance(record, dict) and bool(record.get("running"))
+
+
 def _resolve_stop_event(ctx: Any, spec: WorkerSpec) -> threading.Event | None:
     name = str(spec.stop_signal_name or "").strip()
     if not name:
@@ -124,6 +134,21 @@ def start_worker(
     return thread
 
 
+def submit_probe(target: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """Run one short blocking probe on the shared probe pool and return its future."""
+    global _PROBE_POOL
+    pool = _PROBE_POOL
+    if pool is None:
+        with _REGISTRY_LOCK:
+            if _PROBE_POOL is None:
+                _PROBE_POOL = ThreadPoolExecutor(
+                    max_workers=_PROBE_POOL_MAX_WORKERS,
+                    thread_name_prefix="mcweb-probe",
+                )
+            pool = _PROBE_POOL
+    return pool.submit(target, *args, **kwargs)
+
+
 def start_detached(
     *,
     target: Callable[..., Any],
@@ -9,10 +9,13 @@ from app.state.contexts import ConfigContext, RuntimeContext, ServicePorts, Unif
 @dataclass
 class BackupState:
     """Mutable backup execution state shared by control and watcher flows."""
+    # Guards the periodic-run counters only.
     lock: Any
     run_lock: Any
     periodic_runs: int
     last_error: str
+    # Guards last_error so failure reporting never waits on the scheduler.
+    error_lock: Any
 
 
 @dataclass
@@ -29,10 +32,12 @@ _STATE_CORE_KEYS = (
     "BACKUP_LOG_FILE",
     "BACKUP_SCRIPT",
     "BACKUP_STATE_FILE",
+    "BACKUP_DOWNLOAD_ACCEL_PREFIX",
     "RESTORE_LOG_FILE",
     "APP_STATE_DB_PATH",
     "BACKUP_WATCH_INTERVAL_ACTIVE_SECONDS",
     "BACKUP_WATCH_INTERVAL_OFF_SECONDS",
+    "BACKUP_WATCH_INTERVAL_MAX_SECONDS",
     "BACKUP_WARNING_TTL_SECONDS",
     "CRASH_REPORTS_DIR",
     "CRASH_STOP_GRACE_SECONDS",
@@ -50,6 +55,7 @@ _STATE_CORE_KEYS = (
     "HOME_PAGE_HEARTBEAT_INTERVAL_MS",
     "IDLE_CHECK_INTERVAL_ACTIVE_SECONDS",
     "IDLE_CHECK_INTERVAL_OFF_SECONDS",
+    "IDLE_CHECK_INTERVAL_MAX_SECONDS",
     "IDLE_ZERO_PLAYERS_SECONDS",
     "LOG_FETCHER_IDLE_SLEEP_SECONDS",
     "LOG_FETCHER_IDLE_POLL_SECONDS",
@@ -131,6 +137,7 @@ _STATE_BINDING_KEYS = (
     "_mark_file_page_client_active",
     "_mark_home_page_client_active",
     "_collect_and_publish_metrics",
+    "_refresh_metrics_snapshot",
     "_ok_response",
     "_low_storage_blocked_response",
     "_password_rejected_response",
@@ -169,6 +176,7 @@ _STATE_BINDING_KEYS = (
     "is_backup_running",
     "get_backup_warning_state",
     "get_cached_dashboard_metrics",
+    "get_cached_dashboard_metrics_json",
     "get_observed_state",
     "get_consistency_report",
     "get_cached_file_page_items",
@@ -194,7 +202,7 @@ _STATE_BINDING_KEYS = (
     "home_page_last_seen",
     "idle_lock",
     "idle_player_watcher",
-    "idle_zero_players_since",
+    "idle_deadline_monotonic",
     "invalidate_status_cache",
     "is_rcon_enabled",
     "is_rcon_startup_ready",
@@ -205,27 +213,28 @@ _STATE_BINDING_KEYS = (
     "mc_cached_players_online",
     "mc_cached_tick_rate",
     "mc_last_query_at",
+    "mc_probe_cache",
     "mc_query_lock",
     "mcweb_log_cache_lines",
     "mcweb_log_cache_loaded",
     "mcweb_log_cache_lock",
     "mcweb_log_cache_mtime_ns",
     "metrics_cache_cond",
+    "metrics_cache_etag",
     "metrics_cache_payload",
+    "metrics_cache_payload_json",
     "metrics_cache_seq",
     "metrics_collector_start_lock",
-    "metrics_collector_started",
+    "metrics_collector_started_event",
+    "metrics_collecting_inflight",
     "metrics_stream_client_count",
     "operation_reconciler_start_lock",
     "operation_reconciler_started",
     "minecraft_log_cache_lines",
     "minecraft_log_cache_loaded",
     "minecraft_log_cache_lock",
-    "rcon_cached_enabled",
-    "rcon_cached_password",
-    "rcon_cached_port",
+    "rcon_config_cache",
     "rcon_config_lock",
-    "rcon_last_config_read_at",
     "rcon_startup_lock",
     "rcon_startup_ready",
     "re",
@@ -243,6 +252,8 @@ _STATE_BINDING_KEYS = (
     "service_status_cache_lock",
     "service_status_cache_value_ref",
     "service_status_cache_at_ref",
+    "service_status_changed_cond",
+    "service_status_generation_ref",
     "service_status_intent",
     "service_status_intent_lock",
     "set_service_status_intent",
@@ -35,6 +35,8 @@
     let navBound = false;
     let themeBound = false;
     let metricsEventSource = null;
+    let pendingMetricsRaw = null;
+    let metricsFlushScheduled = false;
     let notificationsEventSource = null;
     let operationEventSource = null;
     let pendingPromptAction = null;
@@ -1637,7 +1639,69 @@
         return clientId ? `/metrics-stream?client_id=${encodeURIComponent(clientId)}` : "/metrics-stream";
     }
 
+    function createFrameBatch() {
+        // Leveled read/write queue: every queued read runs before any queued
+        // write in the same animation frame, so layout is computed at most once.
+        const reads = [];
+        const writes = [];
+        let frameHandle = null;
+        const runTask = (task) => {
+            try {
+                task();
+            } catch (_) {
+                // Ignore task failures.
+            }
+        };
+        const flush = () => {
+            reads.splice(0).forEach(runTask);
+            writes.splice(0).forEach(runTask);
+            frameHandle = null;
+            // Tasks queued while flushing run in the next frame.
+            if (reads.length || writes.length) schedule();
+        };
+        const schedule = () => {
+            if (!frameHandle) frameHandle = window.requestAnimationFrame(flush);
+        };
+        return {
+            read(task) {
+                reads.push(task);
+                schedule();
+            },
+            write(task) {
+                writes.push(task);
+                schedule();
+            },
+        };
+    }
+
+    const frameBatch = createFrameBatch();
+
+    function flushPendingMetrics() {
+        metricsFlushScheduled = false;
+        const raw = pendingMetricsRaw;
+        pendingMetricsRaw = null;
+        if (raw === null) return;
+        try {
+            dispatchMetricsSnapshot(JSON.parse(raw || "{}"));
+        } catch (_) {
+            // Ignore malformed payloads.
+        }
+    }
+
+    function scheduleMetricsFlush() {
+        // Hidden tabs get no animation frames, but the primary tab still has
+        // to fan snapshots out to the other tabs.
+        if (document.hidden) {
+            flushPendingMetrics();
+            return;
+        }
+        if (metricsFlushScheduled) return;
+        metricsFlushScheduled = true;
+        frameBatch.write(flushPendingMetrics);
+    }
+
     function stopMetricsStream() {
+        pendingMetricsRaw = null;
         if (!metricsEventSource) return;
         try {
             metricsEventSource.close();
@@ -1703,12 +1767,10 @@
         if (!isPrimaryTab || metricsEventSource) return;
         metricsEventSource = new EventSource(metricsStreamPath());
         metricsEventSource.onmessage = (event) => {
-            try {
-                const payload = JSON.parse(event.data || "{}");
-                dispatchMetricsSnapshot(payload);
-            } catch (_) {
-                // Ignore malformed payloads.
-            }
+            // Only the newest snapshot matters; intermediates are dropped
+            // unparsed and the survivor is parsed once in the frame.
+            pendingMetricsRaw = event.data || "";
+            scheduleMetricsFlush();
         };
         metricsEventSource.onerror = () => {
             // EventSource reconnects automatically.
@@ -2065,16 +2127,23 @@
             ? lines.map((item) => String(item || "")).filter((item) => item.length > 0)
             : [String(lines || "")].filter((item) => item.length > 0);
         if (!nextLines.length) return;
-        shellState.homeLogs.pending[sourceKey].push(...nextLines);
-        if (shellState.homeLogs.flushTimers[sourceKey]) return;
-        shellState.homeLogs.flushTimers[sourceKey] = window.setTimeout(() => {
-            shellState.homeLogs.flushTimers[sourceKey] = null;
-            const flushedLines = shellState.homeLogs.pending[sourceKey].splice(0);
-            if (!flushedLines.length) return;
-            const merged = shellState.homeLogs.buffers[sourceKey].concat(flushedLines);
-            shellState.homeLogs.buffers[sourceKey] = capHomeLogLines(merged, homeLogLimit(sourceKey));
-            notifyHomeLogSubscribers(sourceKey);
-        }, 75);
+        const limit = homeLogLimit(sourceKey);
+        const pending = shellState.homeLogs.pending[sourceKey];
+        pending.push(...nextLines);
+        // A burst can outrun the flush timer; anything past the limit would be
+        // trimmed from the buffer on flush anyway.
+        if (pending.length > limit) pending.splice(0, pending.length - limit);
+        if (!shellState.homeLogs.flushTimers[sourceKey]) {
+            shellState.homeLogs.flushTimers[sourceKey] = window.setTimeout(() => {
+                shellState.homeLogs.flushTimers[sourceKey] = null;
+                const flushedLines = shellState.homeLogs.pending[sourceKey].splice(0);
+                if (!flushedLines.length) return;
+                const buffer = shellState.homeLogs.buffers[sourceKey];
+                buffer.push(...flushedLines);
+                if (buffer.length > limit) buffer.splice(0, buffer.length - limit);
+                notifyHomeLogSubscribers(sourceKey);
+            }, 75);
+        }
         if (!options.fromBroadcast && isPrimaryTab) {
             broadcast.send({ type: "log_lines", source: sourceKey, lines: nextLines });
         }
@@ -2349,6 +2418,7 @@
     // stay internal; pages consume shared caches, live metrics, and view state.
     window.MCWebShell = Object.assign({}, window.MCWebShell || {}, {
         getPersistentClientId,
+        frameBatch,
         subscribeMetrics,
         subscribeOperationUpdates,
         fetchDeviceNameMap,
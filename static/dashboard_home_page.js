@@ -43,8 +43,7 @@
 
     let teardownHomePage = null;
     let logScrollbarCleanup = null;
-    let countdownTimer = null;
-    let serverClockTimer = null;
+    let clockTimer = null;
     let startCooldownTimer = null;
     let lowStorageModalShown = false;
     let lastBackupWarningSeq = 0;
@@ -62,6 +61,51 @@
     };
     // Current scheduler mode: "active" or "off".
     let refreshMode = null;
+    // Home page nodes keep their identity for the life of a mount, so they are
+    // looked up once in startHomePage instead of on every metrics event.
+    const HOME_ELEMENT_IDS = {
+        backupBtn: "backup-btn",
+        backupStatus: "backup-status",
+        backupsStatus: "backups-status",
+        controlPanelTitle: "control-panel-title",
+        cpuFrequency: "cpu-frequency",
+        cpuPerCore: "cpu-per-core",
+        errorModal: "error-modal",
+        errorModalDetails: "error-modal-details",
+        errorModalMore: "error-modal-more",
+        errorModalOk: "error-modal-ok",
+        errorModalText: "error-modal-text",
+        idleCountdown: "idle-countdown",
+        lastBackupTime: "last-backup-time",
+        logSource: "log-source",
+        minecraftLog: "minecraft-log",
+        nextBackupTime: "next-backup-time",
+        playersOnline: "players-online",
+        ramUsage: "ram-usage",
+        rconCommand: "rcon-command",
+        rconSubmit: "rcon-submit",
+        serverTime: "server-time",
+        serviceStatus: "service-status",
+        serviceStatusDurationPrefix: "service-status-duration-prefix",
+        sessionDuration: "session-duration",
+        startBtn: "start-btn",
+        stopBtn: "stop-btn",
+        storageUsage: "storage-usage",
+        successModal: "success-modal",
+        successModalOk: "success-modal-ok",
+        successModalText: "success-modal-text",
+        sudoModal: "sudo-modal",
+        sudoModalCancel: "sudo-modal-cancel",
+        sudoModalError: "sudo-modal-error",
+        sudoModalImage: "sudo-modal-image",
+        sudoModalInput: "sudo-modal-input",
+        sudoModalSubmit: "sudo-modal-submit",
+        sudoModalText: "sudo-modal-text",
+        sudoModalTitle: "sudo-modal-title",
+        tickRate: "tick-rate",
+    };
+    let els = {};
+    let lastCpuPerCoreHtml = "";
     const SERVER_TIME_REBASE_TOLERANCE_SECONDS = 2;
 
     const watchVerticalScrollbarClass = typeof domUtils.watchVerticalScrollbarClass === "function"
@@ -82,7 +126,7 @@
     }
 
     function getLogSource() {
-        const select = document.getElementById("log-source");
+        const select = els.logSource;
         const value = (select && select.value) ? select.value : "minecraft";
         if (LOG_SOURCE_KEYS.includes(value)) return value;
         return "minecraft";
@@ -255,7 +299,7 @@
     }
 
     function tickServerClock() {
-        const serverTimeNode = document.getElementById("server-time");
+        const serverTimeNode = els.serverTime;
         if (!serverTimeNode) return;
         const nowUtcMs = currentServerTimeUtcMs();
         if (nowUtcMs === null) return;
@@ -264,7 +308,7 @@
     }
 
     function tickRuntimeSimulation() {
-        const idleCountdown = document.getElementById("idle-countdown");
+        const idleCountdown = els.idleCountdown;
         if (idleCountdown) {
             if (idleCountdownDeadlineMs === null) {
                 idleCountdown.textContent = "--:--";
@@ -275,7 +319,7 @@
             }
         }
 
-        const sessionDuration = document.getElementById("session-duration");
+        const sessionDuration = els.sessionDuration;
         if (
             sessionDurationRunning &&
             sessionDuration &&
@@ -288,28 +332,24 @@
         }
     }
 
-    function scheduleRuntimeSimulationTick() {
-        if (refreshMode !== "active") return;
-        tickRuntimeSimulation();
+    function clearClockTimer() {
+        if (!clockTimer) return;
+        clearTimeout(clockTimer);
+        clockTimer = null;
+    }
+
+    // One second-aligned clock drives the server time and, in Active mode,
+    // the simulated countdown/session duration so they repaint together.
+    function scheduleClockTick() {
+        clearClockTimer();
+        tickServerClock();
+        if (refreshMode === "active") {
+            tickRuntimeSimulation();
+        }
         const now = Date.now();
         const driftToNextSecond = 1000 - (now % 1000);
         const delay = Math.max(250, Math.min(1250, driftToNextSecond));
-        countdownTimer = window.setTimeout(scheduleRuntimeSimulationTick, delay);
-    }
-
-    function clearServerClockTimer() {
-        if (!serverClockTimer) return;
-        clearTimeout(serverClockTimer);
-        serverClockTimer = null;
-    }
-
-    function scheduleServerClockTick() {
-        clearServerClockTimer();
-        tickServerClock();
-        const now = Date.now();
-        const driftToNextSecond = 1000 - (now % 1000);
-        const delay = Math.max(250, Math.min(1250, driftToNextSecond));
-        serverClockTimer = window.setTimeout(scheduleServerClockTick, delay);
+        clockTimer = window.setTimeout(scheduleClockTick, delay);
     }
 
     function cacheMetricsSnapshot(data) {
@@ -342,8 +382,8 @@
             applyMetricsData(cachedMetricsSnapshot, { fromCache: true });
             return;
         }
-        const backupStatus = document.getElementById("backup-status");
-        const backupBtn = document.getElementById("backup-btn");
+        const backupStatus = els.backupStatus;
+        const backupBtn = els.backupBtn;
         if (!backupStatus) return;
         if (!backupStatusOverride) return;
         backupStatus.textContent = backupStatusOverride;
@@ -360,7 +400,7 @@
     }
 
     function syncStartButtonCooldown() {
-        const startBtn = document.getElementById("start-btn");
+        const startBtn = els.startBtn;
         if (!startBtn) return;
         if (!isStartCooldownActive()) {
             clearStartCooldownTimer();
@@ -393,12 +433,12 @@
             applyMetricsData(cachedMetricsSnapshot, { fromCache: true });
             return;
         }
-        const service = document.getElementById("service-status");
+        const service = els.serviceStatus;
         if (service) {
             service.textContent = "Queued";
             service.className = "stat-yellow";
         }
-        const startBtn = document.getElementById("start-btn");
+        const startBtn = els.startBtn;
         if (startBtn) {
             startBtn.disabled = true;
         }
@@ -406,12 +446,12 @@
 
     function openSudoModal(form) {
         pendingSudoForm = form;
-        const modal = document.getElementById("sudo-modal");
-        const input = document.getElementById("sudo-modal-input");
-        const title = document.getElementById("sudo-modal-title");
-        const text = document.getElementById("sudo-modal-text");
-        const image = document.getElementById("sudo-modal-image");
-        const errorText = document.getElementById("sudo-modal-error");
+        const modal = els.sudoModal;
+        const input = els.sudoModalInput;
+        const title = els.sudoModalTitle;
+        const text = els.sudoModalText;
+        const image = els.sudoModalImage;
+        const errorText = els.sudoModalError;
         if (!modal || !input) return;
         if (title) title.textContent = "Password Required";
         if (text) text.textContent = "Enter sudo password to continue.";
@@ -427,19 +467,15 @@
     }
 
     function closeSudoModal() {
-        const modal = document.getElementById("sudo-modal");
-        const input = document.getElementById("sudo-modal-input");
-        const title = document.getElementById("sudo-modal-title");
-        const text = document.getElementById("sudo-modal-text");
-        const image = document.getElementById("sudo-modal-image");
-        const errorText = document.getElementById("sudo-modal-error");
+        const modal = els.sudoModal;
+        const input = els.sudoModalInput;
+        const title = els.sudoModalTitle;
+        const text = els.sudoModalText;
+        const image = els.sudoModalImage;
+        const errorText = els.sudoModalError;
         if (modal) {
             modal.classList.remove("open");
             modal.setAttribute("aria-hidden", "true");
-            modal.style.display = "none";
-            // Force a reflow so next open state is applied cleanly.
-            void modal.offsetHeight;
-            modal.style.display = "";
         }
         if (input) input.value = "";
         if (title) title.textContent = "Password Required";
@@ -453,12 +489,12 @@
     }
 
     function showSudoModalError(message) {
-        const modal = document.getElementById("sudo-modal");
-        const input = document.getElementById("sudo-modal-input");
-        const title = document.getElementById("sudo-modal-title");
-        const text = document.getElementById("sudo-modal-text");
-        const image = document.getElementById("sudo-modal-image");
-        const errorText = document.getElementById("sudo-modal-error");
+        const modal = els.sudoModal;
+        const input = els.sudoModalInput;
+        const title = els.sudoModalTitle;
+        const text = els.sudoModalText;
+        const image = els.sudoModalImage;
+        const errorText = els.sudoModalError;
         if (!modal || !input) return;
         if (title) title.textContent = "Action Rejected";
         if (text) text.textContent = "Password incorrect. Whatever you were trying to do is cancelled.";
@@ -475,8 +511,8 @@
 
     function showSuccessModal(message) {
         closeSudoModal();
-        const modal = document.getElementById("success-modal");
-        const text = document.getElementById("success-modal-text");
+        const modal = els.successModal;
+        const text = els.successModalText;
         if (!modal || !text) return;
         text.textContent = message || "Action completed successfully.";
         modal.setAttribute("aria-hidden", "false");
@@ -522,9 +558,9 @@
     }
 
     function closeErrorModal() {
-        const modal = document.getElementById("error-modal");
-        const details = document.getElementById("error-modal-details");
-        const moreBtn = document.getElementById("error-modal-more");
+        const modal = els.errorModal;
+        const details = els.errorModalDetails;
+        const moreBtn = els.errorModalMore;
         if (!modal) return;
         modal.classList.remove("open");
         modal.setAttribute("aria-hidden", "true");
@@ -593,10 +629,10 @@
     function showErrorModal(message, options = {}) {
         // Never stack error modal on top of the password modal.
         closeSudoModal();
-        const modal = document.getElementById("error-modal");
-        const text = document.getElementById("error-modal-text");
-        const moreBtn = document.getElementById("error-modal-more");
-        const details = document.getElementById("error-modal-details");
+        const modal = els.errorModal;
+        const text = els.errorModalText;
+        const moreBtn = els.errorModalMore;
+        const details = els.errorModalDetails;
         if (!modal || !text) return;
         const code = (options.errorCode || "").trim();
         const action = (options.action || "").trim();
@@ -653,49 +689,74 @@
         }).join(" | ");
     }
 
+    // Metrics repeat mostly unchanged every second; compare against what the
+    // node already shows so identical values do not invalidate style.
+    function setTextIfChanged(node, value) {
+        const text = String(value);
+        if (node.textContent !== text) node.textContent = text;
+    }
+
+    function setClassIfChanged(node, className) {
+        if (node.className !== className) node.className = className;
+    }
+
+    function setDisabledIfChanged(node, disabled) {
+        if (node.disabled !== disabled) node.disabled = disabled;
+    }
+
+    function setPlaceholderIfChanged(node, placeholder) {
+        if (node.placeholder !== placeholder) node.placeholder = placeholder;
+    }
+
     function applyMetricsData(data, options = {}) {
         if (!data) return;
         const fromCache = options.fromCache === true;
-        const ram = document.getElementById("ram-usage");
-        const cpu = document.getElementById("cpu-per-core");
-        const freq = document.getElementById("cpu-frequency");
-        const storage = document.getElementById("storage-usage");
-        const players = document.getElementById("players-online");
-        const tickRate = document.getElementById("tick-rate");
-        const idleCountdown = document.getElementById("idle-countdown");
-        const sessionDuration = document.getElementById("session-duration");
-        const serviceDurationPrefix = document.getElementById("service-status-duration-prefix");
-        const backupStatus = document.getElementById("backup-status");
-        const lastBackup = document.getElementById("last-backup-time");
-        const nextBackup = document.getElementById("next-backup-time");
-        const backupsStatus = document.getElementById("backups-status");
-        const service = document.getElementById("service-status");
-        const serverTime = document.getElementById("server-time");
-        const controlPanelTitle = document.getElementById("control-panel-title");
-        const startBtn = document.getElementById("start-btn");
-        const stopBtn = document.getElementById("stop-btn");
-        const backupBtn = document.getElementById("backup-btn");
-        const rconInput = document.getElementById("rcon-command");
-        const rconSubmit = document.getElementById("rcon-submit");
-        if (ram && data.ram_usage) ram.textContent = data.ram_usage;
-        if (cpu && data.cpu_per_core_items) cpu.innerHTML = renderCpuPerCore(data.cpu_per_core_items);
-        if (freq && data.cpu_frequency) freq.textContent = data.cpu_frequency;
-        if (storage && data.storage_usage) storage.textContent = data.storage_usage;
-        if (ram && data.ram_usage_class) ram.className = data.ram_usage_class;
-        if (freq && data.cpu_frequency_class) freq.className = data.cpu_frequency_class;
-        if (storage && data.storage_usage_class) storage.className = data.storage_usage_class;
-        if (players && data.players_online) players.textContent = data.players_online;
-        if (tickRate && data.tick_rate !== undefined) tickRate.textContent = data.tick_rate;
+        const ram = els.ramUsage;
+        const cpu = els.cpuPerCore;
+        const freq = els.cpuFrequency;
+        const storage = els.storageUsage;
+        const players = els.playersOnline;
+        const tickRate = els.tickRate;
+        const idleCountdown = els.idleCountdown;
+        const sessionDuration = els.sessionDuration;
+        const serviceDurationPrefix = els.serviceStatusDurationPrefix;
+        const backupStatus = els.backupStatus;
+        const lastBackup = els.lastBackupTime;
+        const nextBackup = els.nextBackupTime;
+        const backupsStatus = els.backupsStatus;
+        const service = els.serviceStatus;
+        const serverTime = els.serverTime;
+        const controlPanelTitle = els.controlPanelTitle;
+        const startBtn = els.startBtn;
+        const stopBtn = els.stopBtn;
+        const backupBtn = els.backupBtn;
+        const rconInput = els.rconCommand;
+        const rconSubmit = els.rconSubmit;
+        if (ram && data.ram_usage) setTextIfChanged(ram, data.ram_usage);
+        if (cpu && data.cpu_per_core_items) {
+            const cpuHtml = renderCpuPerCore(data.cpu_per_core_items);
+            if (cpuHtml !== lastCpuPerCoreHtml) {
+                cpu.innerHTML = cpuHtml;
+                lastCpuPerCoreHtml = cpuHtml;
+            }
+        }
+        if (freq && data.cpu_frequency) setTextIfChanged(freq, data.cpu_frequency);
+        if (storage && data.storage_usage) setTextIfChanged(storage, data.storage_usage);
+        if (ram && data.ram_usage_class) setClassIfChanged(ram, data.ram_usage_class);
+        if (freq && data.cpu_frequency_class) setClassIfChanged(freq, data.cpu_frequency_class);
+        if (storage && data.storage_usage_class) setClassIfChanged(storage, data.storage_usage_class);
+        if (players && data.players_online) setTextIfChanged(players, data.players_online);
+        if (tickRate && data.tick_rate !== undefined) setTextIfChanged(tickRate, data.tick_rate);
         if (data.idle_countdown !== undefined) {
             setIdleCountdownFromParsedSeconds(homeTimeUtils.parseCountdown(data.idle_countdown));
-            if (idleCountdown && idleCountdownSeconds === null) idleCountdown.textContent = data.idle_countdown;
+            if (idleCountdown && idleCountdownSeconds === null) setTextIfChanged(idleCountdown, data.idle_countdown);
         }
         if (sessionDuration && data.session_duration !== undefined) {
             setSessionDurationFromParsedSeconds(homeTimeUtils.parseSessionDuration(data.session_duration));
             if (sessionDurationSeconds !== null) {
-                sessionDuration.textContent = homeTimeUtils.formatSessionDuration(sessionDurationSeconds);
+                setTextIfChanged(sessionDuration, homeTimeUtils.formatSessionDuration(sessionDurationSeconds));
             } else {
-                sessionDuration.textContent = data.session_duration;
+                setTextIfChanged(sessionDuration, data.session_duration);
             }
         }
         let backupStatusText = data.backup_status;
@@ -707,11 +768,11 @@
             backupStatusText = "Running";
             backupStatusClass = "stat-green";
         }
-        if (backupStatus && backupStatusText) backupStatus.textContent = backupStatusText;
-        if (backupStatus && backupStatusClass) backupStatus.className = backupStatusClass;
-        if (lastBackup && data.last_backup_time) lastBackup.textContent = data.last_backup_time;
-        if (nextBackup && data.next_backup_time) nextBackup.textContent = data.next_backup_time;
-        if (backupsStatus && data.backups_status) backupsStatus.textContent = data.backups_status;
+        if (backupStatus && backupStatusText) setTextIfChanged(backupStatus, backupStatusText);
+        if (backupStatus && backupStatusClass) setClassIfChanged(backupStatus, backupStatusClass);
+        if (lastBackup && data.last_backup_time) setTextIfChanged(lastBackup, data.last_backup_time);
+        if (nextBackup && data.next_backup_time) setTextIfChanged(nextBackup, data.next_backup_time);
+        if (backupsStatus && data.backups_status) setTextIfChanged(backupsStatus, data.backups_status);
         let serviceStatusText = data.service_status;
         let serviceStatusClass = data.service_status_class;
         const observedServiceState = String(serviceStatusText || "").trim().toLowerCase();
@@ -725,26 +786,23 @@
                 serviceStatusClass = "stat-yellow";
             }
         }
-        if (service && serviceStatusText) service.textContent = serviceStatusText;
-        if (service && serviceStatusClass) service.className = serviceStatusClass;
+        if (service && serviceStatusText) setTextIfChanged(service, serviceStatusText);
+        if (service && serviceStatusClass) setClassIfChanged(service, serviceStatusClass);
         if (serverTime && (data.server_time || data.server_time_epoch_ms)) {
             const accepted = setServerTimeFromEpoch(data.server_time_epoch_ms, data.server_time_zone)
                 || setServerTimeFromText(data.server_time);
             if (accepted) {
                 tickServerClock();
             } else {
-                serverTime.textContent = data.server_time;
+                setTextIfChanged(serverTime, data.server_time);
             }
         }
-        if (controlPanelTitle && data.world_name) controlPanelTitle.textContent = `${data.world_name} Control Panel`;
+        if (controlPanelTitle && data.world_name) setTextIfChanged(controlPanelTitle, `${data.world_name} Control Panel`);
         if (serviceDurationPrefix && service && sessionDuration) {
-            if (data.service_status === "Running" && data.session_duration && data.session_duration !== "--") {
-                sessionDuration.style.display = "";
-                serviceDurationPrefix.textContent = " for ";
-            } else {
-                sessionDuration.style.display = "none";
-                serviceDurationPrefix.textContent = "";
-            }
+            const showDuration = data.service_status === "Running" && data.session_duration && data.session_duration !== "--";
+            const nextDisplay = showDuration ? "" : "none";
+            if (sessionDuration.style.display !== nextDisplay) sessionDuration.style.display = nextDisplay;
+            setTextIfChanged(serviceDurationPrefix, showDuration ? " for " : "");
         }
         sessionDurationRunning = isServiceRunningInMetrics(data);
         if (!sessionDurationRunning && (!data.session_duration || data.session_duration === "--")) {
@@ -762,25 +820,25 @@
         const allowStart = serviceIsOff && !lowStorageBlocked && !isStartCooldownActive();
         const allowStop = !serviceIsOff;
 
-        if (startBtn) startBtn.disabled = !allowStart;
-        if (stopBtn) stopBtn.disabled = !allowStop;
+        if (startBtn) setDisabledIfChanged(startBtn, !allowStart);
+        if (stopBtn) setDisabledIfChanged(stopBtn, !allowStop);
 
         if (data.service_running_status === "active") {
-            if (rconInput) rconInput.disabled = !rconEnabled;
-            if (rconSubmit) rconSubmit.disabled = !rconEnabled;
+            if (rconInput) setDisabledIfChanged(rconInput, !rconEnabled);
+            if (rconSubmit) setDisabledIfChanged(rconSubmit, !rconEnabled);
             if (rconInput) {
-                rconInput.placeholder = rconEnabled
+                setPlaceholderIfChanged(rconInput, rconEnabled
                     ? "Enter Minecraft server command"
-                    : "RCON unavailable (missing rcon.password)";
+                    : "RCON unavailable (missing rcon.password)");
             }
         } else {
             if (rconInput) {
-                rconInput.disabled = true;
-                rconInput.placeholder = serviceIsOff
+                setDisabledIfChanged(rconInput, true);
+                setPlaceholderIfChanged(rconInput, serviceIsOff
                     ? "Server is off"
-                    : "Loading server state...";
+                    : "Loading server state...");
             }
-            if (rconSubmit) rconSubmit.disabled = true;
+            if (rconSubmit) setDisabledIfChanged(rconSubmit, true);
         }
         if (!fromCache && lowStorageBlocked) {
             if (!lowStorageModalShown && lowStorageMessage) {
@@ -805,16 +863,31 @@
         if (backupBtn) {
             const backupBusy = backupStatusText === "Running" || backupStatusText === "Queued";
             const backupBlocked = serviceIsStarting || serviceIsShutting || lowStorageBlocked || backupBusy;
-            backupBtn.disabled = backupBlocked;
+            setDisabledIfChanged(backupBtn, backupBlocked);
         }
         cacheMetricsSnapshot(data);
         applyRefreshMode(data.service_status);
     }
 
+    // Action and method are fixed in the home template, so each form's
+    // attributes are read once and reused for every later submit.
+    const formDescriptors = new WeakMap();
+
+    function describeForm(form) {
+        let descriptor = formDescriptors.get(form);
+        if (!descriptor) {
+            descriptor = {
+                action: form.getAttribute("action") || "/",
+                method: (form.getAttribute("method") || "POST").toUpperCase(),
+            };
+            formDescriptors.set(form, descriptor);
+        }
+        return descriptor;
+    }
+
     async function submitFormAjax(form, sudoPassword = undefined) {
         if (!form) return;
-        const action = form.getAttribute("action") || "/";
-        const method = (form.getAttribute("method") || "POST").toUpperCase();
+        const { action, method } = describeForm(form);
         if (action === "/backup") {
             setBackupStatusOverride("Queued");
         }
@@ -898,15 +971,6 @@
         }
     }
 
-    function clearRefreshTimers() {
-        // Prevent duplicate interval loops when switching modes.
-        if (countdownTimer) {
-            clearTimeout(countdownTimer);
-            countdownTimer = null;
-        }
-    }
-
-
     function applyRefreshMode(serviceStatusText) {
         // Status is rendered as labels (Off/Starting/Running/Shutting Down).
         const normalized = (serviceStatusText || "").trim().toLowerCase();
@@ -914,15 +978,15 @@
         if (nextMode === refreshMode) return;
 
         refreshMode = nextMode;
-        clearRefreshTimers();
 
         if (refreshMode === "off") {
             sessionDurationRunning = false;
             return;
         }
 
-        // In Active mode, locally simulate countdown/session duration.
-        scheduleRuntimeSimulationTick();
+        // In Active mode, locally simulate countdown/session duration; the
+        // shared clock keeps it ticking from here.
+        tickRuntimeSimulation();
     }
 
     // Tear down page-local timers/listeners when the shell unmounts Home.
@@ -946,8 +1010,7 @@
             logScrollbarCleanup();
             logScrollbarCleanup = null;
         }
-        clearRefreshTimers();
-        clearServerClockTimer();
+        clearClockTimer();
         clearStartCooldownTimer();
         refreshMode = null;
     }
@@ -957,17 +1020,27 @@
             if (homeLogController && (!shell || typeof shell.activateHomeLogStream !== "function")) {
                 homeLogController.teardown();
             }
-            clearServerClockTimer();
+            clearClockTimer();
             return;
         }
         activateLogStream(selectedLogSource);
         if (cachedMetricsSnapshot) {
             applyMetricsData(cachedMetricsSnapshot, { fromCache: true });
         }
-        scheduleServerClockTick();
+        scheduleClockTick();
     }
 
+    function cacheHomeElements() {
+        const next = {};
+        Object.keys(HOME_ELEMENT_IDS).forEach((key) => {
+            next[key] = document.getElementById(HOME_ELEMENT_IDS[key]);
+        });
+        els = next;
+        lastCpuPerCoreHtml = "";
+    }
+
     async function startHomePage() {
+        cacheHomeElements();
         homeCleanup = createCleanupStack();
         const addScopedListener = homeCleanup && typeof homeCleanup.listen === "function"
             ? homeCleanup.listen
@@ -975,27 +1048,22 @@
                 if (!target || typeof target.addEventListener !== "function") return;
                 target.addEventListener(type, handler, options);
             };
-        document.querySelectorAll("form.ajax-form:not(.sudo-form)").forEach((form) => {
-            addScopedListener(form, "submit", async (event) => {
-                event.preventDefault();
-                await submitFormAjax(form);
-            });
-        });
-
-        document.querySelectorAll("form.sudo-form").forEach((form) => {
-            addScopedListener(form, "submit", async (event) => {
-                event.preventDefault();
-                if (!passwordRequired) {
-                    await submitFormAjax(form);
-                    return;
-                }
+        // One delegated listener covers every home form; it is removed with the
+        // rest of the home cleanup stack on unmount.
+        addScopedListener(document, "submit", async (event) => {
+            const form = event.target;
+            if (!(form instanceof HTMLFormElement) || !form.classList.contains("ajax-form")) return;
+            event.preventDefault();
+            if (form.classList.contains("sudo-form") && passwordRequired) {
                 openSudoModal(form);
-            });
+                return;
+            }
+            await submitFormAjax(form);
         });
 
-        const modalCancel = document.getElementById("sudo-modal-cancel");
-        const modalSubmit = document.getElementById("sudo-modal-submit");
-        const modalInput = document.getElementById("sudo-modal-input");
+        const modalCancel = els.sudoModalCancel;
+        const modalSubmit = els.sudoModalSubmit;
+        const modalInput = els.sudoModalInput;
         if (modalCancel) {
             addScopedListener(modalCancel, "click", () => closeSudoModal());
         }
@@ -1017,8 +1085,8 @@
             });
         }
 
-        const successOk = document.getElementById("success-modal-ok");
-        const successModal = document.getElementById("success-modal");
+        const successOk = els.successModalOk;
+        const successModal = els.successModal;
         if (successModal) {
             addScopedListener(successModal, "click", (event) => {
                 if (event.target !== successModal) return;
@@ -1028,16 +1096,16 @@
         }
         if (successOk) {
             addScopedListener(successOk, "click", () => {
-                const modal = document.getElementById("success-modal");
+                const modal = els.successModal;
                 if (modal) {
                     modal.classList.remove("open");
                     modal.setAttribute("aria-hidden", "true");
                 }
             });
         }
-        const errorOk = document.getElementById("error-modal-ok");
-        const errorMore = document.getElementById("error-modal-more");
-        const errorModal = document.getElementById("error-modal");
+        const errorOk = els.errorModalOk;
+        const errorMore = els.errorModalMore;
+        const errorModal = els.errorModal;
         if (errorModal) {
             addScopedListener(errorModal, "click", (event) => {
                 if (event.target !== errorModal) return;
@@ -1051,7 +1119,7 @@
         }
         if (errorMore) {
             addScopedListener(errorMore, "click", () => {
-                const details = document.getElementById("error-modal-details");
+                const details = els.errorModalDetails;
                 if (!details) return;
                 const nextHidden = !details.hidden;
                 details.hidden = nextHidden;
@@ -1075,19 +1143,19 @@
             window.history.replaceState({}, "", url.pathname + (url.search ? url.search : "") + url.hash);
         }
         scrollLogToBottom();
-        const idleCountdown = document.getElementById("idle-countdown");
+        const idleCountdown = els.idleCountdown;
         if (idleCountdown) {
             setIdleCountdownFromParsedSeconds(homeTimeUtils.parseCountdown(idleCountdown.textContent.trim()));
         }
-        const existingSessionDuration = document.getElementById("session-duration");
+        const existingSessionDuration = els.sessionDuration;
         if (existingSessionDuration) {
             setSessionDurationFromParsedSeconds(homeTimeUtils.parseSessionDuration(existingSessionDuration.textContent.trim()));
         }
-        const existingServerTime = document.getElementById("server-time");
+        const existingServerTime = els.serverTime;
         if (existingServerTime) {
             setServerTimeFromText(existingServerTime.textContent.trim(), { force: true });
         }
-        const logSource = document.getElementById("log-source");
+        const logSource = els.logSource;
         if (shell && typeof shell.subscribeHomeLogs === "function") {
             homeLogsUnsubscribe = shell.subscribeHomeLogs((source, lines) => {
                 if (!LOG_SOURCE_KEYS.includes(source)) return;
@@ -1114,7 +1182,7 @@
                 }
             });
         }
-        const existingLog = document.getElementById("minecraft-log");
+        const existingLog = els.minecraftLog;
         if (existingLog && homeLogController) {
             logScrollbarCleanup = homeLogController.bindLogElement(existingLog);
         }
@@ -1145,14 +1213,15 @@
         if (window.__MCWEB_LAST_METRICS_SNAPSHOT && typeof window.__MCWEB_LAST_METRICS_SNAPSHOT === "object") {
             applyMetricsData(window.__MCWEB_LAST_METRICS_SNAPSHOT);
         }
-        scheduleServerClockTick();
-        const service = document.getElementById("service-status");
+        scheduleClockTick();
+        const service = els.serviceStatus;
         applyRefreshMode(service ? service.textContent : "");
         addScopedListener(document, "visibilitychange", handleVisibilityRefreshMode);
         addScopedListener(window, "pagehide", teardownRealtimeConnections);
         addScopedListener(window, "beforeunload", teardownRealtimeConnections);
         teardownHomePage = () => {
             teardownRealtimeConnections();
+            els = {};
             if (homeCleanup && typeof homeCleanup.run === "function") {
                 homeCleanup.run();
                 homeCleanup = null;
@@ -20,6 +20,10 @@
             mcweb_log: "/log-stream/mcweb_log",
         };
         const LOG_STREAM_BATCH_FLUSH_MS = 75;
+        const frameBatch = shell && shell.frameBatch ? shell.frameBatch : {
+            read: function (task) { window.requestAnimationFrame(task); },
+            write: function (task) { task(); },
+        };
 
         const initialHomeViewState = shell && typeof shell.getHomeViewState === "function"
             ? shell.getHomeViewState()
@@ -58,6 +62,12 @@
             mcweb_log: null,
         };
         let shellLogUnsubscribe = null;
+        const pendingRenderSources = new Set();
+        let renderScheduled = false;
+        // What the log element currently shows, one DOM row per entry.
+        let renderedTarget = null;
+        let renderedSource = "";
+        let renderedEntries = [];
 
         function persistHomeViewState(patch) {
             if (!shell || typeof shell.updateHomeViewState !== "function") return;
@@ -184,6 +194,19 @@
             return { raw: raw, html: formatter(raw) };
         }
 
+        function buildEntriesReusingFormatted(source, lines) {
+            // Shell batches resend the whole tail; only lines not already in the
+            // buffer need formatting.
+            const formattedByRaw = new Map();
+            (logSourceBuffers[source] || []).forEach(function (entry) {
+                formattedByRaw.set(entry.raw, entry);
+            });
+            return capTail(lines, sourceBufferLimit(source)).map(function (line) {
+                const raw = String(line || "");
+                return formattedByRaw.get(raw) || buildLogEntry(source, raw);
+            });
+        }
+
         function setSourceLogText(source, rawText) {
             const normalized = String(rawText || "");
             const lines = normalized ? capTail(normalized.split("\n"), sourceBufferLimit(source)) : [];
@@ -213,6 +236,7 @@
             if ((meta.currentLength || 0) === 0) {
                 target.innerHTML = formatNonMinecraftLogLine("(no logs)");
             }
+            rememberRenderedEntries(target, selectedLogSource, logSourceBuffers[selectedLogSource] || []);
             if (logAutoScrollEnabled && wasNearBottom) {
                 scrollLogToBottom();
                 persistHomeViewState({ logScrollTopBySource: { [selectedLogSource]: target.scrollTop } });
@@ -252,7 +276,12 @@
                 ? lines.map(function (line) { return String(line || ""); }).filter(function (line) { return line.length > 0; })
                 : [String(lines || "")].filter(function (line) { return line.length > 0; });
             if (!nextLines.length) return;
-            pendingLogLines[source].push.apply(pendingLogLines[source], nextLines);
+            const pending = pendingLogLines[source];
+            pending.push.apply(pending, nextLines);
+            const limit = sourceBufferLimit(source);
+            if (pending.length > limit) {
+                pending.splice(0, pending.length - limit);
+            }
             if (pendingLogFlushTimers[source]) return;
             pendingLogFlushTimers[source] = window.setTimeout(function () {
                 pendingLogFlushTimers[source] = null;
@@ -260,37 +289,102 @@
             }, LOG_STREAM_BATCH_FLUSH_MS);
         }
 
-        function renderActiveLog() {
+        function cancelScheduledRender() {
+            pendingRenderSources.clear();
+        }
+
+        function measureScheduledRender() {
+            renderScheduled = false;
+            const shouldRender = pendingRenderSources.has(selectedLogSource);
+            pendingRenderSources.clear();
+            if (!shouldRender) return;
             const target = targetElement();
-            if (!target) return;
             const wasNearBottom = isLogNearBottom(target);
+            frameBatch.write(function () {
+                renderActiveLog({ wasNearBottom: wasNearBottom });
+            });
+        }
+
+        function scheduleActiveLogRender(source) {
+            pendingRenderSources.add(source);
+            if (renderScheduled) return;
+            renderScheduled = true;
+            frameBatch.read(measureScheduledRender);
+        }
+
+        function rememberRenderedEntries(target, source, entries) {
+            renderedTarget = target;
+            renderedSource = source;
+            renderedEntries = entries.slice();
+        }
+
+        function renderedOverlapStart(target, entries) {
+            // Returns how many leading rendered rows to drop so the rest line up
+            // with the start of ``entries``, or -1 when a full rebuild is needed.
+            if (target !== renderedTarget || selectedLogSource !== renderedSource) return -1;
+            if (!renderedEntries.length || target.childElementCount !== renderedEntries.length) return -1;
+            const dropCount = renderedEntries.indexOf(entries[0]);
+            if (dropCount < 0) return -1;
+            const keptCount = renderedEntries.length - dropCount;
+            if (keptCount > entries.length) return -1;
+            for (let i = 0; i < keptCount; i += 1) {
+                if (renderedEntries[dropCount + i] !== entries[i]) return -1;
+            }
+            return dropCount;
+        }
+
+        function renderActiveLog(options) {
+            cancelScheduledRender();
+            const target = targetElement();
+            if (!target) return;
+            const wasNearBottom = options && typeof options.wasNearBottom === "boolean"
+                ? options.wasNearBottom
+                : isLogNearBottom(target);
             const entries = logSourceBuffers[selectedLogSource] || [];
+            const dropCount = entries.length ? renderedOverlapStart(target, entries) : -1;
             if (entries.length === 0) {
                 target.innerHTML = formatNonMinecraftLogLine("(no logs)");
+            } else if (dropCount >= 0) {
+                for (let i = 0; i < dropCount; i += 1) {
+                    target.removeChild(target.firstElementChild);
+                }
+                const appendedHtml = entries.slice(renderedEntries.length - dropCount).map(function (entry) {
+                    return entry.html;
+                }).join("");
+                if (appendedHtml) {
+                    target.insertAdjacentHTML("beforeend", appendedHtml);
+                }
             } else {
                 target.innerHTML = entries.map(function (entry) {
                     return entry.html;
                 }).join("");
             }
-            if (logAutoScrollEnabled && wasNearBottom) {
-                scrollLogToBottom();
-            } else {
-                restoreActiveLogScroll(target);
-            }
-            persistHomeViewState({
-                selectedLogSource: selectedLogSource,
-                logAutoScrollBySource: { [selectedLogSource]: logAutoScrollEnabled },
-                logScrollTopBySource: { [selectedLogSource]: target.scrollTop },
+            rememberRenderedEntries(target, selectedLogSource, entries);
+            // Scrolling reads the new layout, so it waits for the next read
+            // phase instead of forcing a reflow right after the DOM writes.
+            frameBatch.read(function () {
+                if (targetElement() !== target) return;
+                if (logAutoScrollEnabled && wasNearBottom) {
+                    scrollLogToBottom();
+                } else {
+                    restoreActiveLogScroll(target);
+                }
+                persistHomeViewState({
+                    selectedLogSource: selectedLogSource,
+                    logAutoScrollBySource: { [selectedLogSource]: logAutoScrollEnabled },
+                    logScrollTopBySource: { [selectedLogSource]: target.scrollTop },
+                });
             });
         }
 
         function syncLogBufferFromShell(source, lines) {
             if (!LOG_SOURCE_KEYS.includes(source)) return;
-            const rawText = Array.isArray(lines) ? lines.join("\n") : String(lines || "");
-            setSourceLogText(source, rawText);
-            if (selectedLogSource === source) {
-                renderActiveLog();
+            if (Array.isArray(lines)) {
+                logSourceBuffers[source] = buildEntriesReusingFormatted(source, lines);
+            } else {
+                setSourceLogText(source, lines);
             }
+            scheduleActiveLogRender(source);
         }
 
         function closeLogStream(source) {
@@ -318,9 +412,7 @@
                     const payload = JSON.parse(event.data || "{}");
                     const lines = Array.isArray(payload.lines) ? payload.lines : [];
                     setSourceLogText(source, lines.join("\n"));
-                    if (selectedLogSource === source) {
-                        renderActiveLog();
-                    }
+                    scheduleActiveLogRender(source);
                 } catch (_) {
                     // Ignore malformed snapshot payloads.
                 }
@@ -360,6 +452,7 @@
         }
 
         function rebuildBufferedEntries() {
+            renderedEntries = [];
             LOG_SOURCE_KEYS.forEach(function (source) {
                 if ((logSourceBuffers[source] || []).length > 0) {
                     logSourceBuffers[source] = logSourceBuffers[source].map(function (entry) {
@@ -398,12 +491,8 @@
 
         function syncShellLogSource(source, lines) {
             if (!LOG_SOURCE_KEYS.includes(source) || !Array.isArray(lines)) return;
-            logSourceBuffers[source] = lines.map(function (line) {
-                return buildLogEntry(source, String(line || ""));
-            });
-            if (selectedLogSource === source) {
-                renderActiveLog();
-            }
+            logSourceBuffers[source] = buildEntriesReusingFormatted(source, lines);
+            scheduleActiveLogRender(source);
         }
 
         function setSelectedSource(source) {
@@ -426,19 +515,30 @@
             }
             logElement = target || document.getElementById("minecraft-log");
             if (!logElement) return function () {};
-            const handleScroll = function () {
-                logAutoScrollEnabled = isLogNearBottom(logElement);
+            const element = logElement;
+            let scrollMeasurePending = false;
+            // Scroll fires far more often than frames; measure and persist at
+            // most once per frame, in the batch read phase.
+            const measureScroll = function () {
+                scrollMeasurePending = false;
+                if (logElement !== element) return;
+                logAutoScrollEnabled = isLogNearBottom(element);
                 persistHomeViewState({
                     selectedLogSource: selectedLogSource,
                     logAutoScrollBySource: { [selectedLogSource]: logAutoScrollEnabled },
-                    logScrollTopBySource: { [selectedLogSource]: logElement.scrollTop },
+                    logScrollTopBySource: { [selectedLogSource]: element.scrollTop },
                 });
             };
-            logElement.addEventListener("scroll", handleScroll);
+            const handleScroll = function () {
+                if (scrollMeasurePending) return;
+                scrollMeasurePending = true;
+                frameBatch.read(measureScroll);
+            };
+            logElement.addEventListener("scroll", handleScroll, { passive: true });
             const scrollbarCleanup = watchVerticalScrollbarClass(logElement);
             logElementCleanup = function () {
                 try {
-                    logElement.removeEventListener("scroll", handleScroll);
+                    element.removeEventListener("scroll", handleScroll, { passive: true });
                 } catch (_) {
                     // Ignore remove failures.
                 }
@@ -476,6 +576,7 @@
                 }
                 pendingLogLines[source] = [];
             });
+            cancelScheduledRender();
             if (typeof logElementCleanup === "function") {
                 logElementCleanup();
                 logElementCleanup = null;
@@ -1,10 +1,28 @@
 (function (global) {
     const MONTH_ABBREV = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"];
+    // Zero-padded "00".."99" for the per-second countdown and duration ticks.
+    const PAD2 = Array.from({ length: 100 }, (_, i) => (i < 10 ? "0" : "") + i);
+
+    function pad2(value) {
+        return value < 100 ? PAD2[value] : String(value);
+    }
+
+    function digitAt(text, index) {
+        const digit = text.charCodeAt(index) - 48;
+        return digit >= 0 && digit <= 9 ? digit : -1;
+    }
 
     function parseCountdown(text) {
-        const match = String(text || "").trim().match(/^(\d{1,2}):(\d{2})$/);
-        if (!match) return null;
-        return (parseInt(match[1], 10) * 60) + parseInt(match[2], 10);
+        // "M:SS" or "MM:SS"; parsed by char code since this runs on every tick.
+        const value = String(text || "").trim();
+        const length = value.length;
+        if ((length !== 4 && length !== 5) || value.charCodeAt(length - 3) !== 58) return null;
+        const m0 = length === 5 ? digitAt(value, 0) : 0;
+        const m1 = digitAt(value, length - 4);
+        const s0 = digitAt(value, length - 2);
+        const s1 = digitAt(value, length - 1);
+        if ((m0 | m1 | s0 | s1) < 0) return null;
+        return (m0 * 10 + m1) * 60 + s0 * 10 + s1;
     }
 
     function parseSessionDuration(text) {
@@ -15,17 +33,12 @@
 
     function formatCountdown(totalSeconds) {
         const safe = Math.max(0, Math.floor(Number(totalSeconds) || 0));
-        const minutes = Math.floor(safe / 60);
-        const seconds = safe % 60;
-        return `${String(minutes).padStart(2, "0")}:${String(seconds).padStart(2, "0")}`;
+        return pad2(Math.floor(safe / 60)) + ":" + PAD2[safe % 60];
     }
 
     function formatSessionDuration(totalSeconds) {
         const safe = Math.max(0, Math.floor(Number(totalSeconds) || 0));
-        const hours = Math.floor(safe / 3600);
-        const minutes = Math.floor((safe % 3600) / 60);
-        const seconds = safe % 60;
-        return `${String(hours).padStart(2, "0")}:${String(minutes).padStart(2, "0")}:${String(seconds).padStart(2, "0")}`;
+        return pad2(Math.floor(safe / 3600)) + ":" + PAD2[Math.floor((safe % 3600) / 60)] + ":" + PAD2[safe % 60];
     }
 
     function parseServerTimeText(text) {
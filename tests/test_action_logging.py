@@ -0,0 +1,167 @@
+from datetime import datetime
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+from app.core import action_logging
+
+
+class ActionLoggingTests(unittest.TestCase):
+    def test_log_exception_suppresses_repeats_within_window(self):
+        calls = []
+        log_exception = action_logging.make_log_exception(
+            lambda action, **kwargs: calls.append((action, kwargs)),
+            repeat_window_seconds=30.0,
+        )
+        with patch.object(action_logging.time, "monotonic", side_effect=[100.0, 101.0, 102.0, 140.0]):
+            log_exception("metrics_collect", RuntimeError("boom"))
+            log_exception("metrics_collect", RuntimeError("boom"))
+            log_exception("metrics_collect", ValueError("other"))
+            log_exception("metrics_collect", RuntimeError("boom"))
+        messages = [kwargs["rejection_message"] for _action, kwargs in calls]
+        self.assertEqual(len(messages), 4)
+        self.assertIn("metrics_collect: RuntimeError: boom", messages[0])
+        self.assertIn("ValueError", messages[1])
+        # The rolled-over window reports what it swallowed before the next entry.
+        self.assertEqual(messages[2], "metrics_collect: RuntimeError: boom (suppressed 1 repeat)")
+        self.assertIn("metrics_collect: RuntimeError: boom", messages[3])
+
+    def test_log_exception_reports_suppressed_repeats_when_another_error_sweeps(self):
+        calls = []
+        log_exception = action_logging.make_log_exception(
+            lambda action, **kwargs: calls.append(kwargs["rejection_message"]),
+            repeat_window_seconds=30.0,
+        )
+        with patch.object(action_logging.time, "monotonic", side_effect=[100.0, 101.0, 102.0, 200.0]):
+            log_exception("rcon_execute", RuntimeError("boom"))
+            log_exception("rcon_execute", RuntimeError("boom"))
+            log_exception("rcon_execute", RuntimeError("boom"))
+            log_exception("backup_session_watcher", OSError("disk"))
+        self.assertEqual(calls[1], "rcon_execute: RuntimeError: boom (suppressed 2 repeats)")
+        self.assertIn("backup_session_watcher: OSError: disk", calls[2])
+
+    def test_sanitize_log_fragment_flattens_and_collapses_whitespace(self):
+        self.assertEqual(action_logging.sanitize_log_fragment("  a\r\nb\t\tc \n"), "a b c")
+        self.assertEqual(action_logging.sanitize_log_fragment(None), "")
+
+    def test_log_exception_window_disabled_logs_every_call(self):
+        calls = []
+        log_exception = action_logging.make_log_exception(
+            lambda action, **kwargs: calls.append(action),
+            repeat_window_seconds=0,
+        )
+        log_exception("ctx", RuntimeError("boom"))
+        log_exception("ctx", RuntimeError("boom"))
+        self.assertEqual(calls, ["error", "error"])
+
+    def test_log_action_without_writer_appends_synchronously(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            log_dir = Path(tmp) / "logs"
+            log_file = log_dir / "mcweb_actions.log"
+            log_action = action_logging.make_log_action(ZoneInfo("UTC"), log_dir, log_file)
+            log_action("start", command="systemctl start")
+            text = log_file.read_text(encoding="utf-8")
+        self.assertIn("[mcweb/start] systemctl start", text)
+
+    def test_log_action_timestamp_matches_strftime_in_display_tz(self):
+        tz = ZoneInfo("America/New_York")
+        with tempfile.TemporaryDirectory() as tmp:
+            log_dir = Path(tmp) / "logs"
+            log_file = log_dir / "mcweb.log"
+            log_action = action_logging.make_log_action(tz, log_dir, log_file)
+            with patch.object(action_logging.time, "time", return_value=1704153605.7):
+                log_action("first")
+                log_action("second")
+            lines = log_file.read_text(encoding="utf-8").splitlines()
+        expected = datetime.fromtimestamp(1704153605, tz=tz).strftime("%b %d %H:%M:%S")
+        self.assertEqual([line.split(" <", 1)[0] for line in lines], [expected, expected])
+
+    def test_log_action_with_writer_appends_from_background_thread(self):
+        started = []
+
+        def start_writer(target):
+            started.append(target)
+            threading.Thread(target=target, daemon=True).start()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            log_dir = Path(tmp) / "logs"
+            log_file = log_dir / "mcweb_actions.log"
+            log_action = action_logging.make_log_action(
+                ZoneInfo("UTC"), log_dir, log_file, start_writer=start_writer
+            )
+            for index in range(5):
+                log_action("rcon", command=f"say {index}")
+            deadline = time.monotonic() + 5.0
+            text = ""
+            while time.monotonic() < deadline:
+                text = log_file.read_text(encoding="utf-8") if log_file.exists() else ""
+                if text.count("\n") == 5:
+                    break
+                time.sleep(0.01)
+        self.assertEqual(len(started), 1)
+        self.assertEqual([line.split("] ", 1)[1] for line in text.splitlines()], [f"say {i}" for i in range(5)])
+
+    def test_log_writer_survives_lines_with_lone_surrogates(self):
+        threads = []
+
+        def start_writer(target):
+            thread = threading.Thread(target=target, daemon=True)
+            threads.append(thread)
+            thread.start()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            log_dir = Path(tmp) / "logs"
+            log_file = log_dir / "mcweb_actions.log"
+            log_action = action_logging.make_log_action(
+                ZoneInfo("UTC"), log_dir, log_file, start_writer=start_writer
+            )
+            log_action("rcon", command="one")
+            log_action("rcon", command="two \udcff")
+            log_action("rcon", command="three")
+            deadline = time.monotonic() + 5.0
+            text = ""
+            while time.monotonic() < deadline:
+                text = log_file.read_text(encoding="utf-8") if log_file.exists() else ""
+                if text.count("\n") == 3:
+                    break
+                time.sleep(0.01)
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].is_alive())
+        self.assertEqual(
+            [line.split("] ", 1)[1] for line in text.splitlines()],
+            ["one", "two \\udcff", "three"],
+        )
+
+    def test_full_log_queue_drops_lines_in_order_and_reports_the_count(self):
+        targets = []
+        with tempfile.TemporaryDirectory() as tmp:
+            log_dir = Path(tmp) / "logs"
+            log_file = log_dir / "mcweb_actions.log"
+            with patch.object(action_logging, "LOG_WRITER_QUEUE_MAX_LINES", 1), patch.object(
+                action_logging, "LOG_WRITER_QUEUE_FULL_WAIT_SECONDS", 0.01
+            ):
+                log_action = action_logging.make_log_action(
+                    ZoneInfo("UTC"), log_dir, log_file, start_writer=targets.append
+                )
+                for index in range(3):
+                    log_action("rcon", command=f"say {index}")
+            self.assertFalse(log_file.exists())
+            threading.Thread(target=targets[0], daemon=True).start()
+            deadline = time.monotonic() + 5.0
+            text = ""
+            while time.monotonic() < deadline:
+                text = log_file.read_text(encoding="utf-8") if log_file.exists() else ""
+                if text.count("\n") == 2:
+                    break
+                time.sleep(0.01)
+        lines = text.splitlines()
+        self.assertTrue(lines[0].endswith("say 0"))
+        self.assertIn("dropped 2 log lines", lines[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
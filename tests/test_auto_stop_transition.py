@@ -1,9 +1,10 @@
 import threading
+import time
 import unittest
 from types import SimpleNamespace
 from unittest.mock import patch
 
-from app.services import session_watchers, stop_usecase
+from app.services import session_watchers, status_cache, stop_usecase
 
 
 class AutoStopTransitionTests(unittest.TestCase):
@@ -92,7 +93,7 @@ class AutoStopTransitionTests(unittest.TestCase):
             IDLE_ZERO_PLAYERS_SECONDS=300,
             IDLE_CHECK_INTERVAL_ACTIVE_SECONDS=5,
             IDLE_CHECK_INTERVAL_OFF_SECONDS=15,
-            idle_zero_players_since=100.0,
+            idle_deadline_monotonic=400.0,
             idle_lock=threading.Lock(),
             get_status=lambda: "active",
             get_players_online=lambda: "0",
@@ -101,13 +102,105 @@ class AutoStopTransitionTests(unittest.TestCase):
             log_mcweb_exception=lambda *_args, **_kwargs: None,
         )
 
-        with patch("app.services.session_watchers.time.time", side_effect=[401.0]), \
+        with patch("app.services.session_watchers.time.monotonic", side_effect=[401.0]), \
              patch("app.services.session_watchers.time.sleep", side_effect=KeyboardInterrupt):
             with self.assertRaises(KeyboardInterrupt):
                 session_watchers.idle_player_watcher(ctx)
 
         self.assertEqual(events, ["auto_stop"])
-        self.assertEqual(ctx.idle_zero_players_since, 101.0)
+        self.assertEqual(ctx.idle_deadline_monotonic, 401.0)
+
+    def test_idle_countdown_derives_from_monotonic_deadline(self):
+        ctx = SimpleNamespace(
+            IDLE_ZERO_PLAYERS_SECONDS=180,
+            idle_deadline_monotonic=None,
+            idle_lock=threading.Lock(),
+        )
+        self.assertEqual(session_watchers.get_idle_countdown(ctx, "active", "0"), "03:00")
+        ctx.idle_deadline_monotonic = 1000.0
+        with patch("app.services.session_watchers.time.monotonic", return_value=925.0):
+            self.assertEqual(session_watchers.get_idle_countdown(ctx, "active", "0"), "01:15")
+        with patch("app.services.session_watchers.time.monotonic", return_value=1005.0):
+            self.assertEqual(session_watchers.get_idle_countdown(ctx, "active", "0"), "00:00")
+        self.assertEqual(session_watchers.get_idle_countdown(ctx, "active", "2"), "--:--")
+
+    def test_backup_watcher_sleeps_until_next_due_run(self):
+        ctx = SimpleNamespace(
+            backup_state=SimpleNamespace(lock=threading.Lock(), periodic_runs=1),
+            BACKUP_INTERVAL_SECONDS=300,
+            BACKUP_WATCH_INTERVAL_ACTIVE_SECONDS=15,
+            BACKUP_WATCH_INTERVAL_OFF_SECONDS=45,
+        )
+
+        with patch("app.services.session_watchers.time.time", return_value=1570.0):
+            self.assertEqual(session_watchers._backup_watch_wait_seconds(ctx, "active", 1000.0), 30.0)
+            self.assertEqual(session_watchers._backup_watch_wait_seconds(ctx, "active", 1200.0), 60.0)
+            self.assertEqual(session_watchers._backup_watch_wait_seconds(ctx, "active", 900.0), 15.0)
+            self.assertEqual(session_watchers._backup_watch_wait_seconds(ctx, "inactive", 1000.0), 45.0)
+
+    def test_off_watch_waits_back_off_up_to_the_configured_ceiling(self):
+        ctx = SimpleNamespace(
+            BACKUP_WATCH_INTERVAL_ACTIVE_SECONDS=15,
+            BACKUP_WATCH_INTERVAL_OFF_SECONDS=40,
+            BACKUP_WATCH_INTERVAL_MAX_SECONDS=100,
+        )
+
+        waits = [session_watchers._backup_watch_wait_seconds(ctx, "inactive", None, ticks) for ticks in range(4)]
+
+        self.assertEqual(waits, [40.0, 60.0, 90.0, 100.0])
+
+    def test_status_transition_wakes_waiting_watcher(self):
+        ctx = SimpleNamespace(
+            service_status_changed_cond=threading.Condition(),
+            service_status_generation_ref=[0],
+        )
+        seen = session_watchers._status_generation(ctx)
+        notifier = threading.Timer(
+            0.05,
+            status_cache.notify_status_changed,
+            args=(ctx.service_status_changed_cond, ctx.service_status_generation_ref),
+        )
+        notifier.start()
+        started = time.monotonic()
+        session_watchers._wait_for_status_change(ctx, seen, 5.0)
+        notifier.join()
+
+        self.assertLess(time.monotonic() - started, 2.0)
+        self.assertEqual(ctx.service_status_generation_ref, [1])
+
+    def test_status_refresh_notifies_only_when_the_status_changes(self):
+        statuses = iter(["active", "active", "failed"])
+        value_ref = [""]
+        at_ref = [0.0]
+        generation_ref = [0]
+
+        def _refresh():
+            return status_cache.get_status(
+                cache_lock=threading.Lock(),
+                cache_value_ref=value_ref,
+                cache_at_ref=at_ref,
+                service="minecraft",
+                active_ttl_seconds=0.0,
+                off_ttl_seconds=0.0,
+                timeout_seconds=1.0,
+                minecraft_root=None,
+                log_action=lambda *_a, **_k: None,
+                log_exception=lambda *_a, **_k: None,
+                changed_cond=threading.Condition(),
+                generation_ref=generation_ref,
+            )
+
+        with patch.object(
+            status_cache.ports.service_control,
+            "service_is_active",
+            side_effect=lambda *_a, **_k: SimpleNamespace(stdout=next(statuses)),
+        ):
+            self.assertEqual(_refresh(), "active")
+            self.assertEqual(generation_ref, [0])
+            self.assertEqual(_refresh(), "active")
+            self.assertEqual(generation_ref, [0])
+            self.assertEqual(_refresh(), "failed")
+        self.assertEqual(generation_ref, [1])
 
 
 if __name__ == "__main__":
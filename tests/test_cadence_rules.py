@@ -7,6 +7,7 @@ import re
 import pytest
 from flask import Flask
 
+from app.routes import dashboard_file_routes
 from app.routes import dashboard_metrics_routes
 from app.services import dashboard_metrics_runtime as metrics_runtime
 from app.services import log_stream_service
@@ -18,12 +19,13 @@ def _make_log_state(clients=0):
     return {
         "cond": threading.Condition(),
         "seq": 0,
-        "events": [],
+        "event_seqs": [],
+        "event_frames": [],
         "buffered_lines": [],
         "pending_lines": [],
         "pending_bytes": 0,
         "batch_started_at": 0.0,
-        "started": False,
+        "started_event": threading.Event(),
         "lifecycle_lock": threading.Lock(),
         "clients": clients,
         "proc": None,
@@ -89,7 +91,20 @@ def test_publish_log_stream_line_appends_db_with_clients(monkeypatch):
 
     assert calls["append"] == 1
     assert appended["lines"] == ["hello"]
-    assert ctx.log_stream_states["minecraft"]["events"][0][1]["lines"] == ["hello"]
+    assert ctx.log_stream_states["minecraft"]["event_seqs"] == [42]
+    assert ctx.log_stream_states["minecraft"]["event_frames"] == [
+        b'event: batch\ndata: {"source":"minecraft","lines":["hello"]}\n\n'
+    ]
+
+
+def test_stream_events_since_returns_only_the_newer_tail():
+    state = _make_log_state()
+    state["event_seqs"].extend([3, 5, 8])
+    state["event_frames"].extend([b"a", b"b", b"c"])
+
+    assert dashboard_file_routes._stream_events_since(state, 5) == [(8, b"c")]
+    assert dashboard_file_routes._stream_events_since(state, 8) == []
+    assert [seq for seq, _payload in dashboard_file_routes._stream_events_since(state, 0)] == [3, 5, 8]
 
 
 def test_publish_log_stream_line_marks_start_observed_from_startup_log(monkeypatch):
@@ -218,11 +233,61 @@ def test_metrics_stream_refreshes_once_on_connect_then_waits(monkeypatch):
         finally:
             response.close()
 
-    assert "service_status" in first_chunk
+    assert b"service_status" in first_chunk
     assert second_chunk == ": keepalive\n\n"
     assert calls["refresh"] == 1
 
 
+def test_metrics_stream_sends_only_newest_of_backlogged_db_snapshots(monkeypatch):
+    class DummyCond:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def notify_all(self):
+            return None
+
+        def wait_for(self, predicate, timeout=None):
+            return predicate()
+
+    app = Flask(__name__)
+    state = {
+        "APP_STATE_DB_PATH": ":memory:",
+        "metrics_cache_cond": DummyCond(),
+        "metrics_stream_client_count": 0,
+        "metrics_cache_seq": 1,
+        "metrics_cache_payload": {"service_status": "Off"},
+        "METRICS_STREAM_HEARTBEAT_SECONDS": 1.0,
+        "get_cached_dashboard_metrics": lambda: {"service_status": "Off"},
+        "ensure_metrics_collector_started": lambda: None,
+        "_collect_and_publish_metrics": lambda: None,
+    }
+    dashboard_metrics_routes.register_metrics_routes(app, state)
+    backlog = [
+        {"id": event_id, "payload": {"snapshot": {"service_status": status}}}
+        for event_id, status in ((2, "Starting"), (3, "Starting"), (4, "Running"))
+    ]
+    monkeypatch.setattr(dashboard_metrics_routes.state_store_service, "get_latest_event", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(
+        dashboard_metrics_routes.state_store_service,
+        "list_events_since",
+        lambda _db_path, topic, since_id, limit: [row for row in backlog if row["id"] > since_id],
+    )
+
+    with app.test_request_context("/metrics-stream"):
+        response = app.view_functions["metrics_stream"]()
+        try:
+            chunks = [next(response.response) for _ in range(3)]
+        finally:
+            response.close()
+
+    assert chunks[0] == b'data: {"service_status":"Off"}\n\n'
+    assert chunks[1] == b'data: {"service_status":"Running"}\n\n'
+    assert chunks[2] == ": keepalive\n\n"
+
+
 def test_metrics_stream_emits_cache_updates_even_when_db_event_ids_are_ahead(monkeypatch):
     state = {
         "APP_STATE_DB_PATH": ":memory:",
@@ -275,9 +340,9 @@ def test_metrics_stream_emits_cache_updates_even_when_db_event_ids_are_ahead(mon
         finally:
             response.close()
 
-    assert "service_status" in first_chunk
+    assert b"service_status" in first_chunk
     assert second_chunk == ": keepalive\n\n"
-    assert "Running" in third_chunk
+    assert b"Running" in third_chunk
 
 
 def test_metrics_stream_reads_runtime_context_when_state_mapping_is_stale(monkeypatch):
@@ -338,7 +403,74 @@ def test_metrics_stream_reads_runtime_context_when_state_mapping_is_stale(monkey
         finally:
             response.close()
 
-    assert "Running" in first_chunk
+    assert b"Running" in first_chunk
+
+
+def test_metrics_stream_serves_published_json_with_client_nav_attention(monkeypatch):
+    class DummyCond:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def notify_all(self):
+            return None
+
+        def wait_for(self, predicate, timeout=None):
+            return predicate()
+
+    state = {
+        "APP_STATE_DB_PATH": None,
+        "metrics_cache_cond": DummyCond(),
+        "metrics_stream_client_count": 0,
+        "metrics_cache_seq": 4,
+        "metrics_cache_payload": {"service_status": "stale-dict"},
+        "metrics_cache_payload_json": b'{"service_status":"Running"}',
+        "METRICS_STREAM_HEARTBEAT_SECONDS": 1.0,
+        "get_cached_dashboard_metrics": lambda: {},
+        "ensure_metrics_collector_started": lambda: None,
+        "_collect_and_publish_metrics": lambda: None,
+    }
+    app = Flask(__name__)
+    dashboard_metrics_routes.register_metrics_routes(
+        app,
+        state,
+        get_nav_alert_state_from_request=lambda: {"home": "warn"},
+    )
+
+    with app.test_request_context("/metrics-stream"):
+        response = app.view_functions["metrics_stream"]()
+        try:
+            first_chunk = next(response.response)
+        finally:
+            response.close()
+
+    assert first_chunk == b'data: {"service_status":"Running","nav_attention":{"home":"warn"}}\n\n'
+
+
+def test_metrics_route_serves_published_etag_and_304_for_repeat_clients():
+    body = b'{"service_status":"Running"}'
+    state = {
+        "APP_STATE_DB_PATH": None,
+        "metrics_cache_cond": threading.Condition(),
+        "metrics_cache_payload_json": body,
+        "metrics_cache_etag": "abc123",
+        "get_cached_dashboard_metrics_json": lambda: (body, 4),
+        "get_cached_dashboard_metrics": lambda: {},
+    }
+    app = Flask(__name__)
+    dashboard_metrics_routes.register_metrics_routes(app, state)
+    client = app.test_client()
+
+    first = client.get("/metrics")
+    repeat = client.get("/metrics", headers={"If-None-Match": '"abc123"'})
+
+    assert first.status_code == 200
+    assert first.data == body
+    assert first.headers["ETag"] == '"abc123"'
+    assert repeat.status_code == 304
+    assert repeat.data == b""
 
 
 def test_minecraft_log_source_prefers_journal_even_when_latest_file_exists(monkeypatch):
@@ -359,6 +491,14 @@ def test_minecraft_log_source_prefers_journal_even_when_latest_file_exists(monke
     assert settings["type"] == "journal"
 
 
+def test_is_rcon_noise_line_matches_known_rcon_chatter():
+    assert log_stream_service.is_rcon_noise_line("[Thread RCON Client /127.0.0.1 #3/INFO]: started")
+    assert log_stream_service.is_rcon_noise_line("[RCON Client #1/INFO] [minecraft/RconClient]: Thread shutting down")
+    assert log_stream_service.is_rcon_noise_line("Shutting down [minecraft/RconClient] worker")
+    assert not log_stream_service.is_rcon_noise_line("[Server thread/INFO]: Stopping server, shutting down")
+    assert not log_stream_service.is_rcon_noise_line(None)
+
+
 def test_increment_log_stream_clients_notifies_waiters():
     state = _make_log_state(clients=0)
     ctx = SimpleNamespace(
@@ -439,6 +579,9 @@ def test_metrics_collector_waits_for_clients_and_collects_when_active(monkeypatc
         def wait(self, timeout=None):
             return True
 
+        def notify_all(self):
+            return None
+
     active_sequence = iter([False, False, True, True])
 
     def fake_has_active(_ctx):
@@ -532,23 +675,20 @@ def test_ensure_metrics_collector_restarts_when_health_is_not_running(monkeypatc
     def fake_start_worker(_ctx, _spec):
         started["count"] += 1
 
-    monkeypatch.setattr(
-        metrics_runtime,
-        "get_worker_health_snapshot",
-        lambda: {"metrics_collector": {"running": False}},
-    )
+    monkeypatch.setattr(metrics_runtime, "is_worker_running", lambda marker: False)
     monkeypatch.setattr(metrics_runtime, "start_worker", fake_start_worker)
 
     ctx = SimpleNamespace(
-        metrics_collector_started=True,
+        metrics_collector_started_event=threading.Event(),
         metrics_collector_start_lock=threading.Lock(),
         METRICS_COLLECT_INTERVAL_SECONDS=1.0,
     )
+    ctx.metrics_collector_started_event.set()
 
     metrics_runtime.ensure_metrics_collector_started(ctx)
 
     assert started["count"] == 1
-    assert ctx.metrics_collector_started is True
+    assert ctx.metrics_collector_started_event.is_set()
 
 
 def test_ensure_log_stream_fetcher_restarts_when_health_is_not_running(monkeypatch):
@@ -557,15 +697,11 @@ def test_ensure_log_stream_fetcher_restarts_when_health_is_not_running(monkeypat
     def fake_start_worker(_ctx, _spec):
         started["count"] += 1
 
-    monkeypatch.setattr(
-        log_stream_service,
-        "get_worker_health_snapshot",
-        lambda: {"log_stream_fetcher_minecraft": {"running": False}},
-    )
+    monkeypatch.setattr(log_stream_service, "is_worker_running", lambda marker: False)
     monkeypatch.setattr(log_stream_service, "start_worker", fake_start_worker)
 
     state = _make_log_state(clients=0)
-    state["started"] = True
+    state["started_event"].set()
     ctx = SimpleNamespace(
         LOG_SOURCE_KEYS=("minecraft",),
         log_stream_states={"minecraft": state},
@@ -575,7 +711,7 @@ def test_ensure_log_stream_fetcher_restarts_when_health_is_not_running(monkeypat
     log_stream_service.ensure_log_stream_fetcher_started(ctx, "minecraft")
 
     assert started["count"] == 1
-    assert state["started"] is True
+    assert state["started_event"].is_set()
 
 
 def test_start_idle_player_watcher_restarts_when_health_is_not_running(monkeypatch):
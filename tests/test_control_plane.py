@@ -62,6 +62,7 @@ class ControlPlaneTests(unittest.TestCase):
                 run_lock=threading.Lock(),
                 periodic_runs=0,
                 last_error="",
+                error_lock=threading.Lock(),
             ),
             BACKUP_SCRIPT=Path("scripts/backup.sh"),
         )
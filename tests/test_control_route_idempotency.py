@@ -79,7 +79,7 @@ class ControlRouteIdempotencyTests(unittest.TestCase):
             "graceful_stop_minecraft": _next_stop,
             "clear_session_start_time": lambda: None,
             "run_backup_script": _next_backup,
-            "backup_state": SimpleNamespace(lock=threading.Lock(), last_error=""),
+            "backup_state": SimpleNamespace(lock=threading.Lock(), last_error="", error_lock=threading.Lock()),
             "_backup_failed_response": lambda message: (message, 500),
             "start_restore_job": _next_restore,
             "get_restore_status": lambda since_seq="0", job_id=None: {"ok": True, "running": False, "result": {"ok": True, "message": "done"}},
@@ -42,7 +42,11 @@ class ControlRouteStartSemanticsTests(unittest.TestCase):
             "graceful_stop_minecraft": lambda: {"systemd_ok": True, "backup_ok": True},
             "clear_session_start_time": lambda: None,
             "run_backup_script": lambda trigger="manual": True,
-            "backup_state": SimpleNamespace(lock=SimpleNamespace(__enter__=lambda s: None, __exit__=lambda s, *a: None), last_error=""),
+            "backup_state": SimpleNamespace(
+                lock=SimpleNamespace(__enter__=lambda s: None, __exit__=lambda s, *a: None),
+                error_lock=SimpleNamespace(__enter__=lambda s: None, __exit__=lambda s, *a: None),
+                last_error="",
+            ),
             "_backup_failed_response": lambda message: (message, 500),
             "start_restore_job": lambda filename: {"ok": True, "job_id": "j1"},
             "get_restore_status": lambda since_seq="0", job_id=None: {"ok": True, "running": False, "events": []},
@@ -12,22 +12,53 @@ from app.routes.dashboard_file_routes import register_file_routes
 
 
 class SnapshotDownloadRouteTests(unittest.TestCase):
-    def _build_app(self, backup_dir):
+    def _build_app(self, backup_dir, **extra_state):
         app = Flask(__name__)
         app.testing = True
 
         events = []
 
         state = {
+            **extra_state,
             "BACKUP_DIR": Path(backup_dir),
             "validate_sudo_password": lambda password: password == "ok",
             "_password_rejected_response": lambda: ("password incorrect", 403),
             "record_successful_password_ip": lambda: None,
             "log_mcweb_action": lambda action, **kwargs: events.append((action, kwargs)),
+            "_safe_filename_in_dir": lambda base, name: name if (Path(base) / name).is_file() else None,
         }
         register_file_routes(app, state)
         return app, events
 
+    def test_download_backup_streams_file_with_etag(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            backup_dir = Path(tmp) / "backups"
+            backup_dir.mkdir(parents=True)
+            (backup_dir / "world.zip").write_bytes(b"PK-data")
+            app, _ = self._build_app(backup_dir)
+            client = app.test_client()
+
+            first = client.post("/download/backups/world.zip", data={"sudo_password": "ok"})
+            self.assertEqual(first.status_code, 200)
+            self.assertEqual(first.data, b"PK-data")
+            self.assertTrue(first.headers.get("ETag"))
+            self.assertIn("attachment", first.headers.get("Content-Disposition", ""))
+
+    def test_download_backup_uses_accel_redirect_when_configured(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            backup_dir = Path(tmp) / "backups"
+            backup_dir.mkdir(parents=True)
+            (backup_dir / "world 1.zip").write_bytes(b"PK-data")
+            app, _ = self._build_app(backup_dir, BACKUP_DOWNLOAD_ACCEL_PREFIX="/protected-backups/")
+            client = app.test_client()
+
+            response = client.post("/download/backups/world 1.zip", data={"sudo_password": "ok"})
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.headers.get("X-Accel-Redirect"), "/protected-backups/world%201.zip")
+            self.assertIn("attachment", response.headers.get("Content-Disposition", ""))
+            self.assertEqual(response.data, b"")
+
     def test_download_snapshot_success_returns_zip_attachment(self):
         with tempfile.TemporaryDirectory() as tmp:
             backup_dir = Path(tmp) / "backups"
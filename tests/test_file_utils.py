@@ -3,7 +3,8 @@ import unittest
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
-from app.core.filesystem_utils import format_file_size, list_download_files
+from app.core.filesystem_utils import format_file_size, list_download_files, read_recent_file_lines
+from app.core.ring_buffer import Ring
 
 
 class FileUtilsTests(unittest.TestCase):
@@ -20,6 +21,43 @@ class FileUtilsTests(unittest.TestCase):
             names = {item["name"] for item in items}
             self.assertEqual(names, {"a.zip", "b.zip"})
 
+    def test_read_recent_file_lines_keeps_tail(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "app.log"
+            path.write_text("".join(f"line {i}\n" for i in range(10)), encoding="utf-8")
+            self.assertEqual(read_recent_file_lines(path, 3), ["line 7", "line 8", "line 9"])
+            self.assertEqual(read_recent_file_lines(path, 50)[0], "line 0")
+            self.assertEqual(read_recent_file_lines(Path(tmp) / "missing.log", 3), [])
+
+    def test_read_recent_file_lines_picks_up_appends_and_rewrites(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "actions.log"
+            path.write_text("a\nb\n", encoding="utf-8")
+            self.assertEqual(read_recent_file_lines(path, 3), ["a", "b"])
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write("c\nd")
+            self.assertEqual(read_recent_file_lines(path, 3), ["b", "c", "d"])
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write("e\n")
+            self.assertEqual(read_recent_file_lines(path, 3), ["b", "c", "de"])
+            path.write_text("x\n", encoding="utf-8")
+            self.assertEqual(read_recent_file_lines(path, 3), ["x"])
+            path.write_text("rewritten one\nrewritten two\n", encoding="utf-8")
+            self.assertEqual(read_recent_file_lines(path, 3), ["rewritten one", "rewritten two"])
+
+    def test_ring_tail_wraps_in_order(self):
+        ring = Ring(3)
+        self.assertEqual(ring.tail(), [])
+        ring.extend(["a", "b"])
+        self.assertEqual(ring.tail(), ["a", "b"])
+        ring.push("c")
+        ring.push("d")
+        self.assertEqual(len(ring), 3)
+        self.assertEqual(ring.tail(), ["b", "c", "d"])
+        self.assertEqual(ring.tail(2), ["c", "d"])
+        ring.clear()
+        self.assertEqual(ring.tail(), [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,5 @@
+import pytest
+
 from app.infrastructure.adapters import PlatformMetricsAdapter
 
 
@@ -12,3 +14,310 @@ def test_platform_metrics_adapter_keeps_cpu_per_core_as_list(monkeypatch):
     monkeypatch.setattr(adapter, "_metrics", FakeMetrics())
 
     assert adapter.get_cpu_usage_per_core() == ["1.0", "2.0"]
+
+
+def test_linux_service_is_active_uses_dbus_state_when_available(monkeypatch):
+    from app.platform import calls_linux_deb
+
+    loaded = []
+
+    class FakeUnit:
+        def __init__(self, name):
+            loaded.append(name)
+            self.Unit = type("UnitProps", (), {"ActiveState": b"activating"})()
+
+        def load(self):
+            return None
+
+    def _no_subprocess(*_args, **_kwargs):
+        raise AssertionError("systemctl should not be spawned")
+
+    monkeypatch.setattr(calls_linux_deb, "_SystemdUnit", FakeUnit)
+    monkeypatch.setattr(calls_linux_deb, "_dbus_units", {})
+    monkeypatch.setattr(calls_linux_deb.subprocess, "run", _no_subprocess)
+
+    result = calls_linux_deb.service_is_active("minecraft")
+
+    assert loaded == [b"minecraft.service"]
+    assert result.stdout.strip() == "activating"
+    assert result.returncode != 0
+
+
+def test_linux_dbus_unit_is_reused_for_status_and_start(monkeypatch):
+    from app.platform import calls_linux_deb
+
+    loaded = []
+    started = []
+
+    class FakeUnit:
+        def __init__(self, name):
+            loaded.append(name)
+            self.Unit = type(
+                "UnitIface",
+                (),
+                {"ActiveState": b"inactive", "Start": staticmethod(lambda mode: started.append(mode))},
+            )()
+
+        def load(self):
+            return None
+
+    def _no_elevated(*_args, **_kwargs):
+        raise AssertionError("sudo systemctl should not be spawned")
+
+    monkeypatch.setattr(calls_linux_deb, "_SystemdUnit", FakeUnit)
+    monkeypatch.setattr(calls_linux_deb, "_dbus_units", {})
+    monkeypatch.setattr(calls_linux_deb, "_dbus_start_denied", False)
+    monkeypatch.setattr(calls_linux_deb, "run_elevated", _no_elevated)
+
+    assert calls_linux_deb.service_is_active("minecraft").stdout.strip() == "inactive"
+    assert calls_linux_deb.service_is_active("minecraft").stdout.strip() == "inactive"
+    result = calls_linux_deb.service_start_no_block("minecraft")
+
+    assert loaded == [b"minecraft.service"]
+    assert started == [b"replace"]
+    assert result.returncode == 0
+
+
+def test_linux_dbus_start_latches_sudo_only_on_access_denied(monkeypatch):
+    from app.platform import calls_linux_deb
+
+    errors = [RuntimeError("Connection reset by peer"), RuntimeError("org.freedesktop.DBus.Error.AccessDenied")]
+    loaded = []
+    elevated = []
+
+    class FakeUnit:
+        def __init__(self, name):
+            loaded.append(name)
+
+            def _start(_mode):
+                raise errors.pop(0)
+
+            self.Unit = type("UnitIface", (), {"Start": staticmethod(_start)})()
+
+        def load(self):
+            return None
+
+    monkeypatch.setattr(calls_linux_deb, "_SystemdUnit", FakeUnit)
+    monkeypatch.setattr(calls_linux_deb, "_dbus_units", {})
+    monkeypatch.setattr(calls_linux_deb, "_dbus_start_denied", False)
+    monkeypatch.setattr(calls_linux_deb, "run_elevated", lambda cmd, **_kwargs: elevated.append(cmd) or "sudo")
+
+    assert calls_linux_deb.service_start_no_block("minecraft") == "sudo"
+    assert calls_linux_deb._dbus_start_denied is False
+    assert calls_linux_deb._dbus_units == {}
+
+    assert calls_linux_deb.service_start_no_block("minecraft") == "sudo"
+    assert calls_linux_deb._dbus_start_denied is True
+
+    assert calls_linux_deb.service_start_no_block("minecraft") == "sudo"
+    assert len(loaded) == 2
+    assert len(elevated) == 3
+
+
+def test_linux_dbus_start_falls_back_when_the_bus_lock_is_held(monkeypatch):
+    from app.platform import calls_linux_deb
+
+    lock = calls_linux_deb.threading.Lock()
+    lock.acquire()
+    monkeypatch.setattr(calls_linux_deb, "_SystemdUnit", object)
+    monkeypatch.setattr(calls_linux_deb, "_dbus_lock", lock)
+    monkeypatch.setattr(calls_linux_deb, "_dbus_start_denied", False)
+    monkeypatch.setattr(calls_linux_deb, "DBUS_LOCK_WAIT_SECONDS", 0.01)
+    monkeypatch.setattr(calls_linux_deb, "run_elevated", lambda cmd, **_kwargs: "sudo")
+
+    assert calls_linux_deb.service_start_no_block("minecraft") == "sudo"
+    assert calls_linux_deb._dbus_start_denied is False
+
+
+def test_linux_meminfo_lookup_reads_fields_from_raw_bytes():
+    from app.platform import metrics_linux_deb
+
+    data = b"MemTotal:       8000000 kB\nMemFree:         100 kB\nMemAvailable:   2000000 kB"
+
+    assert metrics_linux_deb._meminfo_kb(data, b"MemTotal:") == 8000000
+    assert metrics_linux_deb._meminfo_kb(data, b"MemAvailable:") == 2000000
+    assert metrics_linux_deb._meminfo_kb(data, b"SwapTotal:") == 0
+
+
+def test_linux_cpu_usage_uses_previous_sample_without_sleeping(monkeypatch):
+    from app.platform import metrics_linux_deb
+
+    samples = iter(
+        [
+            [b"cpu 0 0 0 0", b"cpu0 10 0 0 90 0", b"cpu1 0 0 0 100 0"],
+            [b"cpu 0 0 0 0", b"cpu0 60 0 0 140 0", b"cpu1 0 0 0 200 0"],
+        ]
+    )
+    monkeypatch.setattr(metrics_linux_deb, "_prev_cpu_sample", [])
+    monkeypatch.setattr(metrics_linux_deb, "_read_proc_stat", lambda: next(samples))
+
+    assert metrics_linux_deb.get_cpu_usage_per_core() == pytest.approx([10.0, 0.0])
+    assert metrics_linux_deb.get_cpu_usage_per_core() == pytest.approx([50.0, 0.0])
+
+
+def test_log_adapter_decodes_binary_process_lines():
+    from app.infrastructure.adapters import PlatformLogAdapter
+
+    class FakeProcess:
+        stdout = iter([b"first line\r\n", b"bad \xff byte\n", b"tail"])
+
+    lines = list(PlatformLogAdapter().iter_process_lines(FakeProcess()))
+
+    assert lines == ["first line", "bad � byte", "tail"]
+
+
+def test_linux_startup_probe_reads_journal_in_process_when_available(monkeypatch):
+    from app.platform import calls_linux_deb
+
+    entries = [{"MESSAGE": "Done (12.3s)!"}, {"MESSAGE": b"Preparing spawn area"}, {}]
+    matches = []
+
+    class FakeReader:
+        def add_match(self, **kwargs):
+            matches.append(kwargs)
+
+        def seek_tail(self):
+            return None
+
+        def get_previous(self):
+            return entries.pop(0)
+
+        def close(self):
+            return None
+
+    def _no_subprocess(*_args, **_kwargs):
+        raise AssertionError("journalctl should not be spawned")
+
+    monkeypatch.setattr(calls_linux_deb, "_journal", type("FakeJournal", (), {"Reader": FakeReader}))
+    monkeypatch.setattr(calls_linux_deb.subprocess, "run", _no_subprocess)
+
+    output = calls_linux_deb.minecraft_startup_probe_output("minecraft", None)
+
+    assert matches == [{"_SYSTEMD_UNIT": "minecraft.service"}]
+    assert output == "Preparing spawn area\nDone (12.3s)!"
+
+
+def test_linux_cpu_frequency_averages_cpuinfo_in_one_read(monkeypatch):
+    import io
+
+    from app.platform import metrics_linux_deb
+
+    cpuinfo = b"processor\t: 0\ncpu MHz\t\t: 2000.000\n\nprocessor\t: 1\ncpu MHz\t\t: 3000.000\n"
+    opened = []
+
+    def _fake_open(path, mode="r", *args, **kwargs):
+        opened.append(path)
+        return io.BytesIO(cpuinfo)
+
+    monkeypatch.setattr(metrics_linux_deb, "open", _fake_open, raising=False)
+
+    assert metrics_linux_deb.get_cpu_frequency() == "2.50 GHz"
+    assert opened == ["/proc/cpuinfo"]
+
+
+def test_rcon_client_reuses_one_authenticated_connection():
+    import socket
+    import struct
+    import threading
+
+    from app.infrastructure.rcon_client import RconClient
+
+    server = socket.create_server(("127.0.0.1", 0))
+    port = server.getsockname()[1]
+    accepted = []
+
+    def _read_packet(conn):
+        length = struct.unpack("<i", conn.recv(4, socket.MSG_WAITALL))[0]
+        data = conn.recv(length, socket.MSG_WAITALL)
+        request_id, packet_type = struct.unpack_from("<ii", data)
+        return request_id, packet_type, data[8:-2].decode("utf-8")
+
+    def _send_packet(conn, request_id, packet_type, payload):
+        body = payload.encode("utf-8") + b"\x00\x00"
+        conn.sendall(struct.pack("<iii", 8 + len(body), request_id, packet_type) + body)
+
+    def _serve():
+        conn, _addr = server.accept()
+        accepted.append(conn)
+        with conn:
+            request_id, _type, password = _read_packet(conn)
+            _send_packet(conn, request_id if password == "secret" else -1, 2, "")
+            while True:
+                try:
+                    request_id, packet_type, payload = _read_packet(conn)
+                except (struct.error, OSError):
+                    return
+                if packet_type == 2:
+                    _send_packet(conn, request_id, 0, f"ran {payload}")
+                else:
+                    _send_packet(conn, request_id, 0, "Unknown request c8")
+
+    worker = threading.Thread(target=_serve, daemon=True)
+    worker.start()
+    client = RconClient()
+    try:
+        assert client.command("127.0.0.1", port, "secret", "list", timeout=2) == "ran list"
+        assert client.command("127.0.0.1", port, "secret", "forge tps", timeout=2) == "ran forge tps"
+    finally:
+        client.close()
+        server.close()
+        worker.join(timeout=2)
+
+    assert len(accepted) == 1
+
+
+def test_rcon_client_reconnects_when_server_dropped_idle_connection():
+    import socket
+    import struct
+    import threading
+    import time
+
+    from app.infrastructure.rcon_client import RconClient
+
+    server = socket.create_server(("127.0.0.1", 0))
+    port = server.getsockname()[1]
+    commands = []
+
+    def _read_packet(conn):
+        length = struct.unpack("<i", conn.recv(4, socket.MSG_WAITALL))[0]
+        data = conn.recv(length, socket.MSG_WAITALL)
+        request_id, packet_type = struct.unpack_from("<ii", data)
+        return request_id, packet_type, data[8:-2].decode("utf-8")
+
+    def _send_packet(conn, request_id, packet_type, payload):
+        body = payload.encode("utf-8") + b"\x00\x00"
+        conn.sendall(struct.pack("<iii", 8 + len(body), request_id, packet_type) + body)
+
+    def _serve():
+        # The first connection handles one command and is then dropped, as on a server restart.
+        for connection_index in range(2):
+            conn, _addr = server.accept()
+            with conn:
+                request_id, _type, _password = _read_packet(conn)
+                _send_packet(conn, request_id, 2, "")
+                while True:
+                    try:
+                        request_id, packet_type, payload = _read_packet(conn)
+                    except (struct.error, OSError):
+                        break
+                    if packet_type == 2:
+                        commands.append((connection_index, payload))
+                        _send_packet(conn, request_id, 0, f"ran {payload}")
+                    else:
+                        _send_packet(conn, request_id, 0, "Unknown request c8")
+                        if connection_index == 0:
+                            break
+
+    worker = threading.Thread(target=_serve, daemon=True)
+    worker.start()
+    client = RconClient()
+    try:
+        assert client.command("127.0.0.1", port, "secret", "list", timeout=2) == "ran list"
+        time.sleep(0.05)
+        assert client.command("127.0.0.1", port, "secret", "say hi", timeout=2) == "ran say hi"
+    finally:
+        client.close()
+        server.close()
+        worker.join(timeout=2)
+
+    assert commands == [(0, "list"), (1, "say hi")]
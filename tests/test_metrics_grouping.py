@@ -129,3 +129,35 @@ def test_active_clients_bypass_slow_metrics_cache():
     assert snapshot["cpu_per_core"] == ["20.0"]
     assert snapshot["cpu_frequency"] == "new-freq"
     assert calls == {"cpu": 1, "ram": 1, "freq": 1, "storage": 1}
+    assert snapshot["ram_percent"] is None
+
+
+def test_slow_metrics_carry_parsed_percentages():
+    lock = type("DummyLock", (), {"__enter__": lambda self: self, "__exit__": lambda self, exc_type, exc, tb: False})()
+    ctx = SimpleNamespace(
+        slow_metrics_lock=lock,
+        slow_metrics_cache={},
+        slow_metrics_cache_status="",
+        slow_metrics_cache_at=0.0,
+        BACKUP_DIR=Path("."),
+        get_cpu_usage_per_core=lambda: [],
+        get_ram_usage=lambda: "1.00 / 4.00 GB (25.0%)",
+        get_cpu_frequency=lambda: "unknown",
+        get_storage_usage=lambda: "91.0 / 100.0 GB (91.0%)",
+    )
+
+    snapshot = metrics_runtime.get_slow_metrics(ctx, "active", active_clients=True)
+
+    assert snapshot["ram_percent"] == 25.0
+    assert snapshot["storage_percent"] == 91.0
+    assert ctx.slow_metrics_cache["storage_percent"] == 91.0
+
+
+def test_class_from_percent_thresholds():
+    assert metrics_runtime.class_from_percent(0.0) == "stat-green"
+    assert metrics_runtime.class_from_percent(59.9) == "stat-green"
+    assert metrics_runtime.class_from_percent(60.0) == "stat-yellow"
+    assert metrics_runtime.class_from_percent(75.0) == "stat-orange"
+    assert metrics_runtime.class_from_percent(89.9) == "stat-orange"
+    assert metrics_runtime.class_from_percent(90.0) == "stat-red"
+    assert metrics_runtime.class_from_percent(100.0) == "stat-red"
@@ -1,13 +1,27 @@
+import hashlib
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
 import uuid
 from unittest.mock import patch
 
+from flask import Flask, request
+
+from app.core import response_helpers
 from app.core import state_store as state_store_service
+from app.services import backup_usecase as backup_usecase_service
+from app.services import dashboard_metrics_runtime as metrics_runtime_service
 from app.services import dashboard_state_runtime as runtime_service
 from app.services import maintenance_engine as maintenance_engine_service
 from app.services import maintenance_state_store as maintenance_store_service
+from app.services import rcon_probe_service as rcon_probe_service
+from app.services import restore_workflow_helpers as restore_helpers_service
+from app.services import start_usecase as start_usecase_service
+from app.services import status_cache as status_cache_service
+from app.services import worker_scheduler as worker_scheduler_service
 
 
 class PerformanceOptimizationTests(unittest.TestCase):
@@ -266,6 +280,47 @@ class PerformanceOptimizationTests(unittest.TestCase):
             self.assertEqual(result.get("eligible_count"), 0)
             self.assertEqual(result.get("items"), [])
 
+    def test_status_cache_concurrent_misses_share_one_service_query(self):
+        calls = {"count": 0}
+
+        class _Result:
+            stdout = "active\n"
+
+        def _service_is_active(_service, **_kwargs):
+            calls["count"] += 1
+            time.sleep(0.05)
+            return _Result()
+
+        lock = threading.Lock()
+        value_ref = [""]
+        at_ref = [0.0]
+        results = []
+
+        def _read():
+            results.append(
+                status_cache_service.get_status(
+                    cache_lock=lock,
+                    cache_value_ref=value_ref,
+                    cache_at_ref=at_ref,
+                    service="minecraft",
+                    active_ttl_seconds=1.0,
+                    off_ttl_seconds=1.0,
+                    timeout_seconds=1.0,
+                    minecraft_root=None,
+                    log_action=lambda *_a, **_k: None,
+                    log_exception=lambda *_a, **_k: None,
+                )
+            )
+
+        with patch.object(status_cache_service.ports.service_control, "service_is_active", side_effect=_service_is_active):
+            threads = [threading.Thread(target=_read) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(calls["count"], 1)
+        self.assertEqual(results, ["active"] * 5)
+
     def test_operation_batch_update_applies_in_one_call(self):
         db_path = Path("data") / f"test_state_batch_{uuid.uuid4().hex[:10]}.sqlite3"
         state_store_service.create_operation(
@@ -297,6 +352,163 @@ class PerformanceOptimizationTests(unittest.TestCase):
         self.assertEqual(op_a.get("status"), "failed")
         self.assertEqual(op_b.get("status"), "observed")
 
+    def test_backup_scans_count_zip_files_and_snapshot_dirs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            backup_dir = Path(tmp) / "backups"
+            ctx = SimpleNamespace(BACKUP_DIR=backup_dir, AUTO_SNAPSHOT_DIR="")
+            self.assertEqual(runtime_service.get_backups_status(ctx), "missing")
+
+            (backup_dir / "snapshots" / "snap-1").mkdir(parents=True)
+            (backup_dir / "a.zip").write_bytes(b"a")
+            (backup_dir / "b.zip").write_bytes(b"b")
+            (backup_dir / "notes.txt").write_text("x", encoding="utf-8")
+            (backup_dir / "dir.zip").mkdir()
+
+            self.assertEqual(runtime_service.get_backups_status(ctx), "ready (2 zip files)")
+            snapshot = backup_usecase_service.get_backup_zip_snapshot(ctx)
+            self.assertIn(str(backup_dir / "a.zip"), snapshot)
+            self.assertIn(str(backup_dir / "snapshots" / "snap-1"), snapshot)
+            self.assertNotIn(str(backup_dir / "notes.txt"), snapshot)
+
+    def test_rcon_output_parsers_use_precompiled_patterns(self):
+        raw = "\x1b[32m\u00a7aThere are \u00a7e4\u00a7r of a max of 20 players online"
+        self.assertEqual(
+            rcon_probe_service.clean_rcon_output(raw),
+            "There are 4 of a max of 20 players online",
+        )
+        self.assertEqual(rcon_probe_service.parse_players_online(raw), "4")
+        self.assertEqual(rcon_probe_service.parse_players_online("No players online"), "0")
+        self.assertEqual(rcon_probe_service.parse_players_online("Players online: 7"), "7")
+
+    def test_published_metrics_snapshot_is_encoded_once_with_its_sequence(self):
+        ctx = SimpleNamespace(
+            metrics_cache_cond=threading.Condition(),
+            metrics_cache_payload={},
+            metrics_cache_payload_json=b"",
+            metrics_cache_seq=4,
+        )
+        metrics_runtime_service.publish_metrics_snapshot(ctx, {"service_status": "Running", "players": "2"})
+
+        body, seq = metrics_runtime_service.get_cached_dashboard_metrics_json(ctx)
+
+        self.assertEqual(seq, 5)
+        self.assertEqual(body, b'{"service_status":"Running","players":"2"}')
+        self.assertEqual(ctx.metrics_cache_etag, hashlib.blake2b(body, digest_size=8).hexdigest())
+
+    def test_published_metrics_snapshot_is_private_and_swapped_by_reference(self):
+        ctx = SimpleNamespace(
+            metrics_cache_cond=threading.Condition(),
+            metrics_cache_payload={},
+            metrics_cache_payload_json=b"",
+            metrics_cache_seq=0,
+        )
+        snapshot = {"service_status": "Running"}
+        metrics_runtime_service.publish_metrics_snapshot(ctx, snapshot)
+        published = ctx.metrics_cache_payload
+        snapshot["service_status"] = "Off"
+
+        self.assertEqual(published, {"service_status": "Running"})
+        cached = metrics_runtime_service.get_cached_dashboard_metrics(ctx)
+        self.assertEqual(cached, published)
+        self.assertIsNot(cached, published)
+
+    def test_concurrent_metrics_refreshes_share_one_collection(self):
+        ctx = SimpleNamespace(
+            metrics_cache_cond=threading.Condition(),
+            metrics_cache_payload={},
+            metrics_collecting_inflight=False,
+        )
+        calls = {"count": 0}
+        release = threading.Event()
+
+        def _collect(_ctx):
+            calls["count"] += 1
+            release.wait(timeout=2)
+            with ctx.metrics_cache_cond:
+                ctx.metrics_cache_payload = {"service_status": "Running"}
+            return ctx.metrics_cache_payload
+
+        results = []
+        with patch.object(metrics_runtime_service, "collect_and_publish_metrics", side_effect=_collect):
+            workers = [
+                threading.Thread(target=lambda: results.append(metrics_runtime_service.refresh_metrics_snapshot(ctx)))
+                for _ in range(4)
+            ]
+            for worker in workers:
+                worker.start()
+            deadline = time.time() + 2
+            while not ctx.metrics_collecting_inflight and time.time() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.05)
+            release.set()
+            for worker in workers:
+                worker.join(timeout=2)
+
+        self.assertEqual(calls["count"], 1)
+        self.assertEqual(results, [{"service_status": "Running"}] * 4)
+        self.assertFalse(ctx.metrics_collecting_inflight)
+
+    def test_probes_run_concurrently_on_shared_pool(self):
+        barrier = threading.Barrier(2, timeout=2)
+
+        def _probe(value):
+            barrier.wait()
+            return value
+
+        first = worker_scheduler_service.submit_probe(_probe, "players")
+        second = worker_scheduler_service.submit_probe(_probe, "tps")
+
+        self.assertEqual((first.result(timeout=2), second.result(timeout=2)), ("players", "tps"))
+
+    def test_backup_state_flag_is_memoized_briefly(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            state_file = Path(tmp) / "state.txt"
+            state_file.write_text("true\n", encoding="utf-8")
+            ctx = SimpleNamespace(BACKUP_STATE_FILE=state_file, BACKUP_STATE_STALE_SECONDS=1200.0)
+            restore_helpers_service._BACKUP_STATE_MEMO = ("", 0.0, False)
+
+            self.assertTrue(restore_helpers_service.is_backup_running(ctx, include_run_lock=False))
+            state_file.write_text("false\n", encoding="utf-8")
+            self.assertTrue(restore_helpers_service.is_backup_running(ctx, include_run_lock=False))
+            self.assertFalse(restore_helpers_service.is_backup_running(ctx, include_run_lock=False, use_memo=False))
+
+            restore_helpers_service._BACKUP_STATE_MEMO = ("", 0.0, False)
+            self.assertFalse(restore_helpers_service.is_backup_running(ctx, include_run_lock=False))
+
+    def test_session_start_time_is_reparsed_only_when_the_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            session_file = Path(tmp) / "session.txt"
+            session_file.write_text("100.5\n", encoding="utf-8")
+            ctx = SimpleNamespace(session_state=SimpleNamespace(session_file=session_file))
+            start_usecase_service._SESSION_START_MEMO = ("", -1, -1, None)
+
+            self.assertEqual(start_usecase_service.read_session_start_time(ctx), 100.5)
+            with patch.object(Path, "read_text", side_effect=AssertionError("unchanged file was re-read")):
+                self.assertEqual(start_usecase_service.read_session_start_time(ctx), 100.5)
+
+            session_file.write_text("", encoding="utf-8")
+            self.assertIsNone(start_usecase_service.read_session_start_time(ctx))
+
+    def test_session_file_text_is_read_and_created_in_one_open(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            session_file = Path(tmp) / "data" / "session.txt"
+            ctx = SimpleNamespace(session_state=SimpleNamespace(session_file=session_file))
+
+            self.assertEqual(restore_helpers_service.read_session_file_text(ctx), "")
+            self.assertTrue(session_file.exists())
+            session_file.write_text("123.5\n", encoding="utf-8")
+            self.assertEqual(restore_helpers_service.read_session_file_text(ctx), "123.5")
+
+    def test_fixed_rejection_responses_use_preencoded_bodies(self):
+        app = Flask(__name__)
+        with app.test_request_context("/", headers={"X-Requested-With": "XMLHttpRequest"}):
+            response, status = response_helpers.csrf_rejected_response(request)
+            self.assertEqual(status, 403)
+            self.assertEqual(response.mimetype, "application/json")
+            self.assertEqual(response.get_json()["error"], "csrf_invalid")
+            response, status = response_helpers.password_rejected_response(request)
+            self.assertEqual((status, response.get_json()["error"]), (403, "password_incorrect"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,7 @@
+import tempfile
 import threading
 import unittest
+from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
 
@@ -14,16 +16,14 @@ def _build_ctx(intent="starting", status="active"):
         RCON_PORT=25575,
         SERVER_PROPERTIES_CANDIDATES=[],
         rcon_config_lock=threading.Lock(),
-        rcon_last_config_read_at=0.0,
-        rcon_cached_password="secret",
-        rcon_cached_port=25575,
-        rcon_cached_enabled=True,
+        rcon_config_cache=(0.0, "secret", 25575, True),
         rcon_startup_lock=threading.Lock(),
         rcon_startup_ready=False,
         mc_query_lock=threading.Lock(),
         mc_cached_players_online="unknown",
         mc_cached_tick_rate="--",
         mc_last_query_at=0.0,
+        mc_probe_cache=(0.0, "unknown", "unknown"),
         get_status=lambda: status,
         get_service_status_intent=lambda: intent,
         log_mcweb_exception=lambda *_args, **_kwargs: None,
@@ -57,6 +57,67 @@ class RconProbeServiceTests(unittest.TestCase):
         self.assertEqual(tick_rate, "--")
         self.assertFalse(ctx.rcon_startup_ready)
 
+    def test_cached_probe_hit_skips_rcon_and_locks(self):
+        ctx = _build_ctx(intent="")
+        ctx.rcon_startup_ready = True
+        calls = []
+
+        def _run(_ctx, command, timeout=4):
+            calls.append(command)
+            if command == "list":
+                return SimpleNamespace(returncode=0, stdout="There are 3 of a max of 20 players online", stderr="")
+            return SimpleNamespace(returncode=0, stdout="Mean tick time: 40 ms", stderr="")
+
+        with patch.object(rcon_probe_service, "run_mcrcon", side_effect=_run):
+            first = rcon_probe_service.probe_minecraft_runtime_metrics(ctx)
+            ctx.mc_query_lock = None
+            ctx.rcon_startup_lock = None
+            second = rcon_probe_service.probe_minecraft_runtime_metrics(ctx)
+
+        self.assertEqual(first, ("3", "40.0 ms"))
+        self.assertEqual(second, first)
+        self.assertEqual(calls, ["list", "forge tps"])
+
+    def test_probe_uses_caller_status_without_querying_service(self):
+        ctx = _build_ctx(intent="")
+        ctx.get_status = lambda: self.fail("status already known for this tick")
+
+        players_online, tick_rate = rcon_probe_service.probe_minecraft_runtime_metrics(ctx, service_status="inactive")
+
+        self.assertEqual((players_online, tick_rate), ("0", "--"))
+
+    def test_rcon_config_refresh_parses_properties_and_skips_lock_when_fresh(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            props = Path(tmp) / "server.properties"
+            props.write_text(
+                "# Minecraft server properties\nmotd=hello\nrcon.port=25580\n"
+                "enable-rcon=true\nrcon.password=hunter2\n",
+                encoding="utf-8",
+            )
+            ctx = _build_ctx()
+            ctx.SERVER_PROPERTIES_CANDIDATES = [props]
+
+            self.assertEqual(rcon_probe_service.refresh_rcon_config(ctx), ("hunter2", 25580, True))
+
+            # Fresh hits read the published tuple without touching the lock.
+            ctx.rcon_config_lock = None
+            self.assertEqual(ctx.rcon_config_cache[1:], ("hunter2", 25580, True))
+            self.assertTrue(rcon_probe_service.is_rcon_enabled(ctx))
+
+    def test_tick_rate_prefers_ms_then_tps_then_bare_number(self):
+        ctx = _build_ctx()
+        cases = {
+            "Dim 0: Mean tick time: 12.345 ms. Mean TPS: 20.000": "12.3 ms",
+            "Overall TPS: 19,5": "51.3 ms",
+            "TPS 5ms": "5.0 ms",
+            "20": "50.0 ms",
+            "45 players": None,
+        }
+        for output, expected in cases.items():
+            result = SimpleNamespace(returncode=0, stdout=output, stderr="")
+            with patch.object(rcon_probe_service, "run_mcrcon", return_value=result):
+                self.assertEqual(rcon_probe_service.probe_tick_rate(ctx), expected, msg=output)
+
 
 if __name__ == "__main__":
     unittest.main()
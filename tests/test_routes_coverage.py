@@ -32,7 +32,7 @@ def _assert_rule_methods(testcase, app, rule, methods):
 class ControlRoutesCoverageTests(unittest.TestCase):
     def test_control_routes_registered_and_smoke(self):
         app = Flask(__name__)
-        backup_state = SimpleNamespace(lock=threading.Lock(), last_error="")
+        backup_state = SimpleNamespace(lock=threading.Lock(), last_error="", error_lock=threading.Lock())
         intent_state = {"value": ""}
         status_state = {"value": "inactive"}
         state = {
@@ -115,7 +115,7 @@ class ControlRoutesCoverageTests(unittest.TestCase):
 class DebugRoutesCoverageTests(unittest.TestCase):
     def test_debug_routes_registered_and_smoke(self):
         app = Flask(__name__)
-        backup_state = SimpleNamespace(lock=threading.Lock(), last_error="")
+        backup_state = SimpleNamespace(lock=threading.Lock(), last_error="", error_lock=threading.Lock())
         state = {
             "DEBUG_PAGE_VISIBLE": True,
             "DEBUG_ENABLED": True,